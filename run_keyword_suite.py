@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+
+from selenium_demoblaze_framework.utilities.keyword_suite_runner import KeywordSuiteRunner
+
+parser = argparse.ArgumentParser(description="Run every keyword sheet in a directory of workbooks in parallel")
+parser.add_argument("workbook_dir", nargs="?", default="selenium_demoblaze_framework/data",
+                    help="Directory searched (recursively) for .xlsx keyword workbooks")
+parser.add_argument("--browsers", help="Comma-separated browsers, e.g. chrome,edge (default: config.ini)")
+parser.add_argument("--sessions", type=int, help="Browser sessions per browser (default: config.ini)")
+parser.add_argument("--grid-url", help="Selenium Grid hub URL, e.g. http://localhost:4444")
+args = parser.parse_args()
+
+if not os.path.isdir(args.workbook_dir):
+    print(f"ERROR: Workbook directory not found: {args.workbook_dir}")
+    sys.exit(1)
+
+
+def print_step(job, result):
+    status = "PASS" if result['result'] else "FAIL"
+    print(f"[{job.browser}] {os.path.basename(job.workbook)}[{job.sheet}] "
+          f"Step {result['step']} {result['keyword']}: {status}"
+          + ("" if result['result'] else f" - {result['message']}"))
+
+
+runner = KeywordSuiteRunner(
+    args.workbook_dir,
+    browsers=args.browsers.split(",") if args.browsers else None,
+    sessions=args.sessions,
+    grid_url=args.grid_url,
+    on_step=print_step
+)
+
+jobs = runner.discover()
+print("=" * 60)
+print(f"Running {len(jobs)} sheet(s) with {runner.sessions} session(s) per browser"
+      + (f" on Grid {runner.grid_url}" if runner.grid_url else ""))
+print("=" * 60)
+
+sheet_results = runner.run(jobs)
+report_file = KeywordSuiteRunner.generate_report(sheet_results)
+
+failed = [r for r in sheet_results if not r['passed']]
+print("\n" + "=" * 60)
+print(f"{len(sheet_results) - len(failed)}/{len(sheet_results)} sheet(s) passed. Report: {report_file}")
+print("=" * 60)
+sys.exit(1 if failed else 0)
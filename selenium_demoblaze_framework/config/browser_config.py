@@ -6,12 +6,16 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.common.exceptions import WebDriverException
+from selenium_demoblaze_framework.config.driver_resolver import DriverResolver
+from selenium_demoblaze_framework.config.resource_profiles import ResourceProfiles
+from selenium_demoblaze_framework.config.timing_profiles import TimingProfiles
 import configparser
 import os
 
 
 class BrowserConfig:
-    def __init__(self, browser_name=None):
+    def __init__(self, browser_name=None, resource_profile=None, timing_profile=None):
         """Initialize the BrowserConfig class and load config.ini."""
         self.config = configparser.ConfigParser()
         config_path = os.path.join(os.path.dirname(__file__), 'config.ini')
@@ -25,9 +29,21 @@ class BrowserConfig:
                 self.config.get('DEFAULT', 'browser', fallback='chrome')
         ).lower()
 
+        # Request-blocking profile (see ResourceProfiles); validated here so typos fail fast
+        self.resource_profile = (resource_profile or ResourceProfiles.current()).lower()
+        ResourceProfiles.get(self.resource_profile)
+
+        # Page load strategy and timeouts (see TimingProfiles)
+        self.timing = TimingProfiles.get(timing_profile)
+        self.timing_profile = self.timing.name
+
+        lock_file = self.config.get('DRIVER_RESOLVER', 'lock_file', fallback='') or None
+        self.driver_resolver = DriverResolver(lock_file)
+
     def get_chrome_options(self):
         """Configure Chrome options with all possible settings."""
         options = ChromeOptions()
+        options.page_load_strategy = self.timing.page_load_strategy
 
         # Basic options
         if self.config.getboolean('DEFAULT', 'headless_mode'):
@@ -51,6 +67,8 @@ class BrowserConfig:
         options.add_argument('--ignore-certificate-errors')
         options.add_argument('--disable-web-security')
         options.add_argument('--allow-running-insecure-content')
+        for argument in ResourceProfiles.chromium_arguments(self.resource_profile):
+            options.add_argument(argument)
 
         # Experimental options
         prefs = {
@@ -61,6 +79,7 @@ class BrowserConfig:
             'profile.default_content_settings.popups': 0,
             'profile.content_settings.exceptions.automatic_downloads.*.setting': 1
         }
+        prefs.update(ResourceProfiles.chromium_prefs(self.resource_profile))
         options.add_experimental_option('prefs', prefs)
         options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
@@ -73,6 +92,7 @@ class BrowserConfig:
     def get_firefox_options(self):
         """Configure Firefox options."""
         options = FirefoxOptions()
+        options.page_load_strategy = self.timing.page_load_strategy
 
         if self.config.getboolean('DEFAULT', 'headless_mode'):
             options.add_argument('--headless')
@@ -94,11 +114,15 @@ class BrowserConfig:
         options.set_preference("browser.helperApps.neverAsk.saveToDisk",
                                "application/octet-stream,application/pdf,text/csv,application/csv,application/zip")
 
+        # Request blocking: Firefox only supports it through preferences
+        ResourceProfiles.apply_firefox_preferences(options, self.resource_profile)
+
         return options
 
     def get_edge_options(self):
         """Configure Edge options with enhanced settings."""
         options = EdgeOptions()
+        options.page_load_strategy = self.timing.page_load_strategy
 
         # Basic options - using new headless mode for consistency with Chrome
         if self.config.getboolean('DEFAULT', 'headless_mode'):
@@ -128,6 +152,8 @@ class BrowserConfig:
         options.add_argument('--disable-extensions')
         options.add_argument('--disable-popup-blocking')
         options.add_argument('--ignore-certificate-errors')
+        for argument in ResourceProfiles.chromium_arguments(self.resource_profile):
+            options.add_argument(argument)
 
         # Experimental options for Edge
         prefs = {
@@ -138,6 +164,7 @@ class BrowserConfig:
             'profile.default_content_settings.popups': 0,
             'profile.default_content_setting_values.notifications': 2,
         }
+        prefs.update(ResourceProfiles.chromium_prefs(self.resource_profile))
         options.add_experimental_option('prefs', prefs)
         options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
@@ -155,61 +182,68 @@ class BrowserConfig:
         print(f"[BrowserConfig] Initializing {browser_name} driver...")
 
         if browser_name == 'chrome':
-            if os.getenv("GITHUB_ACTIONS"):
-                # Use system-installed ChromeDriver in CI
-                service = ChromeService('/usr/local/bin/chromedriver')
-                driver = webdriver.Chrome(service=service, options=self.get_chrome_options())
-            else:
-                # Use webdriver-manager for local runs
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = ChromeService(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=self.get_chrome_options())
-
+            driver_class, service_class, options = webdriver.Chrome, ChromeService, self.get_chrome_options()
         elif browser_name == 'firefox':
-            if os.getenv("GITHUB_ACTIONS"):
-                # Use Selenium Manager for Firefox in CI
-                service = FirefoxService()
-                driver = webdriver.Firefox(service=service, options=self.get_firefox_options())
-            else:
-                # Use webdriver-manager for local runs
-                from webdriver_manager.firefox import GeckoDriverManager
-                service = FirefoxService(GeckoDriverManager().install())
-                driver = webdriver.Firefox(service=service, options=self.get_firefox_options())
-
+            driver_class, service_class, options = webdriver.Firefox, FirefoxService, self.get_firefox_options()
         elif browser_name == 'edge':
-            if os.getenv("GITHUB_ACTIONS"):
-                # Use system-installed EdgeDriver in CI
-                try:
-                    # Try using msedgedriver from PATH
-                    service = EdgeService('/usr/local/bin/msedgedriver')
-                    driver = webdriver.Edge(service=service, options=self.get_edge_options())
-                    print("[BrowserConfig] Successfully initialized Edge with system driver")
-                except Exception as e:
-                    print(f"[BrowserConfig] Failed with system driver: {e}")
-                    # Fallback to Selenium Manager
-                    service = EdgeService()
-                    driver = webdriver.Edge(service=service, options=self.get_edge_options())
-                    print("[BrowserConfig] Successfully initialized Edge with Selenium Manager")
-            else:
-                # For local Windows execution - check for local driver first
-                edge_driver_path = r"C:\webdrivers\msedgedriver.exe"
-
-                if os.path.exists(edge_driver_path):
-                    # Use the local Edge driver
-                    service = EdgeService(executable_path=edge_driver_path)
-                    driver = webdriver.Edge(service=service, options=self.get_edge_options())
-                else:
-                    # Fallback to webdriver-manager
-                    from webdriver_manager.microsoft import EdgeChromiumDriverManager
-                    service = EdgeService(EdgeChromiumDriverManager().install())
-                    driver = webdriver.Edge(service=service, options=self.get_edge_options())
-
+            driver_class, service_class, options = webdriver.Edge, EdgeService, self.get_edge_options()
         else:
             raise ValueError(f"Browser '{browser_name}' is not supported. Use 'chrome', 'firefox', or 'edge'.")
 
-        # Set global timeouts
-        driver.implicitly_wait(self.config.getint('DEFAULT', 'implicit_wait'))
-        driver.set_page_load_timeout(self.config.getint('DEFAULT', 'page_load_timeout'))
+        # Driver binaries are resolved once per machine and cached in a lock file
+        driver_path = self.driver_resolver.resolve(browser_name, options)
+        try:
+            driver = driver_class(service=service_class(driver_path), options=options)
+        except WebDriverException as e:
+            # Cached binary no longer starts (e.g. browser auto-updated): fall back to the next candidate
+            print(f"[BrowserConfig] Failed with cached {browser_name} driver: {e}")
+            self.driver_resolver.invalidate(browser_name)
+            driver_path = self.driver_resolver.resolve(browser_name, options, exclude=driver_path)
+            driver = driver_class(service=service_class(driver_path), options=options)
+
+        # Set global timeouts from the timing profile
+        self._apply_timing_profile(driver)
+        self._apply_resource_profile(driver, browser_name)
 
         print(f"[BrowserConfig] {browser_name.title()} driver initialized successfully")
-        return driver
\ No newline at end of file
+        return driver
+
+    def get_remote_driver(self, grid_url, browser_name=None):
+        """Get a Selenium Grid session for the browser, configured like a local one."""
+        browser_name = (browser_name or self.browser_name).lower()
+
+        print(f"[BrowserConfig] Requesting {browser_name} session from Grid at {grid_url}...")
+
+        if browser_name == 'chrome':
+            options = self.get_chrome_options()
+        elif browser_name == 'firefox':
+            options = self.get_firefox_options()
+        elif browser_name == 'edge':
+            options = self.get_edge_options()
+        else:
+            raise ValueError(f"Browser '{browser_name}' is not supported. Use 'chrome', 'firefox', or 'edge'.")
+
+        driver = webdriver.Remote(command_executor=grid_url, options=options)
+
+        # Set global timeouts from the timing profile
+        self._apply_timing_profile(driver)
+        self._apply_resource_profile(driver, browser_name)
+
+        print(f"[BrowserConfig] {browser_name.title()} Grid session initialized successfully")
+        return driver
+
+    def _apply_timing_profile(self, driver):
+        """Set the profile's WebDriver timeouts and tag the driver so page objects use the same budget."""
+        driver.implicitly_wait(self.timing.implicit_wait)
+        driver.set_page_load_timeout(self.timing.page_load_timeout)
+        driver.timing_profile = self.timing.name
+
+    def _apply_resource_profile(self, driver, browser_name):
+        """Install the profile's URL blocklist on Chromium sessions (Firefox uses launch prefs)."""
+        if self.resource_profile == ResourceProfiles.NONE or browser_name == 'firefox':
+            return
+        if ResourceProfiles.apply(driver, self.resource_profile):
+            print(f"[BrowserConfig] Resource profile '{self.resource_profile}' active")
+        else:
+            print(f"[BrowserConfig] No CDP on this {browser_name} session, "
+                  f"resource profile '{self.resource_profile}' applied through prefs only")
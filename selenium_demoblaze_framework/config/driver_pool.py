@@ -0,0 +1,305 @@
+# config/driver_pool.py
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium_demoblaze_framework.config.browser_config import BrowserConfig
+import atexit
+import os
+import threading
+import time
+
+
+class _PoolEntry:
+    """A pooled driver and the number of times it has been leased."""
+
+    __slots__ = ('driver', 'leases')
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.leases = 0
+
+
+class DriverPool:
+    """
+    Per-process pool of warm WebDriver sessions.
+
+    Each xdist worker is its own process, so every worker gets its own pools
+    (one per browser, resource profile and timing profile). Drivers are leased
+    to tests, reset on return and recycled after `max_leases` leases or when a
+    health check fails.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, browser_name=None, size=None, max_leases=None, factory=None, resource_profile=None,
+                 timing_profile=None):
+        """Initialize the pool; drivers are launched lazily or by warm_up()."""
+        self.browser_config = BrowserConfig(browser_name, resource_profile, timing_profile)
+        self.browser_name = self.browser_config.browser_name
+        self.resource_profile = self.browser_config.resource_profile
+        self.timing_profile = self.browser_config.timing_profile
+        config = self.browser_config.config
+
+        self.size = size or config.getint('DRIVER_POOL', 'pool_size', fallback=1)
+        self.max_leases = max_leases or config.getint('DRIVER_POOL', 'max_leases', fallback=25)
+        self.lease_timeout = config.getint('DRIVER_POOL', 'lease_timeout', fallback=300)
+        self._factory = factory or (lambda: self.browser_config.get_driver(self.browser_name))
+
+        self._idle = []
+        self._leased = {}
+        self._launching = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @classmethod
+    def for_browser(cls, browser_name=None, resource_profile=None, timing_profile=None):
+        """
+        Return the process-wide pool for a browser, creating and warming it on first use.
+        Sessions with different resource or timing profiles live in separate pools.
+        """
+        browser_config = BrowserConfig(browser_name, resource_profile, timing_profile)
+        key = (browser_config.browser_name, browser_config.resource_profile, browser_config.timing_profile)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            created = pool is None
+            if created:
+                pool = cls(key[0], resource_profile=key[1], timing_profile=key[2])
+                cls._pools[key] = pool
+        # Warm outside the class-wide lock so other pools stay reachable meanwhile; callers of this
+        # pool that arrive early wait in lease() for the drivers warm_up() has already reserved
+        if created:
+            pool.warm_up()
+        return pool
+
+    @classmethod
+    def shutdown_all(cls):
+        """Quit every driver in every pool of this process."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.shutdown()
+
+    def warm_up(self):
+        """Launch drivers in parallel until the pool holds `size` sessions."""
+        with self._condition:
+            missing = self.size - self._total()
+            self._launching += max(missing, 0)
+        if missing <= 0:
+            return
+
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        print(f"[DriverPool] Warming {missing} {self.browser_name} driver(s) for worker {worker_id}...")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            results = list(executor.map(lambda _: self._launch(), range(missing)))
+
+        with self._condition:
+            self._launching -= missing
+            self._idle.extend(entry for entry in results if entry is not None)
+            self._condition.notify_all()
+
+    def lease(self, timeout=None):
+        """Lease a healthy driver, launching one if the pool is not yet full."""
+        deadline = time.monotonic() + (timeout or self.lease_timeout)
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError(f"DriverPool for '{self.browser_name}' has been shut down")
+
+                entry = None
+                if self._idle:
+                    entry = self._idle.pop()
+                    self._leased[id(entry.driver)] = entry  # Still counted while it is checked
+                elif self._total() < self.size:
+                    self._launching += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No {self.browser_name} driver became available "
+                                           f"within {timeout or self.lease_timeout}s")
+                    self._condition.wait(remaining)
+                    continue
+            break
+
+        if entry is not None and not self.is_healthy(entry.driver):
+            print(f"[DriverPool] Discarding unhealthy {self.browser_name} driver")
+            # Hand the slot straight to the replacement so no other lease can take it meanwhile
+            with self._condition:
+                self._leased.pop(id(entry.driver), None)
+                self._launching += 1
+            self._quit(entry)
+            entry = None
+
+        if entry is None:
+            entry = self._launch()
+            with self._condition:
+                self._launching -= 1
+                if entry is not None:
+                    self._leased[id(entry.driver)] = entry
+                self._condition.notify()
+            if entry is None:
+                raise WebDriverException(f"Could not launch a {self.browser_name} driver for the pool")
+
+        with self._condition:
+            entry.leases += 1
+        return entry.driver
+
+    def release(self, driver, discard=False):
+        """Return a leased driver; it is reset for the next test or recycled."""
+        with self._condition:
+            entry = self._leased.get(id(driver))
+        if entry is None:
+            # Not one of ours (or already released) - just make sure it is closed
+            self._quit(_PoolEntry(driver))
+            return
+
+        # The entry stays in _leased (and so in the pool's count) until it is reset or quit
+        recycle = discard or self._closed or entry.leases >= self.max_leases
+        if not recycle:
+            try:
+                self.reset_driver_state(entry.driver)
+            except Exception as e:
+                print(f"[DriverPool] Reset failed, recycling driver: {e}")
+                recycle = True
+        if recycle:
+            self._quit(entry)
+
+        with self._condition:
+            returned = self._leased.pop(id(driver), None) is not None and not recycle and not self._closed
+            if returned:
+                self._idle.append(entry)
+            self._condition.notify()
+        if not returned and not recycle:
+            self._quit(entry)  # The pool was shut down while the driver was being reset
+
+    def shutdown(self):
+        """Quit all idle and leased drivers and refuse further leases."""
+        with self._condition:
+            self._closed = True
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            self._condition.notify_all()
+        for entry in entries:
+            self._quit(entry)
+
+    @staticmethod
+    def is_healthy(driver):
+        """Cheap liveness probe: one round trip to the driver."""
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def reset_driver_state(driver):
+        """Bring a driver back to a blank state: no alerts, one window, no cookies or storage."""
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+
+        # Storage is per origin, so clear it before leaving the current page
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass  # about:blank and data: URLs have no storage
+
+        # Chromium can drop cookies for every domain; elsewhere only the current one
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get('about:blank')
+
+    def _total(self):
+        return len(self._idle) + len(self._leased) + self._launching
+
+    def _launch(self):
+        try:
+            return _PoolEntry(self._factory())
+        except Exception as e:
+            print(f"[DriverPool] Failed to launch {self.browser_name} driver: {e}")
+            return None
+
+    def _quit(self, entry):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass  # Session already gone
+
+
+class DriverLeases:
+    """
+    Drivers held for one fixture scope (function, class, module or session).
+
+    get() leases one driver per pool on first use and hands the same session
+    back afterwards; finish() resets it between tests (DriverPool.reset_driver_state)
+    and, if the reset fails, discards it so the next get() leases a fresh one.
+    release_all() returns everything to the pools when the scope ends.
+    """
+
+    def __init__(self, reset_between_tests=True, pool_for=None):
+        self.reset_between_tests = reset_between_tests
+        self._pool_for = pool_for or DriverPool.for_browser
+        self._leases = {}
+        self._lock = threading.Lock()
+
+    def get(self, browser_name=None):
+        """The driver held for this browser (and the active profiles), leased on first use."""
+        pool = self._pool_for(browser_name)
+        with self._lock:
+            driver = self._leases.get(pool)
+        if driver is not None and not DriverPool.is_healthy(driver):
+            print(f"[DriverLeases] Held {pool.browser_name} driver died, leasing a fresh one")
+            self._drop(pool, discard=True)
+            driver = None
+        if driver is None:
+            driver = pool.lease()
+            with self._lock:
+                self._leases[pool] = driver
+        return driver
+
+    def finish(self, driver):
+        """
+        End a test on a held driver. Returns True if it was reset for the next test,
+        False if it was discarded (reset failed) or resetting is left to the pool.
+        """
+        if not self.reset_between_tests:
+            return False
+        try:
+            DriverPool.reset_driver_state(driver)
+            return True
+        except Exception as e:
+            print(f"[DriverLeases] Reset failed, replacing driver: {e}")
+            with self._lock:
+                pool = next((p for p, held in self._leases.items() if held is driver), None)
+            if pool is not None:
+                self._drop(pool, discard=True)
+            return False
+
+    def release_all(self):
+        """Return every held driver to its pool (which resets or recycles it)."""
+        with self._lock:
+            leases, self._leases = self._leases, {}
+        for pool, driver in leases.items():
+            pool.release(driver)
+
+    def _drop(self, pool, discard=False):
+        with self._lock:
+            driver = self._leases.pop(pool, None)
+        if driver is not None:
+            pool.release(driver, discard=discard)
+
+
+atexit.register(DriverPool.shutdown_all)
@@ -0,0 +1,148 @@
+# config/driver_resolver.py
+from selenium_demoblaze_framework.utilities.file_lock import FileLock
+from datetime import datetime
+import json
+import os
+import re
+import subprocess
+import threading
+
+
+class DriverResolver:
+    """
+    Resolve each browser's driver binary once per machine.
+
+    The first resolution walks the same candidates BrowserConfig used to try on
+    every launch (system path, Selenium Manager, webdriver-manager) and records
+    the winner's path and version in a JSON lock file. Later launches - in this
+    process, in other xdist workers or in later runs - read the lock file instead.
+    """
+
+    DEFAULT_LOCK_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'selenium_demoblaze', 'drivers.lock')
+
+    _memo = {}
+    _memo_lock = threading.Lock()
+
+    def __init__(self, lock_file=None):
+        self.lock_file = lock_file or os.getenv('DRIVER_LOCK_FILE') or self.DEFAULT_LOCK_FILE
+
+    def resolve(self, browser_name, options, exclude=None):
+        """Return the driver path for a browser, resolving and persisting it on first use."""
+        key = self._key(browser_name)
+
+        if exclude is None:
+            with self._memo_lock:
+                cached = self._memo.get(key)
+            if cached and os.path.exists(cached['path']):
+                return cached['path']
+
+        with FileLock(self.lock_file + '.lck'):
+            entries = self._read_entries()
+            entry = entries.get(key)
+
+            # Another worker may have resolved it while we waited for the lock
+            if entry and entry['path'] != exclude and os.path.exists(entry['path']):
+                self._remember(key, entry)
+                return entry['path']
+
+            for source, finder in self._candidates(browser_name, options):
+                try:
+                    path = finder()
+                except Exception as e:
+                    print(f"[DriverResolver] {browser_name} candidate '{source}' failed: {e}")
+                    continue
+                if path and path != exclude and os.path.exists(path):
+                    entry = {
+                        'path': path,
+                        'version': self._driver_version(path),
+                        'source': source,
+                        'resolved_at': datetime.now().isoformat(timespec='seconds')
+                    }
+                    entries[key] = entry
+                    self._write_entries(entries)
+                    self._remember(key, entry)
+                    print(f"[DriverResolver] Resolved {browser_name} driver via {source}: "
+                          f"{path} ({entry['version']})")
+                    return path
+
+        raise RuntimeError(f"Could not resolve a driver binary for '{browser_name}'")
+
+    def invalidate(self, browser_name):
+        """Forget the recorded driver for a browser so the next resolve() starts over."""
+        key = self._key(browser_name)
+        with self._memo_lock:
+            self._memo.pop(key, None)
+        with FileLock(self.lock_file + '.lck'):
+            entries = self._read_entries()
+            if entries.pop(key, None) is not None:
+                self._write_entries(entries)
+
+    def _candidates(self, browser_name, options):
+        """Ordered (source, finder) pairs mirroring the original per-launch fallbacks."""
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+        selenium_manager = ('selenium-manager', lambda: SeleniumManager().driver_location(options))
+
+        if browser_name == 'chrome':
+            if os.getenv("GITHUB_ACTIONS"):
+                return [('system', lambda: '/usr/local/bin/chromedriver'), selenium_manager]
+
+            def webdriver_manager():
+                from webdriver_manager.chrome import ChromeDriverManager
+                return ChromeDriverManager().install()
+            return [('webdriver-manager', webdriver_manager), selenium_manager]
+
+        elif browser_name == 'firefox':
+            if os.getenv("GITHUB_ACTIONS"):
+                return [selenium_manager]
+
+            def webdriver_manager():
+                from webdriver_manager.firefox import GeckoDriverManager
+                return GeckoDriverManager().install()
+            return [('webdriver-manager', webdriver_manager), selenium_manager]
+
+        elif browser_name == 'edge':
+            if os.getenv("GITHUB_ACTIONS"):
+                return [('system', lambda: '/usr/local/bin/msedgedriver'), selenium_manager]
+
+            def webdriver_manager():
+                from webdriver_manager.microsoft import EdgeChromiumDriverManager
+                return EdgeChromiumDriverManager().install()
+            return [('local', lambda: r"C:\webdrivers\msedgedriver.exe"),
+                    ('webdriver-manager', webdriver_manager),
+                    selenium_manager]
+
+        raise ValueError(f"Browser '{browser_name}' is not supported. Use 'chrome', 'firefox', or 'edge'.")
+
+    @staticmethod
+    def _key(browser_name):
+        # CI and local runs use different candidates, so record them separately
+        return f"{browser_name.lower()}:{'ci' if os.getenv('GITHUB_ACTIONS') else 'local'}"
+
+    @classmethod
+    def _remember(cls, key, entry):
+        with cls._memo_lock:
+            cls._memo[key] = entry
+
+    @staticmethod
+    def _driver_version(path):
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=15).stdout
+        except (OSError, subprocess.SubprocessError):
+            return 'unknown'
+        match = re.search(r'\d+(?:\.\d+)+', output)
+        return match.group(0) if match else 'unknown'
+
+    def _read_entries(self):
+        try:
+            with open(self.lock_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_entries(self, entries):
+        os.makedirs(os.path.dirname(self.lock_file) or '.', exist_ok=True)
+        temp_file = f"{self.lock_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(entries, file, indent=4)
+        os.replace(temp_file, self.lock_file)
@@ -0,0 +1,121 @@
+# config/resource_profiles.py
+from selenium.common.exceptions import WebDriverException
+import configparser
+import os
+
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+MEDIA_PATTERNS = ['*.mp4', '*.webm', '*.ogg', '*.ogv', '*.mp3', '*.m3u8', '*.m4s']
+THIRD_PARTY_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*facebook.net*', '*hotjar.com*', '*fonts.googleapis.com*', '*fonts.gstatic.com*'
+]
+
+
+class ResourceProfiles:
+    """
+    Named request-blocking profiles for functional tests.
+
+    Chromium (Chrome/Edge) blocks URL patterns through CDP Network.setBlockedURLs,
+    which can be switched on a running session, plus launch-time prefs. Firefox has
+    no URL blocklist, so its profiles map to preferences (images, fonts, autoplay,
+    tracking protection) applied when the browser starts.
+
+    The active profile comes from the `resource_profile` marker (exported by
+    conftest as RESOURCE_PROFILE), else [RESOURCE_PROFILES] default in config.ini.
+    Extra profiles can be declared there as `name = pattern, pattern, ...`.
+    """
+
+    NONE = 'none'
+
+    PRESETS = {
+        'none': {'block': [], 'images': True, 'fonts': True, 'media': True, 'third_party': True},
+        'no-media': {'block': MEDIA_PATTERNS, 'images': True, 'fonts': True, 'media': False,
+                     'third_party': True},
+        'no-third-party': {'block': THIRD_PARTY_PATTERNS, 'images': True, 'fonts': True, 'media': True,
+                           'third_party': False},
+        'text-only': {'block': IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + THIRD_PARTY_PATTERNS,
+                      'images': False, 'fonts': False, 'media': False, 'third_party': False}
+    }
+
+    ENV_VAR = 'RESOURCE_PROFILE'
+
+    @staticmethod
+    def _config():
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), 'config.ini'))
+        return config
+
+    @classmethod
+    def current(cls):
+        """Name of the active profile: RESOURCE_PROFILE, else the configured default."""
+        return (os.getenv(cls.ENV_VAR)
+                or cls._config().get('RESOURCE_PROFILES', 'default', fallback=cls.NONE)).strip().lower()
+
+    @classmethod
+    def get(cls, name=None):
+        """The profile settings for a name (None = the active profile)."""
+        name = (name or cls.current()).strip().lower()
+        if name in cls.PRESETS:
+            return cls.PRESETS[name]
+
+        config = cls._config()
+        if config.has_section('RESOURCE_PROFILES') and name != 'default' \
+                and name in config.options('RESOURCE_PROFILES') and name not in config.defaults():
+            patterns = [p.strip() for p in config.get('RESOURCE_PROFILES', name).split(',') if p.strip()]
+            return dict(cls.PRESETS[cls.NONE], block=patterns)
+
+        raise ValueError(f"Unknown resource profile: '{name}'. Available: {cls.names()}")
+
+    @classmethod
+    def names(cls):
+        """Built-in presets plus the profiles declared in config.ini."""
+        config = cls._config()
+        custom = []
+        if config.has_section('RESOURCE_PROFILES'):
+            custom = [option for option in config.options('RESOURCE_PROFILES')
+                      if option != 'default' and option not in config.defaults()]
+        return list(cls.PRESETS) + sorted(custom)
+
+    @classmethod
+    def chromium_prefs(cls, name=None):
+        """Launch-time Chrome/Edge prefs for a profile."""
+        profile = cls.get(name)
+        prefs = {}
+        if not profile['images']:
+            prefs['profile.managed_default_content_settings.images'] = 2
+        return prefs
+
+    @classmethod
+    def chromium_arguments(cls, name=None):
+        """Launch-time Chrome/Edge command-line switches for a profile."""
+        profile = cls.get(name)
+        return [] if profile['media'] else ['--autoplay-policy=user-gesture-required']
+
+    @classmethod
+    def apply_firefox_preferences(cls, options, name=None):
+        """Set the Firefox preferences that approximate a profile on FirefoxOptions."""
+        profile = cls.get(name)
+        if not profile['images']:
+            options.set_preference('permissions.default.image', 2)
+        if not profile['fonts']:
+            options.set_preference('gfx.downloadable_fonts.enabled', False)
+        if not profile['media']:
+            options.set_preference('media.autoplay.default', 5)
+        if not profile['third_party']:
+            options.set_preference('privacy.trackingprotection.enabled', True)
+        return options
+
+    @classmethod
+    def apply(cls, driver, name=None):
+        """
+        Switch a running Chromium session to a profile (an empty blocklist for 'none').
+        Returns False when the driver has no CDP (Firefox, Remote) - launch-time prefs only.
+        """
+        patterns = cls.get(name)['block']
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            return True
+        except (AttributeError, WebDriverException):
+            return False
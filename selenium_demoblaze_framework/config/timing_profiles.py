@@ -0,0 +1,98 @@
+# config/timing_profiles.py
+from collections import namedtuple
+import configparser
+import os
+
+# How long a browser session waits: page load strategy, WebDriver timeouts and
+# the explicit-wait budget page objects use
+TimingProfile = namedtuple('TimingProfile', ['name', 'page_load_strategy', 'implicit_wait',
+                                             'page_load_timeout', 'explicit_wait'])
+
+
+class TimingProfiles:
+    """
+    Named timing profiles for browser sessions.
+
+    'resilient' is the historical behaviour: wait for the full load event and
+    stack an implicit wait under every explicit one. 'fast' returns control at
+    DOMContentLoaded (eager), turns implicit waits off so a missing element
+    costs one explicit timeout instead of two, and shortens explicit waits.
+    Each profile can be tuned (or new ones added) in a [TIMING.<name>] section;
+    the active one comes from the `timing_profile` marker (exported by conftest
+    as TIMING_PROFILE), else [TIMING] profile.
+    """
+
+    DEFAULT = 'resilient'
+    ENV_VAR = 'TIMING_PROFILE'
+    SECTION_PREFIX = 'TIMING.'
+    PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
+
+    PRESETS = {
+        'resilient': {'page_load_strategy': 'normal', 'implicit_wait': 10, 'page_load_timeout': 60,
+                      'explicit_wait': 20},
+        'fast': {'page_load_strategy': 'eager', 'implicit_wait': 0, 'page_load_timeout': 30,
+                 'explicit_wait': 10}
+    }
+
+    _parsed = {}
+
+    @classmethod
+    def _config(cls, path=None):
+        # Every page object resolves its profile, so the parsed file is kept until it changes on disk
+        path = os.path.abspath(path or os.path.join(os.path.dirname(__file__), 'config.ini'))
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        cached = cls._parsed.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # [DEFAULT] sets implicit_wait, explicit_wait and page_load_timeout for the rest of the
+        # framework; a [TIMING.<name>] section that leaves one out must keep its preset's value,
+        # so [DEFAULT] is read as an ordinary section here instead of being inherited
+        config = configparser.ConfigParser(default_section='TIMING.__no_defaults__')
+        config.read(path)
+        cls._parsed[path] = (mtime, config)
+        return config
+
+    @classmethod
+    def current(cls):
+        """Name of the active profile: TIMING_PROFILE, else [TIMING] profile."""
+        return (os.getenv(cls.ENV_VAR)
+                or cls._config().get('TIMING', 'profile', fallback=cls.DEFAULT)).strip().lower()
+
+    @classmethod
+    def get(cls, name=None):
+        """The TimingProfile for a name (None = the active profile)."""
+        name = (name or cls.current()).strip().lower()
+        config = cls._config()
+        section = cls.SECTION_PREFIX + name
+        if name not in cls.PRESETS and not config.has_section(section):
+            raise ValueError(f"Unknown timing profile: '{name}'. Available: {cls.names()}")
+
+        values = dict(cls.PRESETS.get(name, cls.PRESETS[cls.DEFAULT]))
+        if config.has_section(section):
+            values['page_load_strategy'] = config.get(section, 'page_load_strategy',
+                                                      fallback=values['page_load_strategy'])
+            for option in ('implicit_wait', 'page_load_timeout', 'explicit_wait'):
+                values[option] = config.getfloat(section, option, fallback=values[option])
+
+        strategy = values['page_load_strategy'].strip().lower()
+        if strategy not in cls.PAGE_LOAD_STRATEGIES:
+            raise ValueError(f"Invalid page_load_strategy '{strategy}' in timing profile '{name}'. "
+                             f"Use one of {list(cls.PAGE_LOAD_STRATEGIES)}")
+        values['page_load_strategy'] = strategy
+        return TimingProfile(name=name, **values)
+
+    @classmethod
+    def names(cls):
+        """Built-in profiles plus the [TIMING.<name>] sections in config.ini."""
+        sections = [section[len(cls.SECTION_PREFIX):].lower() for section in cls._config().sections()
+                    if section.startswith(cls.SECTION_PREFIX)]
+        return sorted(set(cls.PRESETS) | set(sections))
+
+    @classmethod
+    def for_driver(cls, driver):
+        """The profile a driver was launched with (BrowserConfig tags it), else the active one."""
+        return cls.get(getattr(driver, 'timing_profile', None))
@@ -0,0 +1,18 @@
+# create_test_data_parquet.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.arrow_utils import ArrowUtils
+
+# Convert every existing text-format test data file into Parquet next to it
+os.makedirs("data", exist_ok=True)
+
+for source in ["data/test_data.csv", "data/test_data.xlsx", "data/test_data.json", "data/test_data.xml"]:
+    if not os.path.exists(source):
+        print(f"⚠️ Skipping '{source}' (not found - run its create_test_data_* script first)")
+        continue
+    for output_path in ArrowUtils.convert_to_parquet(source):
+        print(f"✅ Parquet file '{output_path}' created from '{source}'.")
@@ -2,6 +2,8 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium_demoblaze_framework.utilities.keyword_plan import LOCATOR_MAP
+from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry
 import time
 
 
@@ -10,6 +12,11 @@ class Keywords:
         self.driver = driver
         self.logger = logger
 
+    @staticmethod
+    def _by(locator_type):
+        """Accept both sheet-style ('css', 'linktext') and By-attribute ('CSS_SELECTOR') locator types."""
+        return LOCATOR_MAP.get(locator_type.lower()) or getattr(By, locator_type.upper())
+
     def navigate_to_url(self, url):
         """Navigate to specified URL"""
         self.driver.get(url)
@@ -19,7 +26,7 @@ class Keywords:
     def click_element(self, locator_type, locator_value):
         """Click on element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             element.click()
             self.logger.info(f"Clicked element: {locator_type}={locator_value}")
             return True
@@ -30,7 +37,7 @@ class Keywords:
     def enter_text(self, locator_type, locator_value, text):
         """Enter text in input field"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             element.clear()
             element.send_keys(text)
             self.logger.info(f"Entered text in {locator_type}={locator_value}: {text}")
@@ -42,7 +49,7 @@ class Keywords:
     def select_dropdown(self, locator_type, locator_value, option_type, option_value):
         """Select dropdown option"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             select = Select(element)
 
             if option_type.lower() == "text":
@@ -61,7 +68,7 @@ class Keywords:
     def verify_element_present(self, locator_type, locator_value):
         """Verify element is present"""
         try:
-            self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            self.driver.find_element(self._by(locator_type), locator_value)
             self.logger.info(f"Element present: {locator_type}={locator_value}")
             return True
         except:
@@ -71,7 +78,7 @@ class Keywords:
     def verify_text(self, locator_type, locator_value, expected_text):
         """Verify text of element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             actual_text = element.text
             result = expected_text in actual_text
             self.logger.info(f"Text verification - Expected: {expected_text}, Actual: {actual_text}, Result: {result}")
@@ -87,7 +94,7 @@ class Keywords:
 
         try:
             WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((getattr(By, locator_type.upper()), locator_value))
+                EC.presence_of_element_located((self._by(locator_type), locator_value))
             )
             self.logger.info(f"Element found after wait: {locator_type}={locator_value}")
             return True
@@ -98,7 +105,7 @@ class Keywords:
     def scroll_to_element(self, locator_type, locator_value):
         """Scroll to element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
             self.logger.info(f"Scrolled to element: {locator_type}={locator_value}")
             return True
@@ -162,7 +169,7 @@ class Keywords:
     def mouse_hover(self, locator_type, locator_value):
         """Mouse hover on element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
             self.logger.info(f"Mouse hovered on: {locator_type}={locator_value}")
@@ -174,7 +181,7 @@ class Keywords:
     def double_click(self, locator_type, locator_value):
         """Double click on element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             actions = ActionChains(self.driver)
             actions.double_click(element).perform()
             self.logger.info(f"Double clicked: {locator_type}={locator_value}")
@@ -186,11 +193,59 @@ class Keywords:
     def right_click(self, locator_type, locator_value):
         """Right click on element"""
         try:
-            element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
+            element = self.driver.find_element(self._by(locator_type), locator_value)
             actions = ActionChains(self.driver)
             actions.context_click(element).perform()
             self.logger.info(f"Right clicked: {locator_type}={locator_value}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to right click: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+# ==================== KEYWORD REGISTRY BINDINGS ====================
+# Expose the Keywords that KeywordEngine has no built-in equivalent for, so test
+# sheets can use them. Each handler has the registry signature (engine, locator, data).
+
+def _locator_keyword(method_name):
+    def handler(engine, locator, data):
+        locator_type, locator_value = engine.parse_locator(locator)
+        if not getattr(Keywords(engine.driver, engine.logger), method_name)(locator_type, locator_value):
+            raise Exception(f"{method_name} failed for {locator}")
+        return True
+    return handler
+
+
+def _select_dropdown(engine, locator, data):
+    """Data is '<text|value|index>=<option>'; a bare option is selected by visible text."""
+    locator_type, locator_value = engine.parse_locator(locator)
+    option_type, option_value = data.split('=', 1) if '=' in data else ('text', data)
+    if not Keywords(engine.driver, engine.logger).select_dropdown(locator_type, locator_value,
+                                                                  option_type.strip(), option_value.strip()):
+        raise Exception(f"select_dropdown failed for {locator}")
+    return True
+
+
+def _switch_to_frame(engine, locator, data):
+    if locator:
+        locator_type, locator_value = engine.parse_locator(locator)
+        frame = engine.driver.find_element(*engine.get_by_locator(locator_type, locator_value))
+    else:
+        frame = int(data) if data.isdigit() else data
+    if not Keywords(engine.driver, engine.logger).switch_to_frame(frame):
+        raise Exception(f"switch_to_frame failed for {locator or data}")
+    return True
+
+
+KeywordRegistry.register('select_dropdown', _select_dropdown, 'select')
+KeywordRegistry.register('scroll_to_element', _locator_keyword('scroll_to_element'), 'scroll_to')
+KeywordRegistry.register('mouse_hover', _locator_keyword('mouse_hover'), 'hover')
+KeywordRegistry.register('double_click', _locator_keyword('double_click'), 'doubleclick')
+KeywordRegistry.register('right_click', _locator_keyword('right_click'), 'rightclick', 'context_click')
+KeywordRegistry.register('switch_to_frame', _switch_to_frame)
+KeywordRegistry.register('switch_to_default_content',
+                         lambda engine, locator, data: Keywords(engine.driver, engine.logger).switch_to_default_content())
+KeywordRegistry.register('refresh_page', lambda engine, locator, data: Keywords(engine.driver, engine.logger).refresh_page(),
+                         'refresh')
+KeywordRegistry.register('get_page_title',
+                         lambda engine, locator, data: Keywords(engine.driver, engine.logger).get_page_title())
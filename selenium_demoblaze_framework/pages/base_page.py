@@ -7,18 +7,145 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import *
 from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.common.by import By
+from selenium_demoblaze_framework.config.timing_profiles import TimingProfiles
 import time
 import os
+import weakref
+
+# ==================== Readiness Hooks ====================
+# Injected into the page to count in-flight XHR/fetch calls and timestamp DOM mutations.
+# Plain statements (no top-level return) so it can also be registered via CDP for new documents.
+READINESS_HOOKS_JS = """
+if (!window.__readiness) {
+    var state = window.__readiness = {pending: 0, lastMutation: Date.now(), lastRequest: Date.now()};
+    var done = function() { state.pending--; state.lastRequest = Date.now(); };
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        state.pending++;
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            state.pending++;
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    new MutationObserver(function() { state.lastMutation = Date.now(); }).observe(
+        document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+"""
+
+_NETWORK_IDLE_JS = READINESS_HOOKS_JS + """
+return document.readyState === 'complete' && window.__readiness.pending === 0;
+"""
+
+_DOM_SETTLED_JS = READINESS_HOOKS_JS + """
+return document.readyState === 'complete' && Date.now() - window.__readiness.lastMutation >= arguments[0];
+"""
+
+_FIND_ELEMENTS_JS = """
+var kind = arguments[0], value = arguments[1];
+if (kind === 'xpath') {
+    var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+} else {
+    var nodes = Array.prototype.slice.call(document.querySelectorAll(value));
+}
+"""
+
+_ELEMENT_COUNT_JS = _FIND_ELEMENTS_JS + """
+return nodes.length;
+"""
+
+_MODAL_SHOWN_JS = _FIND_ELEMENTS_JS + """
+var el = nodes[0];
+if (!el) { return false; }
+var style = window.getComputedStyle(el);
+return style.display !== 'none' && style.visibility !== 'hidden'
+    && parseFloat(style.opacity) === 1 && el.getBoundingClientRect().height > 0;
+"""
+
+_ELEMENT_HAS_TEXT_JS = _FIND_ELEMENTS_JS + """
+return nodes.length > 0 && (nodes[0].innerText || nodes[0].textContent || '').trim().length > 0;
+"""
+
+# Drivers that already inject the hooks into every new document (Chromium only)
+_HOOKED_DRIVERS = weakref.WeakSet()
+
+
+def _locator_to_js(locator):
+    """Translate a (By, value) locator into an ('xpath' | 'css', expression) pair for in-page lookups."""
+    by, value = locator
+    if by == By.XPATH:
+        return 'xpath', value
+    if by == By.CSS_SELECTOR:
+        return 'css', value
+    if by == By.ID:
+        return 'css', f'[id="{value}"]'
+    if by == By.NAME:
+        return 'css', f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return 'css', f'.{value}'
+    if by == By.TAG_NAME:
+        return 'css', value
+    if by == By.LINK_TEXT:
+        return 'xpath', f'//a[normalize-space(.)="{value}"]'
+    if by == By.PARTIAL_LINK_TEXT:
+        return 'xpath', f'//a[contains(., "{value}")]'
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+def network_idle():
+    """No XHR/fetch request is in flight and the document has finished loading."""
+    return lambda driver: driver.execute_script(_NETWORK_IDLE_JS)
+
+
+def dom_settled(quiet_ms=300):
+    """The DOM has not mutated for `quiet_ms` milliseconds."""
+    return lambda driver: driver.execute_script(_DOM_SETTLED_JS, quiet_ms)
+
+
+def element_count_changed(locator, previous_count):
+    """The number of elements matching `locator` differs from `previous_count`."""
+    kind, value = _locator_to_js(locator)
+    return lambda driver: driver.execute_script(_ELEMENT_COUNT_JS, kind, value) != previous_count
+
+
+def modal_shown(locator):
+    """The modal is displayed and its fade-in transition has finished."""
+    kind, value = _locator_to_js(locator)
+    return lambda driver: driver.execute_script(_MODAL_SHOWN_JS, kind, value)
+
+
+def element_has_text(locator):
+    """The element exists and has non-empty rendered text (e.g. filled in by AJAX)."""
+    kind, value = _locator_to_js(locator)
+    return lambda driver: driver.execute_script(_ELEMENT_HAS_TEXT_JS, kind, value)
 
 
 class BasePage:
+    # Named readiness conditions usable with wait_until_ready()
+    READINESS_CONDITIONS = {
+        'network_idle': network_idle,
+        'dom_settled': dom_settled,
+        'element_count_changed': element_count_changed,
+        'modal_shown': modal_shown,
+        'element_has_text': element_has_text,
+    }
+
     def __init__(self, driver, logger):
         """Initialize BasePage with WebDriver and logger."""
         self.driver = driver
         self.logger = logger
+        # Explicit-wait budget of the driver's timing profile (20s for 'resilient')
+        self.timeout = TimingProfiles.for_driver(driver).explicit_wait
         self.wait = WebDriverWait(
             driver,
-            20,
+            self.timeout,
             poll_frequency=0.5,
             ignored_exceptions=[
                 NoSuchElementException,
@@ -27,25 +154,29 @@ class BasePage:
             ]
         )
 
-    def find_element(self, locator, timeout=20):
+    def _timeout(self, timeout):
+        """An explicit timeout, or the timing profile's budget when None."""
+        return self.timeout if timeout is None else timeout
+
+    def find_element(self, locator, timeout=None):
         """Find a single element with explicit wait."""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = WebDriverWait(self.driver, self._timeout(timeout)).until(
                 EC.presence_of_element_located(locator)
             )
-            self.logger.info(f"Found element: {locator}")
+            self.logger.debug("Found element: %s", locator)
             return element
         except TimeoutException:
             self.logger.error(f"Element not found: {locator}")
             raise
 
-    def find_elements(self, locator, timeout=20):
+    def find_elements(self, locator, timeout=None):
         """Find multiple elements with explicit wait."""
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
+            elements = WebDriverWait(self.driver, self._timeout(timeout)).until(
                 EC.presence_of_all_elements_located(locator)
             )
-            self.logger.info(f"Found {len(elements)} elements: {locator}")
+            self.logger.debug("Found %d elements: %s", len(elements), locator)
             return elements
         except TimeoutException:
             self.logger.error(f"Elements not found: {locator}")
@@ -54,7 +185,7 @@ class BasePage:
     def click(self, locator):
         """Click an element, with fallback to JavaScript click if needed."""
         try:
-            element = WebDriverWait(self.driver, 20).until(
+            element = WebDriverWait(self.driver, self.timeout).until(
                 EC.element_to_be_clickable(locator)
             )
             element.click()
@@ -177,27 +308,53 @@ class BasePage:
         element = self.find_element(locator)
         return element.is_selected()
 
-    def wait_for_element_visible(self, locator, timeout=20):
+    def wait_for_element_visible(self, locator, timeout=None):
         """Wait until an element is visible."""
-        WebDriverWait(self.driver, timeout).until(
+        WebDriverWait(self.driver, self._timeout(timeout)).until(
             EC.visibility_of_element_located(locator)
         )
         self.logger.info(f"Element is visible: {locator}")
 
-    def wait_for_element_invisible(self, locator, timeout=20):
+    def wait_for_element_invisible(self, locator, timeout=None):
         """Wait until an element is no longer visible."""
-        WebDriverWait(self.driver, timeout).until(
+        WebDriverWait(self.driver, self._timeout(timeout)).until(
             EC.invisibility_of_element_located(locator)
         )
         self.logger.info(f"Element is invisible: {locator}")
 
-    def wait_for_text_present(self, locator, text, timeout=20):
+    def wait_for_text_present(self, locator, text, timeout=None):
         """Wait until specific text appears inside an element."""
-        WebDriverWait(self.driver, timeout).until(
+        WebDriverWait(self.driver, self._timeout(timeout)).until(
             EC.text_to_be_present_in_element(locator, text)
         )
         self.logger.info(f"Text '{text}' is present in element: {locator}")
 
+    def install_readiness_hooks(self):
+        """Start tracking XHR/fetch calls and DOM mutations (in every new document too, on Chromium)."""
+        if self.driver not in _HOOKED_DRIVERS:
+            try:
+                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': READINESS_HOOKS_JS})
+            except (AttributeError, WebDriverException):
+                pass  # Non-Chromium: hooks are injected into the current document only
+            _HOOKED_DRIVERS.add(self.driver)
+        self.driver.execute_script(READINESS_HOOKS_JS)
+
+    def wait_until_ready(self, condition_name, timeout=None, **kwargs):
+        """Wait for a named readiness condition (see READINESS_CONDITIONS) instead of sleeping."""
+        condition = self.READINESS_CONDITIONS[condition_name](**kwargs)
+        WebDriverWait(self.driver, self._timeout(timeout), poll_frequency=0.1).until(condition)
+        self.logger.info(f"Readiness condition met: {condition_name}")
+
+    def wait_for_page_ready(self, timeout=None, quiet_ms=300):
+        """Wait until pending AJAX calls are done and the DOM has stopped changing."""
+        self.wait_until_ready('network_idle', timeout=timeout)
+        self.wait_until_ready('dom_settled', timeout=timeout, quiet_ms=quiet_ms)
+
+    def count_elements(self, locator):
+        """Count matching elements in one script call (no implicit wait on zero matches)."""
+        kind, value = _locator_to_js(locator)
+        return self.driver.execute_script(_ELEMENT_COUNT_JS, kind, value)
+
     def select_dropdown_by_value(self, locator, value):
         """Select a dropdown option by its 'value' attribute."""
         element = self.find_element(locator)
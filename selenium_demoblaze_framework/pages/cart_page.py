@@ -2,7 +2,6 @@
 
 from selenium.webdriver.common.by import By
 from selenium_demoblaze_framework.pages.base_page import BasePage
-import time
 
 
 class CartPage(BasePage):
@@ -13,6 +12,7 @@ class CartPage(BasePage):
     DELETE_ITEM_BTN = (By.XPATH, "//a[contains(text(),'Delete')]")
 
     # ==================== Order Form (in Modal) ====================
+    ORDER_MODAL = (By.ID, "orderModal")
     ORDER_NAME = (By.ID, "name")
     ORDER_COUNTRY = (By.ID, "country")
     ORDER_CITY = (By.ID, "city")
@@ -23,6 +23,7 @@ class CartPage(BasePage):
     CLOSE_ORDER_BTN = (By.XPATH, "//div[@id='orderModal']//button[contains(text(),'Close')]")
 
     # ==================== Purchase Confirmation ====================
+    CONFIRMATION_DIALOG = (By.XPATH, "//div[contains(@class, 'sweet-alert')]")
     CONFIRMATION_OK_BTN = (By.XPATH, "//button[contains(text(),'OK')]")
     CONFIRMATION_TEXT = (By.XPATH, "//div[contains(@class, 'sweet-alert')]//h2[contains(text(), 'Thank you for your purchase!')]")
 
@@ -46,8 +47,12 @@ class CartPage(BasePage):
         """Delete an item from the cart by index (0-based)."""
         delete_buttons = self.find_elements(self.DELETE_ITEM_BTN)
         if delete_buttons and 0 <= index < len(delete_buttons):
+            previous_count = self.count_elements(self.CART_ITEMS)
+            self.install_readiness_hooks()
             delete_buttons[index].click()
-            time.sleep(2)  # Allow DOM to update
+            # The cart is re-fetched and re-rendered row by row after the delete call
+            self.wait_until_ready('element_count_changed', locator=self.CART_ITEMS, previous_count=previous_count)
+            self.wait_for_page_ready()
             self.logger.info(f"Deleted cart item at index {index}")
         else:
             self.logger.warning(f"No delete button found at index {index}")
@@ -55,7 +60,7 @@ class CartPage(BasePage):
     def place_order(self):
         """Click the 'Place Order' button to open the order modal."""
         self.click(self.PLACE_ORDER_BTN)
-        time.sleep(1)
+        self.wait_until_ready('modal_shown', locator=self.ORDER_MODAL)
         self.logger.info("Clicked 'Place Order'")
 
     def fill_order_form(self, name, country, city, card, month, year):
@@ -71,7 +76,7 @@ class CartPage(BasePage):
     def complete_purchase(self):
         """Click 'Purchase' to submit the order."""
         self.click(self.PURCHASE_BTN)
-        time.sleep(2)  # Wait for confirmation modal
+        self.wait_until_ready('modal_shown', locator=self.CONFIRMATION_DIALOG)
         self.logger.info("Completed purchase")
 
     def get_confirmation_text(self):
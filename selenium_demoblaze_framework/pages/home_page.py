@@ -1,8 +1,9 @@
 # pages/home_page.py
 from selenium.common import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium_demoblaze_framework.pages.base_page import BasePage
-import time
 
 
 class HomePage(BasePage):
@@ -35,9 +36,50 @@ class HomePage(BasePage):
     PRODUCT_PRICES = (By.XPATH, "//div[@class='card-block']//h5")
     PRODUCT_DESCRIPTIONS = (By.ID, "article")
 
+    # One round trip for the whole grid instead of several driver calls per card.
+    # Returns null while the grid is still loading. An empty grid only counts once the
+    # readiness hooks have seen no AJAX call and no DOM change for arguments[0] ms,
+    # since #tbodyid is static and fills after the page itself has loaded.
+    PRODUCT_GRID_JS = """
+    var cards = Array.prototype.filter.call(document.getElementsByClassName('card'), function(card) {
+        return card.querySelector('.card-title') && card.querySelector('h5');
+    });
+    if (!cards.length) {
+        var state = window.__readiness;
+        var settled = !!state && state.pending === 0 && !!document.getElementById('tbodyid')
+            && document.readyState === 'complete'
+            && Date.now() - Math.max(state.lastMutation, state.lastRequest || 0) >= arguments[0];
+        if (!settled) { return null; }
+    }
+    return {products: cards.map(function(card) {
+        var link = card.querySelector('.card-title a') || card.querySelector('a');
+        var image = card.querySelector('img');
+        return {
+            title: card.querySelector('.card-title').innerText.trim(),
+            price: card.querySelector('h5').innerText.trim().replace('$', ''),
+            link: link ? link.href : '',
+            image: image ? image.src : ''
+        };
+    })};
+    """
+    EMPTY_GRID_QUIET_MS = 1000
+
     # ==================== Pagination ====================
     NEXT_BUTTON = (By.ID, "next2")
     PREVIOUS_BUTTON = (By.ID, "prev2")
+    NEXT_VISIBLE_JS = """
+    var button = document.getElementById('next2');
+    return !!button && window.getComputedStyle(button).display !== 'none';
+    """
+
+    # ==================== Product Detail (navigation target) ====================
+    PRODUCT_DETAIL_NAME = (By.XPATH, "//h2[@class='name']")
+
+    # ==================== Modals ====================
+    CONTACT_MODAL = (By.ID, "exampleModal")
+    ABOUT_MODAL = (By.ID, "videoModal")
+    LOGIN_MODAL = (By.ID, "logInModal")
+    SIGNUP_MODAL = (By.ID, "signInModal")
 
     # ==================== Contact Modal ====================
     CONTACT_EMAIL = (By.ID, "recipient-email")
@@ -75,6 +117,7 @@ class HomePage(BasePage):
     def select_category(self, category_name):
         """Select product category: 'Phones', 'Laptops', or 'Monitors'."""
         category_name = category_name.lower()
+        self.install_readiness_hooks()
         if category_name == "phones":
             self.click(self.PHONES_CATEGORY)
         elif category_name == "laptops":
@@ -83,11 +126,27 @@ class HomePage(BasePage):
             self.click(self.MONITORS_CATEGORY)
         else:
             raise ValueError(f"Unsupported category: {category_name}")
-        time.sleep(2)  # Wait for products to load (AJAX)
+        self.wait_for_page_ready()  # Products are re-rendered after the AJAX call
         self.logger.info(f"Selected category: {category_name}")
 
-    def get_all_products(self):
-        """Get all products visible on the current page."""
+    def get_all_products(self, bulk=True):
+        """
+        Get all products visible on the current page.
+        bulk=True extracts every card (title, price, link, image) in a single script
+        round trip; bulk=False reads each card element by element.
+        """
+        if bulk:
+            self.install_readiness_hooks()
+            try:
+                products = WebDriverWait(self.driver, self.timeout, poll_frequency=0.2).until(
+                    lambda driver: driver.execute_script(self.PRODUCT_GRID_JS, self.EMPTY_GRID_QUIET_MS)
+                )['products']
+            except TimeoutException:
+                self.logger.error(f"Elements not found: {self.PRODUCT_CARDS}")
+                products = []
+            self.logger.info(f"Found {len(products)} products")
+            return products
+
         products = []
         product_cards = self.find_elements(self.PRODUCT_CARDS)
 
@@ -105,12 +164,32 @@ class HomePage(BasePage):
         self.logger.info(f"Found {len(products)} products")
         return products
 
+    def iter_all_products(self, max_pages=50):
+        """
+        Yield products page by page, following 'Next' until the catalogue is exhausted
+        (the button is hidden on the last page, or a page brings no unseen products).
+        """
+        seen_links = set()
+        for _ in range(max_pages):
+            new_products = [p for p in self.get_all_products() if p['link'] not in seen_links]
+            if not new_products:
+                return
+
+            for product in new_products:
+                seen_links.add(product['link'])
+                yield product
+
+            if not self.driver.execute_script(self.NEXT_VISIBLE_JS):
+                return
+            self.go_to_next_page()
+
     def click_product(self, product_name):
         """Click on a specific product by its visible name."""
         # Use a more robust XPath that matches partial text
         product_xpath = (By.XPATH, f"//a[contains(text(), '{product_name}')]")
         self.click(product_xpath)
-        time.sleep(2)  # Wait for product detail page to load
+        # Product details are filled in by AJAX after prod.html loads
+        self.wait_until_ready('element_has_text', locator=self.PRODUCT_DETAIL_NAME)
         self.logger.info(f"Clicked on product: {product_name}")
 
     def navigate_carousel(self, direction="next"):
@@ -125,20 +204,22 @@ class HomePage(BasePage):
 
     def go_to_next_page(self):
         """Go to the next page of products (pagination)."""
+        self.install_readiness_hooks()
         self.click(self.NEXT_BUTTON)
-        time.sleep(2)
+        self.wait_for_page_ready()
         self.logger.info("Navigated to next page")
 
     def go_to_previous_page(self):
         """Go to the previous page of products (pagination)."""
+        self.install_readiness_hooks()
         self.click(self.PREVIOUS_BUTTON)
-        time.sleep(2)
+        self.wait_for_page_ready()
         self.logger.info("Navigated to previous page")
 
     def open_contact_modal(self):
         """Open the Contact modal."""
         self.click(self.CONTACT_MENU)
-        time.sleep(1)
+        self.wait_until_ready('modal_shown', locator=self.CONTACT_MODAL)
         self.logger.info("Opened contact modal")
 
     def fill_contact_form(self, email, name, message):
@@ -156,7 +237,7 @@ class HomePage(BasePage):
     def open_about_modal(self):
         """Open the 'About Us' modal."""
         self.click(self.ABOUT_US_MENU)
-        time.sleep(1)
+        self.wait_until_ready('modal_shown', locator=self.ABOUT_MODAL)
         self.logger.info("Opened About Us modal")
 
     def play_video(self):
@@ -172,7 +253,7 @@ class HomePage(BasePage):
     def open_login_modal(self):
         """Open the Login modal."""
         self.click(self.LOGIN_MENU)
-        time.sleep(1)
+        self.wait_until_ready('modal_shown', locator=self.LOGIN_MODAL)
         self.logger.info("Opened login modal")
 
     def login(self, username, password):
@@ -185,7 +266,7 @@ class HomePage(BasePage):
     def open_signup_modal(self):
         """Open the Sign Up modal."""
         self.click(self.SIGNUP_MENU)
-        time.sleep(1)
+        self.wait_until_ready('modal_shown', locator=self.SIGNUP_MODAL)
         self.logger.info("Opened signup modal")
 
     def signup(self, username, password):
@@ -224,6 +305,8 @@ class HomePage(BasePage):
 
     def go_to_cart(self):
         """Navigate to the shopping cart page."""
+        self.install_readiness_hooks()
         self.click(self.CART_MENU)
-        time.sleep(2)
+        WebDriverWait(self.driver, self.timeout).until(EC.url_contains("cart.html"))
+        self.wait_for_page_ready()  # Cart rows are loaded by AJAX
         self.logger.info("Navigated to cart")
\ No newline at end of file
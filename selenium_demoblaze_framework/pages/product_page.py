@@ -2,7 +2,6 @@
 
 from selenium.webdriver.common.by import By
 from selenium_demoblaze_framework.pages.base_page import BasePage
-import time
 
 
 class ProductPage(BasePage):
@@ -38,6 +37,7 @@ class ProductPage(BasePage):
 
     def add_to_cart(self):
         """Click 'Add to cart' button and handle alert."""
+        self.install_readiness_hooks()
         self.click(self.ADD_TO_CART_BTN)
         # Wait for success alert and accept it
         alert_text = self.accept_alert(timeout=5)
@@ -45,7 +45,7 @@ class ProductPage(BasePage):
             self.logger.info(f"Product added to cart. Alert: {alert_text}")
         else:
             self.logger.warning("No alert appeared after adding to cart.")
-        time.sleep(2)  # Allow UI to update
+        self.wait_until_ready('network_idle')  # The addtocart call must finish before leaving the page
         self.logger.info("Completed 'Add to cart' action")
         return alert_text
 
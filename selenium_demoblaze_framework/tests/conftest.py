@@ -5,13 +5,19 @@ Pytest configuration file for handling browser parameters, fixtures, and Allure
 import pytest
 import allure
 from allure_commons.types import AttachmentType
+import configparser
 import os
-from datetime import datetime
-import threading
-
-# Thread-safe screenshot counter
-screenshot_lock = threading.Lock()
-screenshot_counter = {}
+from selenium_demoblaze_framework.config.driver_pool import DriverLeases, DriverPool
+from selenium_demoblaze_framework.config.resource_profiles import ResourceProfiles
+from selenium_demoblaze_framework.config.timing_profiles import TimingProfiles
+from selenium_demoblaze_framework.pages.cart_page import CartPage
+from selenium_demoblaze_framework.pages.home_page import HomePage
+from selenium_demoblaze_framework.pages.login_page import LoginPage
+from selenium_demoblaze_framework.pages.product_page import ProductPage
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+from selenium_demoblaze_framework.utilities.demoblaze_api import DemoBlazeApi
+from selenium_demoblaze_framework.utilities.screenshot_service import ScreenshotService
+from selenium_demoblaze_framework.utilities.session_cache import SessionCache
 
 
 def pytest_addoption(parser):
@@ -22,6 +28,13 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to run tests: chrome, edge, firefox, or all"
     )
+    parser.addoption(
+        "--driver-scope",
+        action="store",
+        default=None,
+        choices=("function", "class", "module", "session"),
+        help="How long the shared `driver` fixture keeps a browser (default: [DRIVER_POOL] fixture_scope)"
+    )
 
 
 def pytest_generate_tests(metafunc):
@@ -73,6 +86,141 @@ def get_browser_name(request):
     return request.config.getoption("--browser")
 
 
+@pytest.fixture
+def isolated_workdir(tmp_path, monkeypatch):
+    """
+    Run a unit test inside tmp_path. Default log, screenshot and cache locations
+    resolve under the working directory, so nothing lands in the checkout.
+    """
+    log_dir = os.path.dirname(CustomLogger.log_file()) if CustomLogger.log_file() else os.path.join(os.getcwd(), 'logs')
+    monkeypatch.chdir(tmp_path)
+    CustomLogger.configure(log_dir=str(tmp_path / 'logs'))
+    yield tmp_path
+    ScreenshotService.shutdown_all()
+    CustomLogger.configure(log_dir=log_dir)
+
+
+# ==================== SHARED DRIVER FIXTURES ====================
+
+_config = configparser.ConfigParser()
+_config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+
+def _driver_scope(fixture_name, config):
+    """Scope of the shared driver: --driver-scope, else [DRIVER_POOL] fixture_scope."""
+    return (config.getoption("--driver-scope")
+            or _config.get('DRIVER_POOL', 'fixture_scope', fallback='session'))
+
+
+@pytest.fixture(scope=_driver_scope)
+def driver_leases(request):
+    """Pooled drivers held for the configured scope, reset between tests instead of relaunched."""
+    leases = DriverLeases(reset_between_tests=_driver_scope("driver_leases", request.config) != "function")
+    yield leases
+    leases.release_all()
+
+
+@pytest.fixture
+def driver(browser_name, driver_leases):
+    """
+    A warm WebDriver for this test. Requesting it parametrizes the test over
+    browser_name like any browser test, so --browser all runs it on every browser.
+    Cookies, storage and extra windows are cleared after the test; a driver that
+    can't be reset is replaced by a fresh one.
+    """
+    web_driver = driver_leases.get(browser_name)
+    yield web_driver
+    driver_leases.finish(web_driver)
+
+
+@pytest.fixture
+def logger(request):
+    """Logger named after the test class (or module)."""
+    name = request.cls.__name__ if request.cls else request.module.__name__.rsplit('.', 1)[-1]
+    return CustomLogger.get_logger(name)
+
+
+@pytest.fixture
+def base_url():
+    """Site under test, from [DEFAULT] base_url."""
+    return _config.get('DEFAULT', 'base_url', fallback='https://www.demoblaze.com')
+
+
+@pytest.fixture
+def home_page(driver, logger, base_url):
+    """HomePage on a freshly loaded home page."""
+    driver.get(base_url)
+    return HomePage(driver, logger)
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """Per-worker cache of logged-in sessions, see [SESSION_CACHE]."""
+    return SessionCache()
+
+
+@pytest.fixture
+def logged_in_home_page(driver, logger, session_cache):
+    """
+    HomePage already logged in as the [CREDENTIALS] user. The UI login runs once
+    per worker; later tests get the cached cookies and localStorage restored.
+    """
+    username = _config.get('CREDENTIALS', 'username', fallback='testuser2024')
+    password = _config.get('CREDENTIALS', 'password', fallback='Test@1234')
+    session_cache.login(driver, username, password)
+    return HomePage(driver, logger)
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Pooled HTTP client for the DemoBlaze backend, see [API]."""
+    client = DemoBlazeApi(logger=CustomLogger.get_logger("DemoBlazeApi"))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def api_user(api_client):
+    """A freshly signed-up user: (username, password)."""
+    return api_client.create_user()
+
+
+@pytest.fixture
+def seeded_cart(driver, base_url, api_client, api_user):
+    """
+    Fill the cart of a user created for this test over HTTP and log the browser in
+    with that user's token: seeded_cart(1, 2) adds products 1 and 2 and returns
+    their cart item ids. Each test has its own user, so parallel workers never
+    touch each other's carts.
+    """
+    token = api_client.login(*api_user)
+
+    def seed(*product_ids):
+        item_ids = api_client.seed_cart(token, product_ids)
+        api_client.apply_to_driver(driver, token, base_url)
+        return item_ids
+
+    return seed
+
+
+@pytest.fixture
+def product_page(driver, logger):
+    """ProductPage on the shared driver (no navigation)."""
+    return ProductPage(driver, logger)
+
+
+@pytest.fixture
+def cart_page(driver, logger):
+    """CartPage on the shared driver (no navigation)."""
+    return CartPage(driver, logger)
+
+
+@pytest.fixture
+def login_page(driver, logger):
+    """LoginPage on the shared driver (no navigation)."""
+    return LoginPage(driver, logger)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -125,35 +273,21 @@ def pytest_runtest_makereport(item, call):
                 print(f"\n⚠️ No driver found for screenshot in test: {item.name}")
                 return
 
-            # Create screenshot directory (thread-safe)
-            screenshot_dir = os.path.join(os.getcwd(), 'reports', 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            # Generate unique filename with thread-safe counter
-            with screenshot_lock:
-                thread_id = threading.current_thread().ident
-                if thread_id not in screenshot_counter:
-                    screenshot_counter[thread_id] = 0
-                screenshot_counter[thread_id] += 1
-                counter = screenshot_counter[thread_id]
-
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-            worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
-
             # Get browser name from test parameters
             browser_name = "unknown"
             if hasattr(item, 'callspec') and 'browser_name' in item.callspec.params:
                 browser_name = item.callspec.params['browser_name']
 
-            filename = f"failure_{browser_name}_{item.name}_{worker_id}_{timestamp}_{counter}.png"
-            filepath = os.path.join(screenshot_dir, filename)
-
-            # Save screenshot
-            driver.save_screenshot(filepath)
+            # Capture once: the same bytes go to Allure now and to disk in the background.
+            # The Allure attach stays on the test thread: Allure files an attachment under the
+            # calling thread's current test, and pool threads would file it under a stale one.
+            # It is a plain write of the captured PNG; encoding and resizing happen in the service.
+            screenshot_png = driver.get_screenshot_as_png()
+            filepath = ScreenshotService.default().submit(screenshot_png, f"failure_{browser_name}_{item.name}")
 
             # Attach to Allure
             allure.attach(
-                driver.get_screenshot_as_png(),
+                screenshot_png,
                 name=f"Screenshot [{browser_name}] {item.name}",
                 attachment_type=AttachmentType.PNG
             )
@@ -190,6 +324,48 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "firefox_only: mark test to run only on Firefox"
     )
+    config.addinivalue_line(
+        "markers", "resource_profile(name): block requests while the test runs "
+                   "(none, no-media, no-third-party, text-only or a profile from config.ini)"
+    )
+    config.addinivalue_line(
+        "markers", "timing_profile(name): page load strategy and waits for the test's browser "
+                   "(resilient, fast or a [TIMING.<name>] section from config.ini)"
+    )
+
+
+# Profile markers, exported as environment variables for BrowserConfig / DriverPool
+PROFILE_MARKERS = {
+    "resource_profile": ResourceProfiles,
+    "timing_profile": TimingProfiles,
+}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Export the test's profile markers before its fixtures launch or lease a browser."""
+    for marker_name, profiles in PROFILE_MARKERS.items():
+        marker = item.get_closest_marker(marker_name)
+        if marker and (marker.args or "name" in marker.kwargs):
+            profile = marker.args[0] if marker.args else marker.kwargs["name"]
+            profiles.get(profile)  # Fail the setup on unknown profile names
+            os.environ[profiles.ENV_VAR] = profile
+        else:
+            os.environ.pop(profiles.ENV_VAR, None)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Drop the exported profiles once the test's fixtures are torn down."""
+    for profiles in PROFILE_MARKERS.values():
+        os.environ.pop(profiles.ENV_VAR, None)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Quit the warm drivers this worker's pools are still holding, then flush screenshots and logs."""
+    DriverPool.shutdown_all()
+    ScreenshotService.shutdown_all()
+    CustomLogger.shutdown()
 
 
 def pytest_collection_modifyitems(config, items):
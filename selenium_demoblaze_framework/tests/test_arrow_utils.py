@@ -0,0 +1,69 @@
+# selenium_demoblaze_framework/tests/test_arrow_utils.py
+
+import pytest
+import os
+import sys
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.arrow_utils import ArrowUtils
+from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
+from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+class TestArrowUtils:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.rows = [{'product': f"Product {i}", 'category': ['Phones', 'Laptops', 'Monitors'][i % 3],
+                      'price': 100 + i} for i in range(3000)]
+        self.parquet_path = str(tmp_path / "products.parquet")
+        ArrowUtils.write_parquet_data(self.parquet_path, self.rows, row_group_size=500)
+
+    def test_round_trip_keeps_list_of_dicts_shape(self, setup):
+        assert ArrowUtils.read_parquet_data(self.parquet_path) == self.rows
+
+    def test_column_projection(self, setup):
+        rows = ArrowUtils.read_parquet_data(self.parquet_path, columns=['price'])
+
+        assert rows[0] == {'price': 100}
+
+    def test_filters_are_pushed_down(self, setup):
+        assert ArrowUtils.read_parquet_data(self.parquet_path, filters={'category': 'Monitors', 'price': 102}) == [
+            {'product': 'Product 2', 'category': 'Monitors', 'price': 102}]
+
+        rows = ArrowUtils.read_parquet_data(self.parquet_path, columns=['product'], filters=[('price', '>=', 3098)])
+        assert rows == [{'product': 'Product 2998'}, {'product': 'Product 2999'}]
+        # Row-group statistics exist, so the reader can skip non-matching groups
+        assert pq.ParquetFile(self.parquet_path).metadata.num_row_groups == 6
+
+    def test_iterator_and_arrow_ipc(self, setup):
+        assert sum(1 for _ in ArrowUtils.iter_parquet_data(self.parquet_path, batch_size=256)) == 3000
+
+        arrow_path = str(self.tmp_path / "products.arrow")
+        ArrowUtils.write_arrow_data(arrow_path, self.rows)
+        assert ArrowUtils.read_data(arrow_path, columns=['product'], filters={'price': 101}) == [
+            {'product': 'Product 1'}]
+
+    def test_convert_existing_test_data(self, setup):
+        out = str(self.tmp_path)
+
+        csv_files = ArrowUtils.convert_to_parquet(os.path.join(DATA_DIR, 'test_data.csv'), out)
+        excel_files = ArrowUtils.convert_to_parquet(os.path.join(DATA_DIR, 'test_data.xlsx'), out)
+        json_files = ArrowUtils.convert_to_parquet(os.path.join(DATA_DIR, 'test_data.json'), out)
+
+        assert ArrowUtils.read_parquet_data(csv_files[0]) == CSVUtils.read_csv_data(
+            os.path.join(DATA_DIR, 'test_data.csv'))
+        assert sorted(os.path.basename(path) for path in excel_files) == [
+            'test_data_xlsx.Orders.parquet', 'test_data_xlsx.Products.parquet', 'test_data_xlsx.Users.parquet']
+        assert ArrowUtils.read_parquet_data(os.path.join(out, 'test_data_xlsx.Products.parquet')) == \
+            ExcelUtils.read_excel_data(os.path.join(DATA_DIR, 'test_data.xlsx'), 'Products')
+        assert ArrowUtils.read_parquet_data(os.path.join(out, 'test_data_json.users.parquet')) == \
+            JSONUtils.read_json_data(os.path.join(DATA_DIR, 'test_data.json'))['users']
+        assert len(json_files) == 2
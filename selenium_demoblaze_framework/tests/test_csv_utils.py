@@ -0,0 +1,76 @@
+# selenium_demoblaze_framework/tests/test_csv_utils.py
+
+import pytest
+import os
+import sys
+import types
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+SCHEMA = {'id': int, 'price': 'float', 'in_stock': bool, 'cost': Decimal}
+
+
+class TestCSVUtils:
+    """Chunked, typed CSV reading with the csv, pandas and pyarrow engines"""
+
+    @pytest.fixture
+    def setup(self, tmp_path):
+        csv_file = str(tmp_path / 'products.csv')
+        with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+            f.write('id,name,price,in_stock,cost\n')
+            for i in range(1, 26):
+                price = '' if i == 5 else f"{i * 10}.5"
+                stock = 'true' if i % 2 else 'false'
+                f.write(f"{i},Product {i},{price},{stock},{i}.10\n")
+            f.write('26,,,,1\n')
+        yield types.SimpleNamespace(csv_file=csv_file, tmp_path=tmp_path)
+
+    def test_default_read_is_unchanged(self):
+        rows = CSVUtils.read_csv_data(os.path.join(DATA_DIR, 'test_data.csv'))
+        assert rows[0]['username'] == 'testuser1'
+        assert all(isinstance(value, str) for row in rows for value in row.values())
+
+    def test_iter_csv_rows_is_lazy(self, setup):
+        rows = CSVUtils.iter_csv_rows(setup.csv_file)
+        assert isinstance(rows, types.GeneratorType)
+        assert next(rows)['name'] == 'Product 1'
+
+    @pytest.mark.parametrize('engine', ['csv', 'pandas', 'pyarrow'])
+    def test_schema_types_values(self, setup, engine):
+        rows = list(CSVUtils.iter_csv_rows(setup.csv_file, schema=SCHEMA, engine=engine))
+
+        assert len(rows) == 26
+        assert rows[0] == {'id': 1, 'name': 'Product 1', 'price': 10.5, 'in_stock': True,
+                           'cost': Decimal('1.10')}
+        assert rows[4]['price'] is None
+        assert rows[1]['in_stock'] is False
+        assert rows[25] == {'id': 26, 'name': '', 'price': None, 'in_stock': None, 'cost': Decimal('1')}
+        assert type(rows[0]['id']) is int
+
+    @pytest.mark.parametrize('engine', ['csv', 'pandas', 'pyarrow'])
+    def test_engines_agree_on_untyped_data(self, engine):
+        path = os.path.join(DATA_DIR, 'test_data.csv')
+        assert list(CSVUtils.iter_csv_rows(path, engine=engine)) == CSVUtils.read_csv_data(path)
+
+    @pytest.mark.parametrize('engine', ['csv', 'pandas', 'pyarrow'])
+    def test_chunks_and_projection(self, setup, engine):
+        chunks = list(CSVUtils.iter_csv_chunks(setup.csv_file, chunk_size=10, schema={'id': int},
+                                               columns=['name', 'id'], engine=engine))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 6]
+        assert list(chunks[0][0].items()) == [('name', 'Product 1'), ('id', 1)]
+
+    def test_unknown_column_and_bad_value(self, setup):
+        with pytest.raises(KeyError):
+            list(CSVUtils.iter_csv_rows(setup.csv_file, columns=['missing']))
+        with pytest.raises(ValueError, match="column 'name' in record 1"):
+            list(CSVUtils.iter_csv_rows(setup.csv_file, schema={'name': int}))
+        with pytest.raises(ValueError):
+            list(CSVUtils.iter_csv_rows(setup.csv_file, engine='polars'))
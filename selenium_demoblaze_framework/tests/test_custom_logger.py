@@ -0,0 +1,128 @@
+# selenium_demoblaze_framework/tests/test_custom_logger.py
+
+import pytest
+import os
+import sys
+import json
+import logging
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class _Recorder:
+    """Remembers which thread rendered it."""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread().name)
+        return 'recorded'
+
+
+class TestCustomLogger:
+    """Queue-based logging pipeline"""
+
+    @pytest.fixture
+    def setup(self, tmp_path):
+        log_dir = str(tmp_path / 'logs')
+        yield log_dir
+        CustomLogger.shutdown()
+
+    @staticmethod
+    def read_log(log_file):
+        CustomLogger.shutdown()
+        with open(log_file, encoding='utf-8') as f:
+            return f.read()
+
+    def test_handlers_are_shared_and_not_duplicated(self, setup):
+        CustomLogger.configure(log_dir=setup)
+        first = CustomLogger.get_logger('PipelineTest')
+        again = CustomLogger.get_logger('PipelineTest')
+        other = CustomLogger.get_logger('OtherPipelineTest')
+
+        assert first is again
+        assert len(first.handlers) == 1
+        assert first.handlers[0] is other.handlers[0]
+        assert isinstance(first.handlers[0], logging.handlers.QueueHandler)
+
+    def test_one_file_per_worker(self, setup, monkeypatch):
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw3')
+        log_file = CustomLogger.configure(log_dir=setup)
+        CustomLogger.get_logger('PipelineTest').info("hello %s", 'world')
+
+        assert os.path.basename(log_file).startswith('test_gw3_')
+        assert 'PipelineTest - INFO' in self.read_log(log_file)
+        assert 'hello world' in self.read_log(log_file)
+        assert os.listdir(setup) == [os.path.basename(log_file)]
+
+    def test_formatting_happens_on_listener_thread(self, setup):
+        log_file = CustomLogger.configure(log_dir=setup, propagate=False)
+        recorder = _Recorder()
+        CustomLogger.get_logger('PipelineTest').info("value: %s", recorder)
+
+        assert 'value: recorded' in self.read_log(log_file)
+        assert recorder.threads and threading.current_thread().name not in recorder.threads
+
+    def test_propagation_follows_config(self, setup):
+        CustomLogger.configure(log_dir=setup, propagate=False)
+        logger = CustomLogger.get_logger('PipelineTest')
+        assert logger.propagate is False
+        CustomLogger.configure(log_dir=setup, propagate=True)
+        assert logger.propagate is True
+
+    def test_module_levels(self, setup):
+        log_file = CustomLogger.configure(log_dir=setup, log_level='DEBUG',
+                                          module_levels='PipelineQuiet:WARNING, PipelineQuietButLoud:DEBUG')
+        quiet = CustomLogger.get_logger('PipelineQuiet_chrome')
+        loud = CustomLogger.get_logger('PipelineQuietButLoud')
+        quiet.info("quiet info")
+        quiet.warning("quiet warning")
+        loud.debug("loud debug")
+
+        content = self.read_log(log_file)
+        assert 'quiet info' not in content
+        assert 'quiet warning' in content
+        assert 'loud debug' in content
+
+    def test_reconfigure_updates_existing_loggers(self, setup):
+        CustomLogger.configure(log_dir=setup, log_level='DEBUG')
+        logger = CustomLogger.get_logger('PipelineTest')
+        CustomLogger.configure(log_dir=setup, log_level='ERROR')
+        assert logger.level == logging.ERROR
+
+    def test_json_output(self, setup):
+        log_file = CustomLogger.configure(log_dir=setup, json_format=True)
+        logger = CustomLogger.get_logger('PipelineJson')
+        logger.info("added %d items", 3)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+
+        assert log_file.endswith('.jsonl')
+        records = [json.loads(line) for line in self.read_log(log_file).splitlines()]
+        assert records[0]['message'] == 'added 3 items'
+        assert records[0]['logger'] == 'PipelineJson'
+        assert records[0]['level'] == 'INFO'
+        assert 'RuntimeError: boom' in records[1]['exception']
+
+    def test_records_after_shutdown_are_written_directly(self, setup):
+        log_file = CustomLogger.configure(log_dir=setup, propagate=False)
+        logger = CustomLogger.get_logger('PipelineTest')
+        logger.info("before shutdown")
+        CustomLogger.shutdown()
+        logger.info("after shutdown")
+
+        content = self.read_log(log_file)
+        assert 'before shutdown' in content
+        assert 'after shutdown' in content
+
+    def test_propagation_is_off_by_default(self, setup):
+        CustomLogger.configure(log_dir=setup)
+        assert CustomLogger.get_logger('PipelineTest').propagate is False
@@ -0,0 +1,103 @@
+# selenium_demoblaze_framework/tests/test_data_provider.py
+
+import pytest
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.data_provider import DataProvider
+from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
+from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
+from selenium_demoblaze_framework.utilities.xml_utils import XMLUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+class TestDataProvider:
+    @pytest.fixture
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DataProvider, 'cache_dir', str(tmp_path / "cache"))
+        DataProvider.clear()
+        self.tmp_path = tmp_path
+        self.parses = []
+
+        original_read = DataProvider.read
+
+        def counting_read(file_path, sheet_name=None):
+            self.parses.append(os.path.basename(file_path))
+            return original_read(file_path, sheet_name)
+
+        monkeypatch.setattr(DataProvider, 'read', staticmethod(counting_read))
+
+        yield
+
+        DataProvider.clear()
+
+    def test_format_is_detected_from_extension(self, setup):
+        path = lambda name: os.path.join(DATA_DIR, name)
+
+        assert DataProvider.load(path('test_data.xlsx'), 'Products') == ExcelUtils.read_excel_data(
+            path('test_data.xlsx'), 'Products')
+        assert DataProvider.load(path('test_data.csv')) == CSVUtils.read_csv_data(path('test_data.csv'))
+        assert DataProvider.load(path('test_data.json')) == JSONUtils.read_json_data(path('test_data.json'))
+        assert DataProvider.load(path('test_data.xml')) == XMLUtils.read_xml_data(path('test_data.xml'))
+
+    def test_file_is_parsed_once_per_process(self, setup):
+        csv_path = os.path.join(DATA_DIR, 'test_data.csv')
+
+        for _ in range(5):
+            DataProvider.load(csv_path)
+
+        assert self.parses == ['test_data.csv']
+
+    def test_shared_cache_serves_other_workers(self, setup):
+        csv_path = os.path.join(DATA_DIR, 'test_data.csv')
+        DataProvider.load(csv_path)
+
+        DataProvider.clear()  # a fresh xdist worker has an empty in-process cache
+        data = DataProvider.load(csv_path)
+
+        assert self.parses == ['test_data.csv']
+        assert data == CSVUtils.read_csv_data(csv_path)
+
+    def test_changed_file_is_parsed_again(self, setup):
+        json_path = str(self.tmp_path / "users.json")
+        JSONUtils.write_json_data(json_path, [{'username': 'first'}])
+        DataProvider.load(json_path)
+
+        JSONUtils.write_json_data(json_path, [{'username': 'second_user'}])
+        later = time.time() + 5
+        os.utime(json_path, (later, later))
+
+        assert DataProvider.load(json_path) == [{'username': 'second_user'}]
+        assert self.parses == ['users.json', 'users.json']
+
+    def test_callers_get_independent_copies(self, setup):
+        csv_path = os.path.join(DATA_DIR, 'test_data.csv')
+
+        DataProvider.load(csv_path)[0]['username'] = 'changed'
+
+        assert DataProvider.load(csv_path)[0]['username'] != 'changed'
+
+    def test_least_recently_used_entries_are_evicted(self, setup, monkeypatch):
+        monkeypatch.setattr(DataProvider, 'max_entries', 2)
+        paths = []
+        for i in range(3):
+            paths.append(str(self.tmp_path / f"data_{i}.json"))
+            JSONUtils.write_json_data(paths[-1], [{'id': i}])
+            DataProvider.load(paths[-1])
+
+        assert len(DataProvider._memory) == 2
+        assert all(key[0] != os.path.abspath(paths[0]) for key in DataProvider._memory)
+
+    def test_unsupported_format(self, setup):
+        path = self.tmp_path / "data.yaml"
+        path.write_text("users: []")
+
+        with pytest.raises(ValueError):
+            DataProvider.load(str(path))
@@ -0,0 +1,143 @@
+# selenium_demoblaze_framework/tests/test_demoblaze_api.py
+
+import pytest
+import os
+import sys
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.demoblaze_api import DemoBlazeApi, DemoBlazeApiError
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class StubBackend(BaseHTTPRequestHandler):
+    """In-memory imitation of api.demoblaze.com, answering the way the real one does."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, so pooled connections are reused
+
+    def do_POST(self):
+        state = self.server.state
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        endpoint = self.path.strip('/')
+        state['calls'].append(endpoint)
+        state['connections'].add(self.client_address)
+
+        if endpoint == 'signup':
+            if payload['username'] in state['users']:
+                return self._reply({'errorMessage': 'This user already exist.'})
+            state['users'][payload['username']] = payload['password']
+            return self._reply(None)
+        if endpoint == 'login':
+            if state['users'].get(payload['username']) != payload['password']:
+                return self._reply({'errorMessage': 'Wrong password.'})
+            token = base64.b64encode(payload['username'].encode()).decode()
+            state['tokens'][token] = payload['username']
+            return self._reply(f"Auth_token: {token}")
+        if endpoint == 'addtocart':
+            user = state['tokens'][payload['cookie']]
+            state['items'].append({'cookie': user, 'id': payload['id'], 'prod_id': payload['prod_id']})
+            return self._reply(None)
+        if endpoint == 'viewcart':
+            user = state['tokens'].get(payload['cookie'])
+            return self._reply({'Items': [item for item in state['items'] if item['cookie'] == user]})
+        if endpoint == 'deleteitem':
+            state['items'] = [item for item in state['items'] if item['id'] != payload['id']]
+            return self._reply('Item deleted.')
+        self.send_error(404)
+
+    def _reply(self, body):
+        data = b'' if body is None else json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDemoBlazeApi:
+    """Test data setup over HTTP against a local stub backend"""
+
+    @pytest.fixture
+    def setup(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubBackend)
+        server.state = {'users': {}, 'tokens': {}, 'items': [], 'calls': [], 'connections': set()}
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.state = server.state
+        client = DemoBlazeApi(base_url=f"http://127.0.0.1:{server.server_address[1]}/", timeout=5)
+        yield client
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    def test_signup_and_login(self, setup):
+        setup.signup('alice', 'secret')
+        assert self.state['users']['alice'] == base64.b64encode(b'secret').decode()
+        assert setup.login('alice', 'secret') == base64.b64encode(b'alice').decode()
+
+    def test_backend_errors_raise(self, setup):
+        setup.signup('alice', 'secret')
+        with pytest.raises(DemoBlazeApiError, match='already exist'):
+            setup.signup('alice', 'secret')
+        with pytest.raises(DemoBlazeApiError, match='Wrong password'):
+            setup.login('alice', 'wrong')
+
+    def test_create_user_is_unique(self, setup):
+        first, second = setup.create_user(), setup.create_user()
+        assert first[0] != second[0]
+        assert setup.login(*first)
+
+    def test_cart_round_trip(self, setup):
+        setup.signup('alice', 'secret')
+        token = setup.login('alice', 'secret')
+
+        item_id = setup.add_to_cart(token, '3')
+        setup.add_to_cart(token, 5)
+        assert [item['prod_id'] for item in setup.view_cart(token)] == [3, 5]
+
+        setup.delete_item(item_id)
+        assert [item['prod_id'] for item in setup.view_cart(token)] == [5]
+
+    def test_seed_cart_replaces_contents(self, setup):
+        setup.signup('alice', 'secret')
+        token = setup.login('alice', 'secret')
+        setup.add_to_cart(token, 9)
+
+        item_ids = setup.seed_cart(token, [1, 2])
+        assert sorted(item['id'] for item in setup.view_cart(token)) == sorted(item_ids)
+        assert setup.clear_cart(token) == 2
+        assert setup.view_cart(token) == []
+
+    def test_connections_are_reused(self, setup):
+        setup.signup('alice', 'secret')
+        token = setup.login('alice', 'secret')
+        for product_id in range(5):
+            setup.add_to_cart(token, product_id)
+        assert len(self.state['calls']) == 7
+        assert len(self.state['connections']) == 1
+
+    def test_apply_to_driver_sets_auth_cookie(self):
+        calls = []
+
+        class Driver:
+            def get(self, url):
+                calls.append(('get', url))
+
+            def add_cookie(self, cookie):
+                calls.append(('add_cookie', cookie))
+
+            def refresh(self):
+                calls.append(('refresh',))
+
+        DemoBlazeApi(base_url='http://127.0.0.1:1').apply_to_driver(Driver(), 'tok', 'https://www.demoblaze.com')
+        assert calls == [('get', 'https://www.demoblaze.com'),
+                         ('add_cookie', {'name': 'tokenp_', 'value': 'tok', 'path': '/'}),
+                         ('refresh',)]
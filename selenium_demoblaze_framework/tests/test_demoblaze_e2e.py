@@ -1115,7 +1115,6 @@ from selenium.webdriver.support import expected_conditions as EC
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from selenium_demoblaze_framework.config.browser_config import BrowserConfig
 from selenium_demoblaze_framework.pages.home_page import HomePage
 from selenium_demoblaze_framework.pages.product_page import ProductPage
 from selenium_demoblaze_framework.pages.cart_page import CartPage
@@ -1124,6 +1123,7 @@ from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
 from selenium_demoblaze_framework.utilities.xml_utils import XMLUtils
 from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
 from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+from selenium_demoblaze_framework.utilities.data_provider import DataProvider
 from selenium_demoblaze_framework.utilities.utility_methods import UtilityMethods
 
 # Thread-safe screenshot counter
@@ -1134,7 +1134,7 @@ screenshot_counter = {}
 class TestDemoBlazeE2E:
 
     @pytest.fixture(autouse=True)
-    def setup_and_teardown(self, browser_name):
+    def setup_and_teardown(self, browser_name, driver, base_url):
         """Setup and teardown for each test with browser parameterization."""
         # Setup
         self.browser_name = browser_name
@@ -1142,9 +1142,8 @@ class TestDemoBlazeE2E:
         self.logger.info("=" * 50)
         self.logger.info(f"Starting new test on {browser_name.upper()}")
 
-        # Initialize browser
-        self.browser_config = BrowserConfig()
-        self.driver = self.browser_config.get_driver(browser_name)
+        # Warm browser held by the shared `driver` fixture, reset between tests
+        self.driver = driver
 
         # Initialize page objects
         self.home_page = HomePage(self.driver, self.logger)
@@ -1159,7 +1158,7 @@ class TestDemoBlazeE2E:
         self.csv_utils = CSVUtils()
 
         # Navigate to base URL
-        self.driver.get("https://www.demoblaze.com")
+        self.driver.get(base_url)
         self.logger.info(f"Navigated to DemoBlaze website on {browser_name}")
 
         yield
@@ -1167,7 +1166,6 @@ class TestDemoBlazeE2E:
         # Teardown
         self.logger.info(f"Test completed on {browser_name}")
         self.logger.info("=" * 50)
-        self.driver.quit()
 
     def take_thread_safe_screenshot(self, name):
         """Take screenshot with thread-safe naming."""
@@ -1514,7 +1512,7 @@ class TestDemoBlazeE2E:
         excel_file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'test_data.xlsx')
 
         # Read data from the 'Products' sheet
-        products_data = self.excel_utils.read_excel_data(excel_file_path, sheet_name="Products")
+        products_data = DataProvider.load(excel_file_path, sheet_name="Products")
 
         for test_data in products_data:
             self.logger.info(f"Testing with Excel data: {test_data}")
@@ -1548,7 +1546,7 @@ class TestDemoBlazeE2E:
         xml_file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'test_data.xml')
 
         # Read data from the XML file
-        test_cases = self.xml_utils.read_xml_data(xml_file_path)
+        test_cases = DataProvider.load(xml_file_path)
 
         for test_data in test_cases:
             self.logger.info(f"Testing with XML data: {test_data}")
@@ -1602,7 +1600,7 @@ class TestDemoBlazeE2E:
         json_file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'test_data.json')
 
         # Read data from the JSON file
-        json_data = self.json_utils.read_json_data(json_file_path)
+        json_data = DataProvider.load(json_file_path)
 
         # Access the list of products
         for test_data in json_data.get("products", []):
@@ -1660,7 +1658,7 @@ class TestDemoBlazeE2E:
         csv_file_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'test_data.csv')
 
         # Read data from the CSV file
-        csv_data = self.csv_utils.read_csv_data(csv_file_path)
+        csv_data = DataProvider.load(csv_file_path)
 
         for test_data in csv_data:
             self.logger.info(f"Testing with CSV data: {test_data}")
@@ -2034,6 +2032,22 @@ class TestDemoBlazeE2E:
 
         self.logger.info("Pagination test passed: pages are non-empty and differ")
 
+    @allure.feature('Pagination')
+    @allure.story('Test Bulk Product Scraping Across Pages')
+    def test_25b_iter_all_products(self):
+        """Walk every product page with the single-round-trip grid scraper."""
+        self.logger.info("Testing bulk product scraping across all pages")
+
+        first_page = self.home_page.get_all_products()
+        all_products = list(self.home_page.iter_all_products())
+
+        assert len(all_products) > len(first_page), "Catalogue should span more than one page"
+        assert len({p['link'] for p in all_products}) == len(all_products), "Products should not repeat"
+        for product in all_products:
+            assert product['title'] and product['price'] and product['link'], f"Incomplete product: {product}"
+
+        self.logger.info(f"Scraped {len(all_products)} products across all pages")
+
     @allure.feature('Categories')
     @allure.story('Test All Categories')
     def test_26_categories(self):
@@ -2052,8 +2066,7 @@ class TestDemoBlazeE2E:
     @allure.story('Test Network Conditions')
     def test_27_network_emulation(self):
         """Test with emulated network conditions (Chrome only)."""
-        browser = self.browser_config.config.get('DEFAULT', 'browser').lower()
-        if browser == 'chrome':
+        if self.browser_name == 'chrome':
             self.logger.info("Testing network emulation")
 
             self.utils.set_network_conditions(
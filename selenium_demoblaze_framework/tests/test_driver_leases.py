@@ -0,0 +1,86 @@
+# selenium_demoblaze_framework/tests/test_driver_leases.py
+
+import pytest
+import os
+import sys
+from selenium.common.exceptions import WebDriverException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.config.driver_pool import DriverLeases, DriverPool
+from selenium_demoblaze_framework.tests.test_driver_pool import FakeDriver
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestDriverLeases:
+    """Scope-held drivers behind the shared `driver` fixture"""
+
+    @pytest.fixture
+    def setup(self):
+        self.created = []
+
+        def factory():
+            driver = FakeDriver()
+            self.created.append(driver)
+            return driver
+
+        self.pools = {name: DriverPool(name, size=2, factory=factory) for name in ('chrome', 'edge')}
+        yield lambda **kwargs: DriverLeases(pool_for=lambda browser: self.pools[browser or 'chrome'], **kwargs)
+        for pool in self.pools.values():
+            pool.shutdown()
+
+    def test_same_driver_for_every_test_in_scope(self, setup):
+        leases = setup()
+        first = leases.get('chrome')
+        first.handles.append("popup")
+
+        assert leases.finish(first) is True
+        assert leases.get('chrome') is first
+        assert first.handles == ["main"]
+        assert first.url == 'about:blank'
+        assert first.cookies_cleared == 1
+        assert len(self.created) == 1
+
+    def test_one_driver_per_pool(self, setup):
+        leases = setup()
+        assert leases.get('chrome') is not leases.get('edge')
+        assert leases.get(None) is leases.get('chrome')
+
+    def test_failed_reset_falls_back_to_fresh_driver(self, setup):
+        leases = setup()
+        broken = leases.get('chrome')
+
+        def fail(url):
+            raise WebDriverException("tab crashed")
+        broken.get = fail
+
+        assert leases.finish(broken) is False
+        fresh = leases.get('chrome')
+        assert fresh is not broken
+        assert broken.alive is False
+
+    def test_dead_driver_is_replaced_on_get(self, setup):
+        leases = setup()
+        dead = leases.get('chrome')
+        dead.alive = False
+        assert leases.get('chrome') is not dead
+
+    def test_function_scope_leaves_reset_to_the_pool(self, setup):
+        leases = setup(reset_between_tests=False)
+        driver = leases.get('chrome')
+        driver.handles.append("popup")
+        assert leases.finish(driver) is False
+        assert driver.handles == ["main", "popup"]
+
+        leases.release_all()
+        assert driver.handles == ["main"]
+        assert self.pools['chrome'].lease() is driver
+
+    def test_release_all_returns_drivers(self, setup):
+        leases = setup()
+        chrome, edge = leases.get('chrome'), leases.get('edge')
+        leases.release_all()
+
+        assert self.pools['chrome'].lease() is chrome
+        assert self.pools['edge'].lease() is edge
@@ -0,0 +1,222 @@
+# selenium_demoblaze_framework/tests/test_driver_pool.py
+
+import pytest
+import os
+import sys
+import threading
+import time
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.config.driver_pool import DriverPool
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class FakeDriver:
+    """Minimal stand-in for a WebDriver session - no browser required."""
+
+    def __init__(self):
+        self.alive = True
+        self.handles = ["main"]
+        self.cookies_cleared = 0
+        self.scripts = []
+        self.url = "https://www.demoblaze.com"
+        self.switch_to = self
+
+    # switch_to API
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        self.current = handle
+
+    def default_content(self):
+        pass
+
+    # driver API
+    @property
+    def current_window_handle(self):
+        if not self.alive:
+            raise WebDriverException("invalid session id")
+        return self.handles[0]
+
+    @property
+    def window_handles(self):
+        return list(self.handles)
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def get(self, url):
+        if not self.alive:
+            raise WebDriverException("invalid session id")
+        self.url = url
+
+    def quit(self):
+        self.alive = False
+
+
+class TestDriverPool:
+    @pytest.fixture
+    def setup(self):
+        self.created = []
+
+        def factory():
+            driver = FakeDriver()
+            self.created.append(driver)
+            return driver
+
+        self.pool = DriverPool("chrome", size=2, max_leases=3, factory=factory)
+
+        yield
+
+        self.pool.shutdown()
+
+    def test_warm_up_prelaunches_drivers(self, setup):
+        self.pool.warm_up()
+        assert len(self.created) == 2
+
+        first = self.pool.lease()
+        second = self.pool.lease()
+        assert {id(first), id(second)} == {id(d) for d in self.created}
+
+    def test_release_resets_state_and_reuses_driver(self, setup):
+        driver = self.pool.lease()
+        driver.handles.append("popup")
+
+        self.pool.release(driver)
+
+        assert driver.handles == ["main"]
+        assert driver.url == "about:blank"
+        assert driver.cookies_cleared == 1
+        assert any("localStorage.clear()" in s for s in driver.scripts)
+        assert self.pool.lease() is driver
+        assert len(self.created) == 1
+
+    def test_driver_recycled_after_max_leases(self, setup):
+        driver = self.pool.lease()
+        for _ in range(2):
+            self.pool.release(driver)
+            assert self.pool.lease() is driver
+        self.pool.release(driver)
+
+        assert driver.alive is False
+        assert self.pool.lease() is not driver
+
+    def test_unhealthy_driver_is_replaced_on_lease(self, setup):
+        driver = self.pool.lease()
+        self.pool.release(driver)
+        driver.alive = False
+
+        replacement = self.pool.lease()
+
+        assert replacement is not driver
+        assert replacement.alive
+
+    def test_failed_reset_recycles_driver(self, setup):
+        driver = self.pool.lease()
+        driver.quit()  # e.g. the test closed the session itself
+
+        self.pool.release(driver)
+
+        assert self.pool.lease() is not driver
+
+    def test_lease_waits_for_release_when_pool_is_full(self, setup):
+        first = self.pool.lease()
+        self.pool.lease()
+
+        timer = threading.Timer(0.2, self.pool.release, args=(first,))
+        timer.start()
+        leased = self.pool.lease(timeout=5)
+        timer.join()
+
+        assert leased is first
+
+    def test_lease_times_out_when_pool_is_exhausted(self, setup):
+        self.pool.lease()
+        self.pool.lease()
+
+        with pytest.raises(TimeoutError):
+            self.pool.lease(timeout=0.2)
+
+    def test_unexpected_reset_error_discards_driver(self, setup):
+        driver = self.pool.lease()
+
+        def broken_get(url):
+            raise RuntimeError("renderer hung")
+        driver.get = broken_get
+
+        self.pool.release(driver)  # Must not raise or lose the slot
+
+        assert driver.alive is False
+        first, second = self.pool.lease(timeout=1), self.pool.lease(timeout=1)
+        assert driver not in (first, second)
+
+    def test_replacing_unhealthy_drivers_never_exceeds_size(self):
+        alive = []
+        peak = [0]
+        lock = threading.Lock()
+
+        class CountingDriver(FakeDriver):
+            def quit(self):
+                time.sleep(0.05)  # Slow quit widens the window a freed slot could be taken in
+                with lock:
+                    if self in alive:  # A crashed session still holds its browser process until quit
+                        alive.remove(self)
+                super().quit()
+
+        def factory():
+            driver = CountingDriver()
+            with lock:
+                alive.append(driver)
+                peak[0] = max(peak[0], len(alive))
+            return driver
+
+        pool = DriverPool("chrome", size=2, factory=factory)
+        pool.warm_up()
+        for driver in list(alive):
+            driver.alive = False  # Both idle sessions died
+
+        def lease_and_release():
+            pool.release(pool.lease(timeout=5))
+
+        threads = [threading.Thread(target=lease_and_release) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        pool.shutdown()
+
+        assert peak[0] <= 2
+
+    def test_warming_one_pool_does_not_block_other_pools(self, monkeypatch):
+        monkeypatch.setattr(DriverPool, '_pools', {})
+        chrome_warming, release_chrome = threading.Event(), threading.Event()
+
+        def slow_warm_up(pool):
+            if pool.browser_name == 'chrome':
+                chrome_warming.set()
+                release_chrome.wait(5)
+
+        monkeypatch.setattr(DriverPool, 'warm_up', slow_warm_up)
+        thread = threading.Thread(target=DriverPool.for_browser, args=('chrome',))
+        thread.start()
+        try:
+            assert chrome_warming.wait(5)
+            started = time.monotonic()
+            edge_pool = DriverPool.for_browser('edge')
+            assert time.monotonic() - started < 1
+            assert edge_pool.browser_name == 'edge'
+            assert DriverPool.for_browser('chrome').browser_name == 'chrome'  # Registered while still warming
+        finally:
+            release_chrome.set()
+            thread.join()
@@ -0,0 +1,79 @@
+# selenium_demoblaze_framework/tests/test_driver_resolver.py
+
+import pytest
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.config.driver_resolver import DriverResolver
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestDriverResolver:
+    @pytest.fixture
+    def setup(self, tmp_path, monkeypatch):
+        self.lock_file = str(tmp_path / "drivers.lock")
+        self.calls = []
+
+        # Two fake driver binaries standing in for system / webdriver-manager drivers
+        self.first = tmp_path / "first_driver"
+        self.second = tmp_path / "second_driver"
+        for binary in (self.first, self.second):
+            binary.write_text("")
+
+        def candidates(resolver, browser_name, options):
+            def finder(path, source):
+                def find():
+                    self.calls.append(source)
+                    return str(path)
+                return find
+            return [('system', finder(self.first, 'system')),
+                    ('webdriver-manager', finder(self.second, 'webdriver-manager'))]
+
+        monkeypatch.setattr(DriverResolver, '_candidates', candidates)
+        monkeypatch.setattr(DriverResolver, '_driver_version', staticmethod(lambda path: '120.0.1'))
+        DriverResolver._memo.clear()
+
+        yield
+
+        DriverResolver._memo.clear()
+
+    def test_first_resolution_is_persisted(self, setup):
+        path = DriverResolver(self.lock_file).resolve('chrome', options=None)
+
+        assert path == str(self.first)
+        with open(self.lock_file, encoding='utf-8') as file:
+            entry = next(iter(json.load(file).values()))
+        assert entry['path'] == str(self.first)
+        assert entry['version'] == '120.0.1'
+        assert entry['source'] == 'system'
+
+    def test_later_resolutions_skip_candidates(self, setup):
+        DriverResolver(self.lock_file).resolve('chrome', options=None)
+        DriverResolver._memo.clear()  # simulate another xdist worker / later run
+
+        path = DriverResolver(self.lock_file).resolve('chrome', options=None)
+
+        assert path == str(self.first)
+        assert self.calls == ['system']
+
+    def test_excluded_driver_falls_back_to_next_candidate(self, setup):
+        resolver = DriverResolver(self.lock_file)
+        failed = resolver.resolve('chrome', options=None)
+
+        resolver.invalidate('chrome')
+        path = resolver.resolve('chrome', options=None, exclude=failed)
+
+        assert path == str(self.second)
+
+    def test_missing_binary_is_resolved_again(self, setup):
+        DriverResolver(self.lock_file).resolve('chrome', options=None)
+        DriverResolver._memo.clear()
+        os.remove(self.first)
+
+        path = DriverResolver(self.lock_file).resolve('chrome', options=None)
+
+        assert path == str(self.second)
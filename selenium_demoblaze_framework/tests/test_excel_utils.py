@@ -0,0 +1,165 @@
+# selenium_demoblaze_framework/tests/test_excel_utils.py
+
+import pytest
+import os
+import sys
+import types
+import threading
+import openpyxl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestExcelUtilsStreaming:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.file_path = str(tmp_path / "products.xlsx")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Products"
+        sheet.append(['product_name', 'category', 'expected_price', 'In Stock'])
+        for i in range(1000):
+            sheet.append([f"Phone {i}", 'Phones' if i % 2 else 'Laptops', 100 + i, i % 3 != 0])
+        sheet.append([None, None, None, None])
+        sheet.append(['Monitor', 'Monitors', 400, True])
+        workbook.save(self.file_path)
+
+    def test_iterator_is_lazy(self, setup):
+        rows = ExcelUtils.iter_excel_rows(self.file_path, "Products")
+
+        assert isinstance(rows, types.GeneratorType)
+        assert next(rows) == {'product_name': 'Phone 0', 'category': 'Laptops', 'expected_price': 100,
+                              'In Stock': False}
+        rows.close()
+
+    def test_projection_and_dict_filter(self, setup):
+        rows = list(ExcelUtils.iter_excel_rows(self.file_path, "Products",
+                                               columns=['expected_price', 'product_name'],
+                                               where={'category': 'Monitors'}))
+
+        assert rows == [{'expected_price': 400, 'product_name': 'Monitor'}]
+
+    def test_callable_filters(self, setup):
+        rows = list(ExcelUtils.iter_excel_rows(self.file_path, "Products",
+                                               where={'expected_price': lambda price: price >= 1095}))
+        assert [row['product_name'] for row in rows] == ['Phone 995', 'Phone 996', 'Phone 997', 'Phone 998',
+                                                         'Phone 999']
+
+        rows = list(ExcelUtils.iter_excel_rows(self.file_path, "Products", as_namedtuple=True,
+                                               where=lambda row: row.expected_price < 102))
+        assert [row.product_name for row in rows] == ['Phone 0', 'Phone 1']
+
+    def test_namedtuple_rows_use_identifier_headers(self, setup):
+        row = next(ExcelUtils.iter_excel_rows(self.file_path, "Products", as_namedtuple=True))
+
+        assert row.product_name == 'Phone 0'
+        assert row.In_Stock is False
+
+    def test_missing_column_is_reported(self, setup):
+        with pytest.raises(KeyError):
+            next(ExcelUtils.iter_excel_rows(self.file_path, "Products", columns=['sku']))
+
+    def test_read_excel_data_keeps_its_contract(self, setup):
+        data = ExcelUtils.read_excel_data(self.file_path, "Products")
+
+        assert len(data) == 1001  # the empty row is skipped
+        assert data[-1] == {'product_name': 'Monitor', 'category': 'Monitors', 'expected_price': 400,
+                            'In Stock': True}
+
+
+class TestExcelUtilsWriting:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.file_path = str(tmp_path / "results" / "results.xlsx")
+        self.saves = 0
+        original_save = openpyxl.Workbook.save
+
+        def counting_save(workbook, filename):
+            self.saves += 1
+            return original_save(workbook, filename)
+
+        openpyxl.Workbook.save = counting_save
+        yield
+        openpyxl.Workbook.save = original_save
+
+    def test_write_excel_data_streams_generators(self, setup):
+        rows = ({'test': f"test_{i}", 'status': 'PASS'} for i in range(500))
+
+        ExcelUtils.write_excel_data(self.file_path, rows, sheet_name='Results')
+
+        data = ExcelUtils.read_excel_data(self.file_path, 'Results')
+        assert len(data) == 500
+        assert data[0] == {'test': 'test_0', 'status': 'PASS'}
+
+    def test_write_excel_data_rejects_empty_data(self, setup):
+        with pytest.raises(ValueError):
+            ExcelUtils.write_excel_data(self.file_path, [])
+
+    def test_update_cells_saves_once(self, setup):
+        ExcelUtils.write_excel_data(self.file_path, [{'test': f"test_{i}", 'status': ''} for i in range(100)])
+        self.saves = 0
+
+        written = ExcelUtils.update_cells(self.file_path, [('Sheet1', row, 'B', 'PASS') for row in range(2, 102)])
+
+        assert written == 100
+        assert self.saves == 1
+        assert {row['status'] for row in ExcelUtils.read_excel_data(self.file_path)} == {'PASS'}
+
+    def test_update_cell_accepts_column_letters(self, setup):
+        ExcelUtils.write_excel_data(self.file_path, [{'test': 'test_1', 'status': ''}])
+
+        ExcelUtils.update_cell(self.file_path, None, 2, 'B', 'FAIL')
+
+        assert ExcelUtils.read_excel_data(self.file_path) == [{'test': 'test_1', 'status': 'FAIL'}]
+
+    def test_append_rows_matches_existing_headers(self, setup):
+        ExcelUtils.write_excel_data(self.file_path, [{'test': 'test_1', 'status': 'PASS'}], sheet_name='Results')
+        self.saves = 0
+
+        ExcelUtils.append_rows(self.file_path, [{'status': 'FAIL', 'test': 'test_2'}, ['test_3', 'PASS']],
+                               sheet_name='Results')
+
+        assert self.saves == 1
+        assert ExcelUtils.read_excel_data(self.file_path, 'Results') == [
+            {'test': 'test_1', 'status': 'PASS'},
+            {'test': 'test_2', 'status': 'FAIL'},
+            {'test': 'test_3', 'status': 'PASS'},
+        ]
+
+    def test_append_rows_creates_file_and_sheet(self, setup):
+        ExcelUtils.append_rows(self.file_path, [{'test': 'test_1', 'status': 'PASS'}], sheet_name='Run 1')
+
+        assert ExcelUtils.read_excel_data(self.file_path, 'Run 1') == [{'test': 'test_1', 'status': 'PASS'}]
+
+    def test_concurrent_saves_use_their_own_temp_files(self, setup, monkeypatch):
+        # Threads of one worker saving the same workbook must not share a temp file
+        ExcelUtils.write_excel_data(self.file_path, [{'test': f"test_{i}", 'status': ''} for i in range(4)])
+        barrier = threading.Barrier(4, timeout=5)
+        original_replace = os.replace
+
+        def replace_together(source, target):
+            barrier.wait()
+            original_replace(source, target)
+
+        monkeypatch.setattr(os, 'replace', replace_together)
+        errors = []
+
+        def update(row):
+            try:
+                ExcelUtils.update_cell(self.file_path, None, row, 'B', 'PASS')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=update, args=(row,)) for row in range(2, 6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(ExcelUtils.read_excel_data(self.file_path)) == 4
+        assert not [name for name in os.listdir(os.path.dirname(self.file_path)) if '.tmp' in name]
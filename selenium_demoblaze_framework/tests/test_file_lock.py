@@ -0,0 +1,79 @@
+# selenium_demoblaze_framework/tests/test_file_lock.py
+
+import pytest
+import os
+import sys
+import socket
+import subprocess
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.file_lock import FileLock
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestFileLock:
+    """Stale-lock detection and safe breaking"""
+
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / "resource.lck")
+
+        def hold(holder, age=0):
+            with open(self.path, 'w', encoding='utf-8') as file:
+                file.write(holder)
+            if age:
+                past = time.time() - age
+                os.utime(self.path, (past, past))
+
+        yield hold
+
+    @staticmethod
+    def dead_pid():
+        process = subprocess.Popen([sys.executable, '-c', 'pass'])
+        process.wait()
+        return process.pid
+
+    def test_stale_after_is_below_timeout(self):
+        lock = FileLock('unused.lck')
+        assert lock.stale_after < lock.timeout
+        assert FileLock('unused.lck', timeout=10, stale_after=600).stale_after < 10
+
+    @pytest.mark.skipif(os.name == 'nt', reason="pid liveness is only probed on POSIX")
+    def test_lock_of_dead_process_is_broken_at_once(self, setup):
+        setup(f"{socket.gethostname()}:{self.dead_pid()}:token")
+
+        start = time.monotonic()
+        with FileLock(self.path, timeout=2):
+            pass
+        assert time.monotonic() - start < 1
+
+    def test_live_holder_is_waited_for_however_old(self, setup):
+        setup(f"{socket.gethostname()}:{os.getpid()}:token", age=3600)
+        with pytest.raises(TimeoutError):
+            FileLock(self.path, timeout=0.3).acquire()
+
+    def test_old_lock_from_another_host_is_broken(self, setup):
+        setup("other-host:1234:token", age=3600)
+        with FileLock(self.path, timeout=2):
+            assert os.path.exists(self.path)
+        assert not os.path.exists(self.path)
+
+    def test_fresh_lock_from_another_host_is_respected(self, setup):
+        setup("other-host:1234:token")
+        assert FileLock(self.path)._is_stale("other-host:1234:token") is False
+
+    def test_break_leaves_a_newly_taken_lock_alone(self, setup):
+        setup("other-host:1234:new-holder")
+        assert FileLock(self.path)._break("other-host:1234:old-holder") is False
+        assert os.path.exists(self.path)
+        assert not os.path.exists(self.path + '.break')
+
+    def test_release_keeps_a_lock_someone_else_took_over(self, setup):
+        lock = FileLock(self.path)
+        lock.acquire()
+        setup("other-host:1234:new-holder")
+        lock.release()
+        assert os.path.exists(self.path)
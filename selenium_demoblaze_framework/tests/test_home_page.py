@@ -0,0 +1,107 @@
+# selenium_demoblaze_framework/tests/test_home_page.py
+
+import pytest
+import os
+import sys
+import json
+import shutil
+import subprocess
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.pages.base_page import READINESS_HOOKS_JS
+from selenium_demoblaze_framework.pages.home_page import HomePage
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class GridDriver:
+    """Answers the bulk grid script: null while loading, then the rendered cards."""
+
+    def __init__(self, products, loading_polls=2):
+        self.products = products
+        self.loading_polls = loading_polls
+        self.hooked = False
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        if script == READINESS_HOOKS_JS:
+            self.hooked = True
+            return None
+        assert script == HomePage.PRODUCT_GRID_JS and self.hooked
+        assert args == (HomePage.EMPTY_GRID_QUIET_MS,)
+        self.calls += 1
+        if self.calls <= self.loading_polls:
+            return None
+        return {'products': list(self.products)}
+
+
+# Runs the real PRODUCT_GRID_JS against a minimal DOM whose grid is filled by a late AJAX call
+GRID_SCRIPT_HARNESS = """
+var script = new Function(process.argv[1]);
+var grid = [];
+global.document = {
+    readyState: 'complete',
+    getElementById: function(id) { return id === 'tbodyid' ? {} : null; },
+    getElementsByClassName: function() { return grid; }
+};
+global.window = {};
+function card(title, price) {
+    var parts = {'.card-title': {innerText: title}, 'h5': {innerText: '$' + price},
+                 '.card-title a': {href: 'prod.html?idp_=1'}, 'img': {src: 'a.jpg'}};
+    return {querySelector: function(selector) { return parts[selector] || null; }};
+}
+var results = {};
+results.page_loaded = script(50);
+window.__readiness = {pending: 1, lastMutation: Date.now() - 500, lastRequest: Date.now() - 500};
+results.request_pending = script(50);
+window.__readiness.pending = 0;
+window.__readiness.lastRequest = Date.now();
+results.just_answered = script(50);
+setTimeout(function() {
+    results.quiet_and_empty = script(50);
+    grid.push(card('Samsung galaxy s6', '360'));
+    results.filled = script(50);
+    console.log(JSON.stringify(results));
+}, 100);
+"""
+
+
+class TestHomePageProducts:
+    """Bulk product grid extraction"""
+
+    @pytest.fixture
+    def setup(self):
+        yield CustomLogger.get_logger(self.__class__.__name__)
+
+    def test_bulk_products_wait_for_the_grid(self, setup):
+        products = [{'title': 'Samsung galaxy s6', 'price': '360', 'link': 'prod.html?idp_=1', 'image': 'a.jpg'}]
+        driver = GridDriver(products)
+
+        assert HomePage(driver, setup).get_all_products() == products
+        assert driver.calls == 3
+
+    def test_empty_grid_returns_without_waiting_out_the_timeout(self, setup):
+        driver = GridDriver([])
+        page = HomePage(driver, setup)
+        page.timeout = 10
+
+        started = time.monotonic()
+        assert page.get_all_products() == []
+        assert time.monotonic() - started < 2
+        assert driver.calls == 3
+
+    @pytest.mark.skipif(shutil.which('node') is None, reason="needs Node.js to run the grid script")
+    def test_grid_script_waits_for_hooks_and_a_quiet_window(self):
+        output = subprocess.run(['node', '-e', GRID_SCRIPT_HARNESS, HomePage.PRODUCT_GRID_JS],
+                                capture_output=True, text=True, check=True, timeout=30).stdout
+        results = json.loads(output)
+
+        assert results['page_loaded'] is None  # no readiness hooks yet: cards may still be coming
+        assert results['request_pending'] is None
+        assert results['just_answered'] is None
+        assert results['quiet_and_empty'] == {'products': []}
+        assert results['filled'] == {'products': [
+            {'title': 'Samsung galaxy s6', 'price': '360', 'link': 'prod.html?idp_=1', 'image': 'a.jpg'}]}
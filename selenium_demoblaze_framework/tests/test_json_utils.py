@@ -0,0 +1,99 @@
+# selenium_demoblaze_framework/tests/test_json_utils.py
+
+import pytest
+import os
+import sys
+import json
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+def _append_batch(args):
+    file_path, worker = args
+    for i in range(50):
+        JSONUtils.append_json_lines(file_path, [{'worker': worker, 'index': i, 'pad': 'x' * 200},
+                                                {'worker': worker, 'index': i, 'second': True}])
+    return worker
+
+
+class TestJSONUtils:
+    """JSON Lines streaming, append-only writes and batched updates"""
+
+    @pytest.fixture
+    def setup(self, tmp_path):
+        json_file = str(tmp_path / 'data.json')
+        JSONUtils.write_json_data(json_file, {
+            'auth': {'username': 'user', 'password': 'secret'},
+            'settings': {'timeout': 10, 'retries': 1}
+        })
+        yield types.SimpleNamespace(tmp_path=tmp_path, json_file=json_file,
+                                    jsonl_file=str(tmp_path / 'results' / 'results.jsonl'))
+
+    def test_iter_json_lines_is_lazy_and_skips_blank_lines(self, setup):
+        path = str(setup.tmp_path / 'results.jsonl')
+        with open(path, 'w') as f:
+            f.write('{"a": 1}\n\n{"a": 2}\n')
+
+        records = JSONUtils.iter_json_lines(path)
+        assert isinstance(records, types.GeneratorType)
+        assert list(records) == [{'a': 1}, {'a': 2}]
+        assert JSONUtils.read_json_data(path) == [{'a': 1}, {'a': 2}]
+
+    def test_invalid_line_reports_line_number(self, setup):
+        path = str(setup.tmp_path / 'bad.jsonl')
+        with open(path, 'w') as f:
+            f.write('{"a": 1}\n{broken\n')
+        with pytest.raises(ValueError, match='line 2'):
+            JSONUtils.read_json_lines(path)
+
+    def test_append_creates_file_and_accepts_single_record(self, setup):
+        assert JSONUtils.append_json_lines(setup.jsonl_file, {'test': 'login', 'passed': True}) == 1
+        assert JSONUtils.append_json_lines(setup.jsonl_file, [{'test': 'cart'}, {'test': 'ü'}]) == 2
+        assert JSONUtils.append_json_lines(setup.jsonl_file, []) == 0
+        assert [r['test'] for r in JSONUtils.read_json_lines(setup.jsonl_file)] == ['login', 'cart', 'ü']
+
+    def test_parallel_appends_never_interleave(self, setup):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_append_batch, [(setup.jsonl_file, f"t{w}") for w in range(4)]))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            list(executor.map(_append_batch, [(setup.jsonl_file, f"p{w}") for w in range(2)]))
+
+        records = JSONUtils.read_json_lines(setup.jsonl_file)
+        assert len(records) == 6 * 50 * 2
+        # Both records of one call are written together
+        for first, second in zip(records[::2], records[1::2]):
+            assert (first['worker'], first['index']) == (second['worker'], second['index'])
+            assert second['second'] is True
+
+    def test_update_json_values_writes_once(self, setup, monkeypatch):
+        writes = []
+        original = JSONUtils.write_json_data
+        monkeypatch.setattr(JSONUtils, 'write_json_data',
+                            staticmethod(lambda path, data: (writes.append(path), original(path, data))))
+
+        JSONUtils.update_json_values(setup.json_file, {'auth.username': 'admin', 'settings.timeout': 30})
+
+        assert writes == [setup.json_file]
+        data = JSONUtils.read_json_data(setup.json_file)
+        assert data['auth']['username'] == 'admin'
+        assert data['settings'] == {'timeout': 30, 'retries': 1}
+
+    def test_bad_key_path_leaves_file_untouched(self, setup):
+        with open(setup.json_file) as f:
+            before = f.read()
+        with pytest.raises(KeyError):
+            JSONUtils.update_json_values(setup.json_file, {'auth.username': 'admin', 'auth.missing': 1})
+        with open(setup.json_file) as f:
+            assert f.read() == before
+        assert [name for name in os.listdir(setup.tmp_path) if name.endswith('.tmp')] == []
+
+    def test_update_json_value_still_works(self, setup):
+        JSONUtils.update_json_value(setup.json_file, 'settings.retries', 3)
+        with open(setup.json_file) as f:
+            assert json.load(f)['settings']['retries'] == 3
@@ -0,0 +1,161 @@
+# selenium_demoblaze_framework/tests/test_keyword_alerts.py
+
+import pytest
+import os
+import sys
+import time
+from openpyxl import Workbook
+from selenium.common.exceptions import NoAlertPresentException, UnexpectedAlertPresentException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.keyword_engine import KeywordEngine
+from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class FakeAlert:
+    def __init__(self, driver, text):
+        self.driver = driver
+        self.text = text
+
+    def accept(self):
+        self.driver.accepted.append(self.text)
+        self.driver.open_alert = None
+
+    dismiss = accept
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the engine's alert handling."""
+
+    def __init__(self):
+        self.open_alert = None
+        self.late_alert = None
+        self.checks_until_alert = 0
+        self.accepted = []
+        self.alert_checks = 0
+
+    @property
+    def switch_to(self):
+        return self
+
+    @property
+    def alert(self):
+        self.alert_checks += 1
+        self._tick()
+        if self.open_alert is None:
+            raise NoAlertPresentException()
+        return self.open_alert
+
+    def _tick(self):
+        # An alert raised after an AJAX round trip: it opens a few calls after the click
+        if self.late_alert is not None:
+            if self.checks_until_alert > 0:
+                self.checks_until_alert -= 1
+            else:
+                self.open_alert, self.late_alert = self.late_alert, None
+
+
+class TestKeywordAlerts:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.driver = FakeDriver()
+        self.engine = KeywordEngine(self.driver)
+        self.engine.alert_mode = 'learned'
+        self.engine.alert_wait = 0.3
+        self.tmp_path = tmp_path
+
+        handlers = dict(KeywordRegistry._handlers)
+        canonical_names = dict(KeywordRegistry._canonical_names)
+        KeywordEngine._alert_triggers.clear()
+
+        def pop_alert(engine, locator, data):
+            engine.driver.open_alert = FakeAlert(engine.driver, data or 'Sign up successful.')
+            return True
+
+        KeywordRegistry.register('pop_alert', pop_alert)
+        KeywordRegistry.register('noop', lambda engine, locator, data: True)
+
+        def pop_alert_late(engine, locator, data):
+            engine.driver.late_alert = FakeAlert(engine.driver, 'Product added.')
+            engine.driver.checks_until_alert = self.checks_until_alert
+            engine.handle_alert_after('pop_alert_late', locator)  # like click: probe right away
+            return True
+
+        def touch_page(engine, locator, data):
+            engine.driver._tick()
+            if engine.driver.open_alert is not None:
+                raise UnexpectedAlertPresentException(alert_text=engine.driver.open_alert.text)
+            return True
+
+        self.checks_until_alert = 1
+        KeywordRegistry.register('pop_alert_late', pop_alert_late)
+        KeywordRegistry.register('touch_page', touch_page)
+
+        yield
+
+        KeywordEngine._alert_triggers.clear()
+        KeywordRegistry._handlers.clear()
+        KeywordRegistry._handlers.update(handlers)
+        KeywordRegistry._canonical_names.clear()
+        KeywordRegistry._canonical_names.update(canonical_names)
+
+    def _run(self, actions):
+        path = str(self.tmp_path / "alerts.xlsx")
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Sheet1"
+        sheet.append(['Test_Step_ID', 'Action', 'Locator_Type', 'Locator_Value', 'Data'])
+        for number, action in enumerate(actions, start=1):
+            sheet.append([number, action, None, None, None])
+        workbook.save(path)
+        return self.engine.execute_test_case(path, "Sheet1")
+
+    def test_no_alert_check_is_non_blocking(self, setup):
+        start = time.monotonic()
+        for _ in range(20):
+            assert self.engine.check_and_handle_unexpected_alert() is None
+        assert time.monotonic() - start < 0.2
+
+    def test_unexpected_alert_is_accepted_and_step_learned(self, setup):
+        results = self._run(['pop_alert', 'noop', 'noop'])
+
+        assert all(result['result'] for result in results)
+        assert self.driver.accepted == ['Sign up successful.']
+        assert self.engine.alert_timeout_after('pop_alert', '') == 0.3
+        assert self.engine.alert_timeout_after('noop', '') == 0
+
+    def test_alert_is_left_for_handle_alert_step(self, setup):
+        results = self._run(['pop_alert', 'handle_alert', 'noop'])
+
+        assert all(result['result'] for result in results)
+        # Accepted once, by handle_alert itself - the pre-step probe didn't swallow it
+        assert self.driver.accepted == ['Sign up successful.']
+        assert ('pop_alert', '') not in KeywordEngine._alert_triggers
+
+    def test_off_mode_never_probes(self, setup):
+        self.engine.alert_mode = 'off'
+
+        self._run(['noop', 'noop', 'noop'])
+
+        assert self.driver.alert_checks == 0
+
+    def test_late_alert_is_caught_by_next_probe_and_learned(self, setup):
+        results = self._run(['pop_alert_late', 'noop', 'noop'])
+
+        assert all(result['result'] for result in results)
+        assert self.driver.accepted == ['Product added.']
+        # Attributed to the step that raised it, not to the step that ran next
+        assert KeywordEngine._alert_triggers == {('pop_alert_late', '')}
+
+    def test_alert_interrupting_next_step_is_learned_and_step_retried(self, setup):
+        self.checks_until_alert = 2  # Misses both probes, opens during the next step
+
+        results = self._run(['pop_alert_late', 'touch_page', 'noop'])
+
+        assert all(result['result'] for result in results)
+        assert self.driver.accepted == ['Product added.']
+        assert KeywordEngine._alert_triggers == {('pop_alert_late', '')}
+        assert self.engine.alert_timeout_after('pop_alert_late', '') == 0.3
@@ -0,0 +1,118 @@
+# selenium_demoblaze_framework/tests/test_keyword_plan.py
+
+import pytest
+import os
+import sys
+import threading
+import time
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+from selenium_demoblaze_framework.utilities.keyword_plan import KeywordPlanLoader, PlanStep
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestKeywordPlanLoader:
+    @pytest.fixture
+    def setup(self, tmp_path, monkeypatch):
+        self.sheet_path = str(tmp_path / "keyword_test_cases.xlsx")
+        self.loader = KeywordPlanLoader(cache_dir=str(tmp_path / "plans"))
+        self.reads = 0
+
+        original_read_sheet = KeywordPlanLoader.read_sheet
+
+        def counting_read_sheet(loader, excel_file, sheet_name):
+            self.reads += 1
+            return original_read_sheet(loader, excel_file, sheet_name)
+
+        monkeypatch.setattr(KeywordPlanLoader, 'read_sheet', counting_read_sheet)
+        self._write_sheet([
+            [1, 'navigate_to_url', None, None, 'https://www.demoblaze.com'],
+            [2, 'click_element', 'id', 'signin2', None],
+            [None, None, None, None, None],
+            [3, 'enter_text', 'xpath', "//input[@id='sign-username']", 'user1'],
+            [4, 'wait', None, None, 2],
+        ])
+
+    def _write_sheet(self, rows):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Sheet1"
+        sheet.append(['Test_Step_ID', 'Action', 'Locator_Type', 'Locator_Value', 'Data'])
+        for row in rows:
+            sheet.append(row)
+        workbook.save(self.sheet_path)
+
+    def test_sheet_becomes_immutable_steps_with_parsed_locators(self, setup):
+        steps = self.loader.load(self.sheet_path, "Sheet1")
+
+        assert isinstance(steps, tuple)
+        assert steps[0] == PlanStep(1, 'navigate_to_url', '', 'https://www.demoblaze.com', None)
+        assert steps[1].by == (By.ID, 'signin2')
+        assert steps[2].by == (By.XPATH, "//input[@id='sign-username']")
+        assert steps[3].data == '2'
+        assert len(steps) == 4
+
+    def test_unchanged_sheet_is_served_from_cache(self, setup):
+        first = self.loader.load(self.sheet_path, "Sheet1")
+        second = KeywordPlanLoader(cache_dir=self.loader.cache_dir).load(self.sheet_path, "Sheet1")
+
+        assert second == first
+        assert self.reads == 1
+
+    def test_touched_but_identical_sheet_keeps_its_plan(self, setup):
+        self.loader.load(self.sheet_path, "Sheet1")
+        later = time.time() + 10
+        os.utime(self.sheet_path, (later, later))
+
+        self.loader.load(self.sheet_path, "Sheet1")
+
+        assert self.reads == 1
+
+    def test_edited_sheet_is_reparsed(self, setup):
+        self.loader.load(self.sheet_path, "Sheet1")
+        self._write_sheet([[1, 'click_element', 'css', '#login2', None]])
+
+        steps = self.loader.load(self.sheet_path, "Sheet1")
+
+        assert self.reads == 2
+        assert steps == (PlanStep(1, 'click_element', 'css=#login2', '', (By.CSS_SELECTOR, '#login2')),)
+
+    def test_malformed_locator_is_left_for_run_time(self, setup):
+        self._write_sheet([[1, 'click_element', 'bogus', 'x', None]])
+
+        steps = self.loader.load(self.sheet_path, "Sheet1")
+
+        assert steps[0].locator == 'bogus=x'
+        assert steps[0].by is None
+
+    def test_concurrent_cold_cache_loads(self, setup, monkeypatch):
+        # One thread per browser loading the same sheet: all write the cache at once
+        barrier = threading.Barrier(4, timeout=5)
+        original_replace = os.replace
+
+        def replace_together(source, target):
+            barrier.wait()
+            original_replace(source, target)
+
+        monkeypatch.setattr(os, 'replace', replace_together)
+        results, errors = [], []
+
+        def load():
+            try:
+                results.append(self.loader.load(self.sheet_path, "Sheet1"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [len(steps) for steps in results] == [4, 4, 4, 4]
+        assert not [name for name in os.listdir(self.loader.cache_dir) if name.endswith('.tmp')]
@@ -0,0 +1,109 @@
+# selenium_demoblaze_framework/tests/test_keyword_registry.py
+
+import pytest
+import os
+import sys
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.keyword_engine import KeywordEngine
+from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry, UnknownKeywordError
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TestKeywordRegistry:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.engine = KeywordEngine(driver=None)
+        # The registry is process-wide; snapshot it (plugins loaded) so test keywords don't leak
+        handlers = dict(KeywordRegistry._handlers)
+        canonical_names = dict(KeywordRegistry._canonical_names)
+        self.tmp_path = tmp_path
+
+        yield
+
+        KeywordRegistry._handlers.clear()
+        KeywordRegistry._handlers.update(handlers)
+        KeywordRegistry._canonical_names.clear()
+        KeywordRegistry._canonical_names.update(canonical_names)
+
+    def _write_sheet(self, rows):
+        path = str(self.tmp_path / "steps.xlsx")
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Sheet1"
+        sheet.append(['Test_Step_ID', 'Action', 'Locator_Type', 'Locator_Value', 'Data'])
+        for row in rows:
+            sheet.append(row)
+        workbook.save(path)
+        return path
+
+    def test_aliases_resolve_to_the_same_handler(self, setup):
+        assert KeywordRegistry.resolve('click') is KeywordRegistry.resolve('Click_Element')
+        assert KeywordRegistry.canonical_name('navigate_to_url') == 'navigate'
+
+    def test_plugin_keywords_are_registered(self, setup):
+        # keywords/keywords.py is listed under [KEYWORDS] plugins in config.ini
+        assert KeywordRegistry.is_registered('mouse_hover')
+        assert KeywordRegistry.is_registered('select_dropdown')
+
+    def test_decorator_registers_custom_keyword(self, setup):
+        calls = []
+
+        @KeywordRegistry.keyword('remember_value', 'remember')
+        def remember(engine, locator, data):
+            calls.append(data)
+            return True
+
+        self.engine.check_and_handle_unexpected_alert = lambda: None
+        self.engine.execute_keyword('REMEMBER', '', 'abc')
+
+        assert calls == ['abc']
+
+    def test_duplicate_registration_requires_replace(self, setup):
+        with pytest.raises(ValueError):
+            KeywordRegistry.register('click', lambda engine, locator, data: True)
+
+        KeywordRegistry.register('click', lambda engine, locator, data: 'custom', replace=True)
+        assert KeywordRegistry.resolve('click')(None, '', '') == 'custom'
+
+    def test_unknown_keywords_fail_at_load_time(self, setup):
+        path = self._write_sheet([
+            [1, 'navigate_to_url', None, None, 'https://www.demoblaze.com'],
+            [2, 'clik_element', 'id', 'login2', None],
+            [3, 'teleport', None, None, None],
+        ])
+
+        with pytest.raises(UnknownKeywordError) as error:
+            self.engine.execute_test_case(path, "Sheet1")
+
+        assert "clik_element" in str(error.value)
+        assert "teleport" in str(error.value)
+
+    def test_compiled_plan_carries_resolved_handlers(self, setup):
+        path = self._write_sheet([
+            [1, 'navigate_to_url', None, None, 'https://www.demoblaze.com'],
+            [2, 'click_element', 'id', 'login2', None],
+        ])
+
+        plan = self.engine.compile_test_case(path, "Sheet1")
+
+        assert [step.locator for step in plan] == ['', 'id=login2']
+        assert plan[1].by == ('id', 'login2')
+        assert plan[1].handler is KeywordRegistry.resolve('click')
+
+    def test_load_plugins_imports_module(self, setup, monkeypatch):
+        (self.tmp_path / "shop_keywords.py").write_text(
+            "from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry\n"
+            "\n"
+            "@KeywordRegistry.keyword('add_to_cart_via_api')\n"
+            "def add_to_cart_via_api(engine, locator, data):\n"
+            "    return True\n"
+        )
+        monkeypatch.syspath_prepend(str(self.tmp_path))
+
+        KeywordRegistry.load_plugins("shop_keywords")
+
+        assert KeywordRegistry.is_registered('add_to_cart_via_api')
@@ -0,0 +1,167 @@
+# selenium_demoblaze_framework/tests/test_keyword_suite_runner.py
+
+import pytest
+import os
+import sys
+import threading
+import time
+from openpyxl import Workbook
+from selenium.common.exceptions import NoAlertPresentException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry
+from selenium_demoblaze_framework.utilities.keyword_suite_runner import KeywordSuiteRunner
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class FakeDriver:
+    """Enough of a WebDriver for the pool's reset and the engine's alert probe."""
+
+    def __init__(self):
+        self.switch_to = self
+        self.resets = 0
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException()
+
+    def window(self, handle):
+        pass
+
+    def default_content(self):
+        pass
+
+    @property
+    def current_window_handle(self):
+        return "main"
+
+    @property
+    def window_handles(self):
+        return ["main"]
+
+    def execute_script(self, script, *args):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        if url == 'about:blank':
+            self.resets += 1
+
+    def quit(self):
+        pass
+
+
+class TestKeywordSuiteRunner:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.suite_dir = tmp_path / "suite"
+        (self.suite_dir / "nested").mkdir(parents=True)
+        self.drivers = []
+        self.running = 0
+        self.max_running = 0
+        lock = threading.Lock()
+
+        def slow_step(engine, locator, data):
+            with lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(0.2)
+            with lock:
+                self.running -= 1
+            return True
+
+        def failing_step(engine, locator, data):
+            raise Exception("boom")
+
+        handlers = dict(KeywordRegistry._handlers)
+        canonical_names = dict(KeywordRegistry._canonical_names)
+        KeywordRegistry.register('slow_step', slow_step)
+        KeywordRegistry.register('failing_step', failing_step)
+
+        self._write_workbook(self.suite_dir / "checkout.xlsx", {"Cart": ['slow_step', 'slow_step'],
+                                                               "Order": ['slow_step', 'failing_step']})
+        self._write_workbook(self.suite_dir / "nested" / "login.xlsx", {"Login": ['slow_step'],
+                                                                       "Typo": ['slow_stpe']})
+        (self.suite_dir / "~$checkout.xlsx").write_text("")
+
+        # A test data workbook living next to the keyword workbooks
+        data = Workbook()
+        data.active.title = "Users"
+        data.active.append(['username', 'password'])
+        data.active.append(['testuser', 'secret'])
+        data.create_sheet("Empty")
+        data.save(str(self.suite_dir / "test_data.xlsx"))
+
+        yield
+
+        KeywordRegistry._handlers.clear()
+        KeywordRegistry._handlers.update(handlers)
+        KeywordRegistry._canonical_names.clear()
+        KeywordRegistry._canonical_names.update(canonical_names)
+
+    @staticmethod
+    def _write_workbook(path, sheets):
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for title, actions in sheets.items():
+            sheet = workbook.create_sheet(title)
+            sheet.append(['Test_Step_ID', 'Action', 'Locator_Type', 'Locator_Value', 'Data'])
+            for number, action in enumerate(actions, start=1):
+                sheet.append([number, action, None, None, None])
+        workbook.save(str(path))
+
+    def _runner(self, **kwargs):
+        def factory(browser):
+            driver = FakeDriver()
+            self.drivers.append(driver)
+            return driver
+        return KeywordSuiteRunner(str(self.suite_dir), driver_factory=factory, **kwargs)
+
+    def test_discovers_every_sheet_of_every_workbook(self, setup):
+        jobs = self._runner(browsers=['chrome', 'edge']).discover()
+
+        assert [(os.path.basename(job.workbook), job.sheet) for job in jobs[::2]] == [
+            ('checkout.xlsx', 'Cart'), ('checkout.xlsx', 'Order'), ('login.xlsx', 'Login'), ('login.xlsx', 'Typo')]
+        assert {job.browser for job in jobs} == {'chrome', 'edge'}
+
+    def test_sheets_run_in_parallel_on_pooled_sessions(self, setup):
+        streamed = []
+        runner = self._runner(browsers=['chrome'], sessions=2,
+                              on_step=lambda job, result: streamed.append((job.sheet, result['step'])))
+
+        results = runner.run()
+
+        assert [r['sheet'] for r in results] == ['Cart', 'Order', 'Login', 'Typo']
+        assert self.max_running == 2
+        assert len(self.drivers) == 2
+        # Every sheet handed its session back reset
+        assert sum(driver.resets for driver in self.drivers) == 4
+        assert len(streamed) == 5
+
+    def test_failures_are_isolated_per_sheet(self, setup):
+        results = {r['sheet']: r for r in self._runner(browsers=['chrome'], sessions=2).run()}
+
+        assert results['Cart']['passed'] and results['Login']['passed']
+        assert not results['Order']['passed']
+        assert results['Order']['steps'][1]['message'] == 'boom'
+        assert 'slow_stpe' in results['Typo']['error']
+
+    def test_merged_report(self, setup, tmp_path):
+        results = self._runner(browsers=['chrome'], sessions=2).run()
+
+        report_file = KeywordSuiteRunner.generate_report(results, report_dir=str(tmp_path / "reports"))
+
+        with open(report_file, encoding='utf-8') as file:
+            content = file.read()
+        assert "2/4 passed" in content
+        assert "boom" in content
+
+    def test_data_workbooks_are_not_discovered(self, setup):
+        jobs = self._runner(browsers=['chrome']).discover()
+
+        assert 'test_data.xlsx' not in {os.path.basename(job.workbook) for job in jobs}
+        assert len(jobs) == 4
@@ -0,0 +1,133 @@
+# selenium_demoblaze_framework/tests/test_link_check_engine.py
+
+import pytest
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.link_check_engine import LinkCheckEngine
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the sites a page links to."""
+
+    hits = Counter()
+    hits_lock = threading.Lock()
+
+    def _record(self):
+        with self.hits_lock:
+            self.hits[(self.command, self.path)] += 1
+
+    def do_HEAD(self):
+        self._record()
+        if self.path == '/no-head':
+            self.send_response(405)
+        elif self.path == '/missing':
+            self.send_response(404)
+        else:
+            if self.path.startswith('/slow'):
+                time.sleep(0.5)
+            self.send_response(200)
+        self.end_headers()
+
+    def do_GET(self):
+        self._record()
+        self.send_response(404 if self.path == '/missing' else 200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass  # Keep test output clean
+
+
+class TestLinkCheckEngine:
+    @pytest.fixture
+    def setup(self):
+        _StubHandler.hits.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.engine = LinkCheckEngine(max_workers=8, per_host_limit=8, timeout=5)
+
+        yield
+
+        self.engine.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_statuses_match_single_url_contract(self, setup):
+        results = self.engine.check_urls([
+            f"{self.base_url}/ok",
+            f"{self.base_url}/missing",
+            "javascript:void(0)",
+            "ftp://example.com/file",
+        ])
+
+        assert results[f"{self.base_url}/ok"] == (False, 200, "OK")
+        assert results[f"{self.base_url}/missing"][:2] == (True, 404)
+        assert results["javascript:void(0)"] == (False, None, "Skipped (non-HTTP)")
+        assert results["ftp://example.com/file"] == (True, None, "Invalid URL scheme")
+
+    def test_head_rejected_falls_back_to_get(self, setup):
+        results = self.engine.check_urls([f"{self.base_url}/no-head"])
+
+        assert results[f"{self.base_url}/no-head"] == (False, 200, "OK")
+        assert _StubHandler.hits[('GET', '/no-head')] == 1
+
+    def test_duplicate_urls_are_requested_once(self, setup):
+        url = f"{self.base_url}/ok"
+
+        results = self.engine.check_urls([url, url, url])
+
+        assert list(results) == [url]
+        assert _StubHandler.hits[('HEAD', '/ok')] == 1
+
+    def test_urls_are_checked_concurrently(self, setup):
+        urls = [f"{self.base_url}/slow/{i}" for i in range(6)]
+
+        start = time.monotonic()
+        results = self.engine.check_urls(urls)
+        elapsed = time.monotonic() - start
+
+        assert all(not status[0] for status in results.values())
+        assert elapsed < 6 * 0.5 / 2, f"Checks ran serially ({elapsed:.2f}s)"
+
+    def test_per_host_limit_caps_concurrency(self, setup):
+        engine = LinkCheckEngine(max_workers=8, per_host_limit=1, timeout=5)
+        urls = [f"{self.base_url}/slow/{i}" for i in range(3)]
+
+        start = time.monotonic()
+        engine.check_urls(urls)
+        elapsed = time.monotonic() - start
+        engine.close()
+
+        assert elapsed >= 3 * 0.5 * 0.9, f"Host limit not enforced ({elapsed:.2f}s)"
+
+    def test_busy_host_does_not_hold_up_other_hosts(self, setup):
+        engine = LinkCheckEngine(max_workers=2, per_host_limit=1, timeout=5)
+        other_host = f"http://localhost:{self.server.server_port}/ok"
+        urls = [f"{self.base_url}/slow/{i}" for i in range(4)] + [other_host]
+        finished = {}
+        start = time.monotonic()
+        original = engine.check_url
+
+        def timed_check(url):
+            result = original(url)
+            finished[url] = time.monotonic() - start
+            return result
+
+        engine.check_url = timed_check
+        results = engine.check_urls(urls)
+        engine.close()
+
+        assert results[other_host] == (False, 200, "OK")
+        # Not queued behind the slow host's backlog: it ran alongside the first slow check
+        assert finished[other_host] < 0.5, f"Other host waited {finished[other_host]:.2f}s"
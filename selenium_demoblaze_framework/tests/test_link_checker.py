@@ -11,25 +11,16 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from selenium_demoblaze_framework.utilities.link_checker_utils import LinkCheckerUtils
-from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
-from selenium_demoblaze_framework.config.browser_config import BrowserConfig
 
 
 class TestLinkChecker:
     @pytest.fixture
-    def setup(self, request):  # ✅ ADDED: request parameter
-        self.logger = CustomLogger.get_logger(self.__class__.__name__)
-
-        # ✅ CRITICAL FIX: Get browser from pytest command line and pass it to BrowserConfig
-        browser = request.config.getoption("--browser")
-        self.logger.info(f"Initializing browser: {browser}")
-        self.browser_config = BrowserConfig(browser_name=browser)
-        self.driver = self.browser_config.get_driver()
+    def setup(self, driver, logger):
+        self.logger = logger
+        self.driver = driver
         self.link_checker = LinkCheckerUtils(self.driver, self.logger)
-
         yield
-
-        self.driver.quit()
+        self.link_checker.close()
 
     def test_check_all_links(self, setup):
         """Test checking all links with fallback sites."""
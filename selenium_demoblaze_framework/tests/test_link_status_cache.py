@@ -0,0 +1,148 @@
+# selenium_demoblaze_framework/tests/test_link_status_cache.py
+
+import pytest
+import os
+import sys
+import sqlite3
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.link_check_engine import LinkCheckEngine
+from selenium_demoblaze_framework.utilities.link_status_cache import LinkStatusCache
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class _RevalidatingHandler(BaseHTTPRequestHandler):
+    """Serves /page with an ETag and answers matching conditional requests with 304."""
+
+    ETAG = '"v1"'
+    NEW_ETAG = '"v2"'
+    hits = Counter()
+    conditional_hits = Counter()
+    hits_lock = threading.Lock()
+
+    def do_HEAD(self):
+        with self.hits_lock:
+            self.hits[self.path] += 1
+            if self.headers.get('If-None-Match'):
+                self.conditional_hits[self.path] += 1
+
+        if self.path == '/missing':
+            self.send_response(404)
+        elif self.path in ('/busy', '/throttled'):
+            self.send_response(503 if self.path == '/busy' else 429)
+        elif self.headers.get('If-None-Match') == self.ETAG:
+            self.send_response(304)
+            if self.path == '/rotating':
+                self.send_header('ETag', self.NEW_ETAG)
+        else:
+            self.send_response(200)
+            self.send_header('ETag', self.ETAG)
+        self.end_headers()
+
+    do_GET = do_HEAD
+
+    def log_message(self, format, *args):
+        pass  # Keep test output clean
+
+
+class TestLinkStatusCache:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        _RevalidatingHandler.hits.clear()
+        _RevalidatingHandler.conditional_hits.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _RevalidatingHandler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.db_path = str(tmp_path / "link_status.sqlite")
+
+        yield
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fresh_entries_skip_the_network(self, setup):
+        url = f"{self.base_url}/page"
+        LinkCheckEngine(cache=LinkStatusCache(self.db_path)).check_urls([url])
+
+        # A second engine stands in for another xdist worker sharing the file
+        results = LinkCheckEngine(cache=LinkStatusCache(self.db_path)).check_urls([url])
+
+        assert results[url] == (False, 200, "OK")
+        assert _RevalidatingHandler.hits['/page'] == 1
+
+    def test_stale_entries_are_revalidated_conditionally(self, setup):
+        url = f"{self.base_url}/page"
+        cache = LinkStatusCache(self.db_path, ttl=0)
+        engine = LinkCheckEngine(cache=cache)
+
+        engine.check_urls([url])
+        results = engine.check_urls([url])
+
+        assert results[url] == (False, 200, "OK")
+        assert _RevalidatingHandler.conditional_hits['/page'] == 1
+        assert cache.get(url)['etag'] == _RevalidatingHandler.ETAG
+
+    def test_broken_links_are_cached_too(self, setup):
+        url = f"{self.base_url}/missing"
+        cache = LinkStatusCache(self.db_path)
+
+        LinkCheckEngine(cache=cache).check_urls([url])
+        first_run_hits = _RevalidatingHandler.hits['/missing']
+        results = LinkCheckEngine(cache=cache).check_urls([url])
+
+        assert results[url][:2] == (True, 404)
+        assert _RevalidatingHandler.hits['/missing'] == first_run_hits
+
+    def test_connection_errors_are_not_cached(self, setup):
+        cache = LinkStatusCache(self.db_path)
+        url = "http://127.0.0.1:1/unreachable"
+
+        status = LinkCheckEngine(cache=cache, timeout=2).check_url(url)
+
+        assert status == (True, None, "Connection Error")
+        assert cache.get(url) is None
+
+    def test_urls_are_normalized(self, setup):
+        assert (LinkStatusCache.normalize_url("HTTPS://Example.COM:443#top")
+                == LinkStatusCache.normalize_url("https://example.com/"))
+        assert LinkStatusCache.normalize_url("http://example.com:8080/a?b=1") == "http://example.com:8080/a?b=1"
+
+    def test_transient_errors_are_not_cached(self, setup):
+        cache = LinkStatusCache(self.db_path)
+        engine = LinkCheckEngine(cache=cache)
+
+        results = engine.check_urls([f"{self.base_url}/busy", f"{self.base_url}/throttled"])
+
+        assert results[f"{self.base_url}/busy"][:2] == (True, 503)
+        assert results[f"{self.base_url}/throttled"][:2] == (True, 429)
+        assert cache.get(f"{self.base_url}/busy") is None
+        assert cache.get(f"{self.base_url}/throttled") is None
+
+    def test_revalidation_stores_new_validators(self, setup):
+        url = f"{self.base_url}/rotating"
+        cache = LinkStatusCache(self.db_path, ttl=0)
+        engine = LinkCheckEngine(cache=cache)
+
+        engine.check_urls([url])
+        results = engine.check_urls([url])
+
+        assert results[url] == (False, 200, "OK")
+        assert cache.get(url)['etag'] == _RevalidatingHandler.NEW_ETAG
+
+    def test_closing_the_engine_closes_every_cache_connection(self, setup):
+        cache = LinkStatusCache(self.db_path)
+        with LinkCheckEngine(cache=cache, max_workers=4) as engine:
+            engine.check_urls([f"{self.base_url}/page", f"{self.base_url}/other", f"{self.base_url}/missing"])
+            connections = list(cache._connections)
+
+        assert len(connections) > 1  # the main thread's plus the workers'
+        for connection in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+        assert cache._connections == []
+        assert cache.get(f"{self.base_url}/page")['status_code'] == 200  # reopens on demand
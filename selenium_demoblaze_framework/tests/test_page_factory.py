@@ -482,34 +482,23 @@ from selenium.webdriver.support.wait import WebDriverWait
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from selenium_demoblaze_framework.pages.home_page_factory import HomePageFactory
-from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
-from selenium_demoblaze_framework.config.browser_config import BrowserConfig
 
 
 class TestPageFactory:
     @pytest.fixture
-    def setup(self, request):  # ✅ ADDED: request parameter
+    def setup(self, driver, logger, base_url):
         """Setup test fixture"""
-        self.logger = CustomLogger.get_logger(self.__class__.__name__)
-
-        # ✅ CRITICAL FIX: Get browser from pytest command line and pass it to BrowserConfig
-        browser = request.config.getoption("--browser")
-        self.logger.info(f"Initializing browser: {browser}")
-        self.browser_config = BrowserConfig(browser_name=browser)
-        self.driver = self.browser_config.get_driver()
+        self.logger = logger
+        self.driver = driver
         self.driver.maximize_window()
         self.home_page = HomePageFactory(self.driver, self.logger)
 
-        self.driver.get("https://www.demoblaze.com")
+        self.driver.get(base_url)
         time.sleep(3)  # Wait for page to fully load
 
+        # Tests may quit the session themselves; the `driver` fixture replaces dead drivers
         yield
 
-        try:
-            self.driver.quit()
-        except:
-            pass  # Driver already closed
-
     # ========================================
     # NEW TEST - Pure Page Factory Logo Click
     # ========================================
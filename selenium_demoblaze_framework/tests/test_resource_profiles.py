@@ -0,0 +1,101 @@
+# selenium_demoblaze_framework/tests/test_resource_profiles.py
+
+import pytest
+import os
+import sys
+from selenium.common.exceptions import WebDriverException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.config.browser_config import BrowserConfig
+from selenium_demoblaze_framework.config.driver_pool import DriverPool
+from selenium_demoblaze_framework.config.resource_profiles import ResourceProfiles
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class CdpDriver:
+    """Records CDP commands like a Chromium session would receive them."""
+
+    def __init__(self, supported=True):
+        self.supported = supported
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        if not self.supported:
+            raise WebDriverException("CDP not available")
+        self.commands.append((command, params))
+        return {}
+
+    def quit(self):
+        pass
+
+
+class TestResourceProfiles:
+    """Request-blocking presets, browser options and the resource_profile marker"""
+
+    @pytest.fixture
+    def setup(self, monkeypatch):
+        monkeypatch.delenv(ResourceProfiles.ENV_VAR, raising=False)
+        yield
+
+    def test_presets(self, setup):
+        assert ResourceProfiles.current() == 'none'
+        assert ResourceProfiles.get('none')['block'] == []
+        assert '*.mp4' in ResourceProfiles.get('no-media')['block']
+        assert '*.png' not in ResourceProfiles.get('no-third-party')['block']
+        text_only = ResourceProfiles.get('Text-Only')['block']
+        assert {'*.png', '*.woff2', '*.mp4', '*google-analytics.com*'} <= set(text_only)
+        assert {'none', 'no-media', 'no-third-party', 'text-only'} <= set(ResourceProfiles.names())
+
+    def test_unknown_profile(self, setup):
+        with pytest.raises(ValueError, match='Unknown resource profile'):
+            ResourceProfiles.get('everything-off')
+        # DEFAULT options of config.ini are not profiles
+        with pytest.raises(ValueError):
+            ResourceProfiles.get('base_url')
+
+    def test_apply_sets_blocked_urls_over_cdp(self, setup):
+        driver = CdpDriver()
+        assert ResourceProfiles.apply(driver, 'no-media') is True
+        assert driver.commands[0] == ('Network.enable', {})
+        assert driver.commands[1] == ('Network.setBlockedURLs', {'urls': ResourceProfiles.get('no-media')['block']})
+
+        assert ResourceProfiles.apply(driver, 'none') is True
+        assert driver.commands[-1] == ('Network.setBlockedURLs', {'urls': []})
+
+    def test_apply_without_cdp(self, setup):
+        assert ResourceProfiles.apply(CdpDriver(supported=False), 'text-only') is False
+        assert ResourceProfiles.apply(object(), 'text-only') is False
+
+    def test_browser_options(self, setup):
+        chrome = BrowserConfig('chrome', resource_profile='text-only').get_chrome_options()
+        assert chrome.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+        assert '--autoplay-policy=user-gesture-required' in chrome.arguments
+
+        edge = BrowserConfig('edge', resource_profile='no-media').get_edge_options()
+        assert '--autoplay-policy=user-gesture-required' in edge.arguments
+        assert 'profile.managed_default_content_settings.images' not in edge.experimental_options['prefs']
+
+        firefox = BrowserConfig('firefox', resource_profile='text-only').get_firefox_options()
+        assert firefox.preferences['permissions.default.image'] == 2
+        assert firefox.preferences['privacy.trackingprotection.enabled'] is True
+
+        plain = BrowserConfig('chrome').get_chrome_options()
+        assert '--autoplay-policy=user-gesture-required' not in plain.arguments
+
+    def test_invalid_profile_fails_fast(self, setup):
+        with pytest.raises(ValueError):
+            BrowserConfig('chrome', resource_profile='typo')
+
+    def test_pool_carries_profile(self, setup):
+        pool = DriverPool('chrome', size=1, factory=CdpDriver, resource_profile='no-third-party')
+        try:
+            assert pool.resource_profile == 'no-third-party'
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.resource_profile('text-only')
+    def test_marker_exports_profile(self):
+        assert ResourceProfiles.current() == 'text-only'
+        assert BrowserConfig('chrome').resource_profile == 'text-only'
@@ -0,0 +1,195 @@
+# selenium_demoblaze_framework/tests/test_screenshot_service.py
+
+import pytest
+import os
+import sys
+import io
+import base64
+import threading
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.screenshot_service import ScreenshotService
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+def make_png(color=(200, 30, 30), size=(400, 200)):
+    output = io.BytesIO()
+    Image.new('RGB', size, color).save(output, 'PNG')
+    return output.getvalue()
+
+
+class FakeDriver:
+    """Stands in for a WebDriver: counts captures and returns fixed PNG bytes."""
+
+    def __init__(self, png):
+        self.png = png
+        self.captures = 0
+
+    def get_screenshot_as_png(self):
+        self.captures += 1
+        return self.png
+
+
+class TestScreenshotService:
+    """Background encoding, format conversion and de-duplication"""
+
+    @pytest.fixture
+    def setup(self, tmp_path):
+        services = []
+
+        def create(**options):
+            service = ScreenshotService(directory=str(tmp_path / "screenshots"), **options)
+            services.append(service)
+            return service
+
+        yield create
+        for service in services:
+            service.shutdown()
+
+    def test_capture_grabs_once_and_writes_in_background(self, setup):
+        service = setup(image_format='png')
+        driver = FakeDriver(make_png())
+        written_by = []
+        original = service._write
+        service._write = lambda png, path: (written_by.append(threading.current_thread().name),
+                                            original(png, path))[1]
+
+        path = service.capture(driver, 'home')
+
+        assert driver.captures == 1
+        assert os.path.basename(path).startswith('home_')
+        assert path.endswith('.png')
+        assert service.flush(timeout=10)
+        with open(path, 'rb') as f:
+            assert f.read() == driver.png
+        assert written_by[0].startswith('screenshot')
+
+    @pytest.mark.parametrize('image_format, pil_format, extension', [
+        ('jpeg', 'JPEG', '.jpg'),
+        ('jpg', 'JPEG', '.jpg'),
+        ('webp', 'WEBP', '.webp'),
+    ])
+    def test_conversion_and_downscale(self, setup, image_format, pil_format, extension):
+        service = setup(image_format=image_format, max_width=100, quality=70)
+        path = service.submit(make_png(), 'converted')
+        service.flush(timeout=10)
+
+        assert path.endswith(extension)
+        with Image.open(path) as image:
+            assert image.format == pil_format
+            assert image.size == (100, 50)
+
+    def test_identical_frames_are_written_once(self, setup):
+        service = setup()
+        first = service.submit(make_png(), 'same')
+        second = service.submit(make_png(), 'same_again')
+        other = service.submit(make_png(color=(0, 0, 255)), 'different')
+        service.flush(timeout=10)
+
+        assert first == second
+        assert other != first
+        assert sorted(os.listdir(os.path.dirname(first))) == sorted([os.path.basename(first),
+                                                                     os.path.basename(other)])
+
+    def test_dedupe_can_be_disabled(self, setup):
+        service = setup(dedupe=False)
+        assert service.submit(make_png(), 'a') != service.submit(make_png(), 'a')
+
+    def test_failed_write_is_logged_not_raised(self, setup):
+        service = setup(image_format='jpeg')
+        path = service.submit(b'not an image', 'broken')
+        assert service.flush(timeout=10)
+        assert not os.path.exists(path)
+        # The failed frame is forgotten, so a retry is written again
+        assert service.submit(b'not an image', 'broken') != path
+
+    def test_unknown_format(self, setup):
+        with pytest.raises(ValueError):
+            setup(image_format='gif')
+
+    def test_file_extension_in_name_is_not_doubled(self, setup):
+        service = setup(image_format='jpeg', dedupe=False)
+        assert os.path.basename(service.submit(make_png(), 'login.png')).startswith('login_')
+        assert service.submit(make_png(), 'login.png').endswith('.jpg')
+        assert '.png' not in os.path.basename(service.submit(make_png(), 'cart.PNG'))
+        assert os.path.basename(service.submit(make_png(), 'v1.2_home')).startswith('v1.2_home_')
+
+
+class FakePage:
+    """A scrollable page rendered from one tall image; screenshots are device-pixel crops."""
+
+    def __init__(self, width=200, height=530, viewport_height=200, ratio=1):
+        self.page = Image.new('RGB', (width * ratio, height * ratio))
+        for y in range(height * ratio):
+            for x in range(0, width * ratio, 50):
+                self.page.putpixel((x, y), ((y // ratio) % 256, 0, 0))
+        self.width, self.height, self.viewport_height, self.ratio = width, height, viewport_height, ratio
+        self.scroll_y = 0
+        self.captures = 0
+
+    def execute_script(self, script, *args):
+        if script.startswith("var d"):
+            return [self.height, self.width, self.viewport_height, 0, self.scroll_y]
+        if script.startswith("window.scrollTo(0"):
+            self.scroll_y = max(0, min(args[0], self.height - self.viewport_height))
+        elif script.startswith("window.scrollTo(arguments[0]"):
+            self.scroll_y = args[1]
+        elif script == "return window.scrollY;":
+            return self.scroll_y
+
+    def get_screenshot_as_png(self):
+        self.captures += 1
+        top = self.scroll_y * self.ratio
+        tile = self.page.crop((0, top, self.page.width, top + self.viewport_height * self.ratio))
+        output = io.BytesIO()
+        tile.save(output, 'PNG')
+        return output.getvalue()
+
+
+class TestFullPageScreenshot:
+    """Full-page capture: CDP, Firefox API and the stitching fallback"""
+
+    def test_chromium_uses_one_cdp_capture(self):
+        calls = []
+        png = make_png()
+
+        class ChromiumDriver:
+            def execute_cdp_cmd(self, command, params):
+                calls.append((command, params))
+                if command == 'Page.getLayoutMetrics':
+                    return {'cssContentSize': {'width': 400, 'height': 3000}}
+                return {'data': base64.b64encode(png).decode()}
+
+            def get_screenshot_as_png(self):
+                raise AssertionError("viewport capture should not be used")
+
+        assert ScreenshotService.full_page_png(ChromiumDriver()) == png
+        command, params = calls[-1]
+        assert command == 'Page.captureScreenshot'
+        assert params['captureBeyondViewport'] is True
+        assert params['clip']['height'] == 3000
+
+    def test_firefox_uses_native_full_page_api(self):
+        png = make_png()
+
+        class FirefoxDriver:
+            def get_full_page_screenshot_as_png(self):
+                return png
+
+        assert ScreenshotService.full_page_png(FirefoxDriver()) == png
+
+    @pytest.mark.parametrize('ratio', [1, 2])
+    def test_stitching_fallback_handles_partial_viewport_and_hidpi(self, ratio):
+        page = FakePage(ratio=ratio)
+        page.scroll_y = 40
+
+        result = Image.open(io.BytesIO(ScreenshotService.full_page_png(page)))
+
+        assert result.size == page.page.size
+        assert list(result.getdata()) == list(page.page.getdata())
+        # 530px page / 200px viewport: 0, 200 and the clamped last tile at 330
+        assert page.captures == 3
+        assert page.scroll_y == 40
@@ -0,0 +1,155 @@
+# selenium_demoblaze_framework/tests/test_session_cache.py
+
+import pytest
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.session_cache import SessionCache, SessionExpiredError
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+BASE_URL = 'https://www.demoblaze.com'
+
+
+class FakeSite:
+    """Server side: which auth tokens are still accepted."""
+
+    def __init__(self):
+        self.valid_tokens = set()
+        self.logins = 0
+
+
+class FakeBrowser:
+    """Just enough WebDriver for cookies, localStorage and the navbar greeting."""
+
+    def __init__(self, site):
+        self.site = site
+        self.current_url = 'about:blank'
+        self.cookies = {}
+        self.storage = {}
+        self.visits = []
+        self.refreshes = 0
+
+    def get(self, url):
+        self.current_url = url
+        self.visits.append(url)
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def get_cookies(self):
+        return list(self.cookies.values())
+
+    def get_cookie(self, name):
+        return self.cookies.get(name)
+
+    def add_cookie(self, cookie):
+        assert self.current_url.startswith(BASE_URL), "cookies need the site loaded first"
+        self.cookies[cookie['name']] = dict(cookie)
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def execute_script(self, script, *args):
+        if 'setItem' in script:
+            self.storage = dict(args[0])
+            return None
+        return dict(self.storage)
+
+    def find_element(self, by, value):
+        token = self.cookies.get('tokenp_', {}).get('value')
+        logged_in = value == 'nameofuser' and token in self.site.valid_tokens
+        return SimpleNamespace(text='Welcome testuser' if logged_in else '')
+
+
+class TestSessionCache:
+    """Log in once, restore the session everywhere else"""
+
+    @pytest.fixture
+    def setup(self):
+        SessionCache.invalidate()
+        self.site = FakeSite()
+
+        def login(driver, username, password):
+            self.site.logins += 1
+            token = f"{username}-token-{self.site.logins}"
+            self.site.valid_tokens.add(token)
+            driver.get(BASE_URL)
+            driver.cookies['tokenp_'] = {'name': 'tokenp_', 'value': token, 'path': '/',
+                                         'expiry': time.time() + 3600}
+            driver.storage['cart'] = 'item-1'
+
+        yield lambda **kwargs: SessionCache(base_url=BASE_URL, login=login, **kwargs)
+        SessionCache.invalidate()
+
+    def test_second_driver_is_restored_without_login(self, setup):
+        cache = setup()
+        first, second = FakeBrowser(self.site), FakeBrowser(self.site)
+
+        assert cache.login(first, 'testuser', 'secret') == 'logged_in'
+        assert cache.login(second, 'testuser', 'secret') == 'restored'
+
+        assert self.site.logins == 1
+        assert second.visits == [BASE_URL]
+        assert second.cookies['tokenp_']['value'] == first.cookies['tokenp_']['value']
+        assert isinstance(second.cookies['tokenp_']['expiry'], int)
+        assert second.storage == {'cart': 'item-1'}
+        assert second.refreshes == 1
+
+    def test_sessions_are_kept_per_user(self, setup):
+        cache = setup()
+        cache.login(FakeBrowser(self.site), 'alice', 'secret')
+        assert cache.login(FakeBrowser(self.site), 'bob', 'secret') == 'logged_in'
+        assert self.site.logins == 2
+
+    def test_revoked_token_falls_back_to_ui_login(self, setup):
+        cache = setup()
+        cache.login(FakeBrowser(self.site), 'testuser', 'secret')
+        self.site.valid_tokens.clear()
+
+        driver = FakeBrowser(self.site)
+        assert cache.login(driver, 'testuser', 'secret') == 'logged_in'
+        assert self.site.logins == 2
+        assert driver.cookies['tokenp_']['value'] in self.site.valid_tokens
+
+    def test_expiry_detection(self, setup):
+        cache = setup(ttl=60)
+        driver = FakeBrowser(self.site)
+        cache.login(driver, 'testuser', 'secret')
+        snapshot = cache.snapshot(driver)
+        now = snapshot['captured_at']
+
+        assert cache.is_expired(snapshot, now=now + 30) is False
+        assert cache.is_expired(snapshot, now=now + 61) is True
+
+        snapshot['cookies'][0]['expiry'] = now + 10
+        assert cache.is_expired(snapshot, now=now + 11) is True
+        assert cache.is_expired(dict(snapshot, cookies=[]), now=now) is True
+
+    def test_expired_snapshot_is_not_restored(self, setup):
+        cache = setup(ttl=1)
+        cache.login(FakeBrowser(self.site), 'testuser', 'secret')
+        for snapshot in SessionCache._sessions.values():
+            snapshot['captured_at'] -= 5
+
+        assert cache.login(FakeBrowser(self.site), 'testuser', 'secret') == 'logged_in'
+        assert self.site.logins == 2
+
+    def test_login_without_auth_cookie_raises(self, setup):
+        cache = SessionCache(base_url=BASE_URL, login=lambda driver, username, password: driver.get(BASE_URL))
+        with pytest.raises(SessionExpiredError):
+            cache.login(FakeBrowser(self.site), 'testuser', 'secret')
+        assert SessionCache._sessions == {}
+
+    def test_invalidate(self, setup):
+        cache = setup()
+        cache.login(FakeBrowser(self.site), 'alice', 'secret')
+        cache.login(FakeBrowser(self.site), 'bob', 'secret')
+
+        SessionCache.invalidate('alice')
+        assert cache.login(FakeBrowser(self.site), 'alice', 'secret') == 'logged_in'
+        assert cache.login(FakeBrowser(self.site), 'bob', 'secret') == 'restored'
@@ -0,0 +1,130 @@
+# selenium_demoblaze_framework/tests/test_timing_profiles.py
+
+import pytest
+import os
+import sys
+import time
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.config.browser_config import BrowserConfig
+from selenium_demoblaze_framework.config.driver_pool import DriverPool
+from selenium_demoblaze_framework.config.timing_profiles import TimingProfiles
+from selenium_demoblaze_framework.pages.base_page import BasePage
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+
+class TimedDriver:
+    """Records the timeouts BrowserConfig sets; never finds an element."""
+
+    def __init__(self):
+        self.implicit_wait = None
+        self.page_load_timeout = None
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def set_page_load_timeout(self, seconds):
+        self.page_load_timeout = seconds
+
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+    def quit(self):
+        pass
+
+
+class TestTimingProfiles:
+    """Timing profiles: presets, browser options, driver tagging and BasePage waits"""
+
+    @pytest.fixture
+    def setup(self, monkeypatch):
+        monkeypatch.delenv(TimingProfiles.ENV_VAR, raising=False)
+        yield CustomLogger.get_logger(self.__class__.__name__)
+
+    def test_default_profile_keeps_previous_behaviour(self, setup):
+        profile = TimingProfiles.get()
+        assert profile.name == 'resilient'
+        assert (profile.page_load_strategy, profile.implicit_wait, profile.page_load_timeout,
+                profile.explicit_wait) == ('normal', 10, 60, 20)
+
+    def test_fast_profile(self, setup):
+        profile = TimingProfiles.get('FAST')
+        assert profile.page_load_strategy == 'eager'
+        assert profile.implicit_wait == 0
+        assert profile.explicit_wait < TimingProfiles.get('resilient').explicit_wait
+        assert {'fast', 'resilient'} <= set(TimingProfiles.names())
+
+    def test_unknown_profile(self, setup):
+        with pytest.raises(ValueError, match='Unknown timing profile'):
+            TimingProfiles.get('turbo')
+
+    def test_options_use_page_load_strategy(self, setup):
+        assert BrowserConfig('chrome', timing_profile='fast').get_chrome_options().page_load_strategy == 'eager'
+        assert BrowserConfig('edge', timing_profile='fast').get_edge_options().page_load_strategy == 'eager'
+        assert BrowserConfig('firefox').get_firefox_options().page_load_strategy == 'normal'
+
+    def test_driver_is_configured_and_tagged(self, setup):
+        driver = TimedDriver()
+        BrowserConfig('chrome', timing_profile='fast')._apply_timing_profile(driver)
+
+        assert driver.implicit_wait == 0
+        assert driver.page_load_timeout == TimingProfiles.get('fast').page_load_timeout
+        assert TimingProfiles.for_driver(driver).name == 'fast'
+
+    def test_base_page_uses_driver_profile(self, setup):
+        driver = TimedDriver()
+        driver.timing_profile = 'fast'
+        page = BasePage(driver, setup)
+        assert page.timeout == TimingProfiles.get('fast').explicit_wait
+        assert BasePage(TimedDriver(), setup).timeout == TimingProfiles.get('resilient').explicit_wait
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutException):
+            page.find_element((By.ID, 'missing'), timeout=0.3)
+        assert time.monotonic() - start < 2
+
+    def test_pools_are_keyed_by_profile(self, setup):
+        pool = DriverPool('chrome', size=1, factory=TimedDriver, timing_profile='fast')
+        try:
+            assert pool.timing_profile == 'fast'
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.timing_profile('fast')
+    def test_marker_exports_profile(self):
+        assert TimingProfiles.current() == 'fast'
+        assert BrowserConfig('chrome').timing.page_load_strategy == 'eager'
+
+    def test_omitted_keys_keep_preset_not_default_section(self, setup, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[DEFAULT]\nimplicit_wait = 7\nexplicit_wait = 33\npage_load_timeout = 99\n\n"
+                               "[TIMING.fast]\npage_load_timeout = 15\n\n"
+                               "[TIMING.custom]\npage_load_strategy = none\n")
+        read_config = TimingProfiles._config
+        monkeypatch.setattr(TimingProfiles, '_config', staticmethod(lambda: read_config(str(config_file))))
+
+        fast = TimingProfiles.get('fast')
+        assert (fast.implicit_wait, fast.page_load_timeout, fast.explicit_wait) == (0, 15, 10)
+        custom = TimingProfiles.get('custom')
+        assert custom.page_load_strategy == 'none'
+        assert (custom.implicit_wait, custom.page_load_timeout, custom.explicit_wait) == (10, 60, 20)
+        assert 'DEFAULT' not in ' '.join(TimingProfiles.names())
+
+    def test_config_is_parsed_once_until_the_file_changes(self, setup, tmp_path):
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[TIMING.fast]\nexplicit_wait = 5\n")
+
+        first = TimingProfiles._config(str(config_file))
+        assert TimingProfiles._config(str(config_file)) is first
+
+        config_file.write_text("[TIMING.fast]\nexplicit_wait = 6\n")
+        modified = os.path.getmtime(config_file) + 10
+        os.utime(config_file, (modified, modified))
+        reread = TimingProfiles._config(str(config_file))
+        assert reread is not first
+        assert reread.getfloat('TIMING.fast', 'explicit_wait') == 6
@@ -0,0 +1,77 @@
+# selenium_demoblaze_framework/tests/test_xml_utils.py
+
+import pytest
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium_demoblaze_framework.utilities.xml_utils import XMLUtils
+
+pytestmark = pytest.mark.usefixtures("isolated_workdir")
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+XSD = """<?xml version="1.0"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+  <xs:element name="testdata">
+    <xs:complexType>
+      <xs:sequence>
+        <xs:element name="testcase" maxOccurs="unbounded">
+          <xs:complexType>
+            <xs:sequence>
+              <xs:element name="username" type="xs:string"/>
+              <xs:element name="password" type="xs:string"/>
+            </xs:sequence>
+          </xs:complexType>
+        </xs:element>
+      </xs:sequence>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>
+"""
+
+
+class TestXMLUtils:
+    @pytest.fixture
+    def setup(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.xml_path = str(tmp_path / "users.xml")
+        XMLUtils.write_xml_data(self.xml_path, [{'username': f"user{i}", 'password': 'Test@123'}
+                                                for i in range(2000)])
+        self.xsd_path = str(tmp_path / "users.xsd")
+        with open(self.xsd_path, 'w', encoding='utf-8') as file:
+            file.write(XSD)
+
+    def test_iter_xml_data_streams_testcases(self, setup):
+        rows = XMLUtils.iter_xml_data(self.xml_path)
+
+        assert isinstance(rows, types.GeneratorType)
+        assert next(rows) == {'username': 'user0', 'password': 'Test@123'}
+        assert sum(1 for _ in rows) == 1999
+
+    def test_read_xml_data_matches_existing_file(self, setup):
+        data = XMLUtils.read_xml_data(os.path.join(DATA_DIR, 'test_data.xml'))
+
+        assert data[0] == {'username': 'testuser1', 'password': 'Test@123',
+                           'product': 'Samsung galaxy s6', 'category': 'Phones'}
+
+    def test_xpath_query_supports_full_xpath(self, setup):
+        assert XMLUtils.xpath_query(self.xml_path, "testcase[username='user7']/password") == ['Test@123']
+        assert XMLUtils.xpath_query(self.xml_path, "count(testcase)") == ['2000.0']
+        # Same expression again comes from the compiled cache
+        assert XMLUtils._compiled_xpath("count(testcase)") is XMLUtils._compiled_xpath("count(testcase)")
+
+    def test_schema_is_compiled_once(self, setup):
+        assert XMLUtils.validate_xml(self.xml_path, self.xsd_path)
+        schema, _ = XMLUtils._compiled_schema(self.xsd_path)
+
+        assert XMLUtils.validate_xml(self.xml_path, self.xsd_path)
+        assert XMLUtils._compiled_schema(self.xsd_path)[0] is schema
+
+    def test_invalid_document_fails_validation(self, setup):
+        bad_path = str(self.tmp_path / "bad.xml")
+        XMLUtils.write_xml_data(bad_path, [{'username': 'user1'}])
+
+        assert not XMLUtils.validate_xml(bad_path, self.xsd_path)
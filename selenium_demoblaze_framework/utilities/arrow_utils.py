@@ -0,0 +1,170 @@
+# utilities/arrow_utils.py
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import os
+from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
+from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
+from selenium_demoblaze_framework.utilities.xml_utils import XMLUtils
+
+
+class ArrowUtils:
+    """
+    Columnar test data: Parquet files and Arrow IPC (.arrow / .feather) files.
+
+    Reads are memory-mapped, only the requested columns are decoded, and filters
+    are pushed down to the Parquet reader so row groups whose statistics cannot
+    match are skipped. Results use the same list-of-dicts shape as the other
+    *Utils readers.
+    """
+
+    ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+
+    @staticmethod
+    def read_parquet_data(file_path, columns=None, filters=None):
+        """
+        Read a Parquet file into a list of dictionaries.
+        Parameters:
+            file_path (str): Path to the .parquet file.
+            columns (list, optional): Only read these columns.
+            filters (dict or list, optional): {column: value} equality filters, or
+                pyarrow filter tuples such as [('price', '>', 500)].
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+
+        table = pq.read_table(file_path, columns=columns, filters=ArrowUtils._expression(filters),
+                              memory_map=True)
+        return table.to_pylist()
+
+    @staticmethod
+    def iter_parquet_data(file_path, columns=None, filters=None, batch_size=10000):
+        """Yield rows of a Parquet file as dictionaries, decoding one record batch at a time."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+
+        dataset = ds.dataset(file_path, format='parquet')
+        for batch in dataset.to_batches(columns=columns, filter=ArrowUtils._expression(filters),
+                                        batch_size=batch_size):
+            yield from batch.to_pylist()
+
+    @staticmethod
+    def read_arrow_data(file_path, columns=None, filters=None):
+        """
+        Read an Arrow IPC file into a list of dictionaries.
+        The file is memory-mapped, so unused columns are never read from disk.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Arrow file not found: {file_path}")
+
+        with pa.memory_map(file_path, 'r') as source:
+            table = ipc.open_file(source).read_all()
+        expression = ArrowUtils._expression(filters)
+        if expression is not None:
+            table = table.filter(expression)
+        if columns:
+            table = table.select(columns)
+        return table.to_pylist()
+
+    @staticmethod
+    def read_data(file_path, columns=None, filters=None):
+        """Read a .parquet or Arrow IPC file, chosen by extension."""
+        if file_path.lower().endswith(ArrowUtils.ARROW_EXTENSIONS):
+            return ArrowUtils.read_arrow_data(file_path, columns, filters)
+        return ArrowUtils.read_parquet_data(file_path, columns, filters)
+
+    @staticmethod
+    def write_parquet_data(file_path, data, compression='zstd', row_group_size=64 * 1024):
+        """
+        Write a list of dictionaries to a Parquet file.
+        Smaller row groups make filter push-down skip more data on large files.
+        """
+        table = ArrowUtils.to_table(data)
+        os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
+        pq.write_table(table, file_path, compression=compression, row_group_size=row_group_size)
+
+    @staticmethod
+    def write_arrow_data(file_path, data):
+        """Write a list of dictionaries to an uncompressed Arrow IPC file (fastest to memory-map)."""
+        table = ArrowUtils.to_table(data)
+        os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
+        with pa.OSFile(file_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def to_table(data):
+        """Build an Arrow table from a list of dictionaries; mixed-type columns are stored as strings."""
+        if not data:
+            raise ValueError("No data provided to write.")
+        try:
+            return pa.Table.from_pylist(data)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.Table.from_pylist([
+                {key: None if value is None else str(value) for key, value in row.items()} for row in data
+            ])
+
+    @staticmethod
+    def convert_to_parquet(source_path, output_dir=None):
+        """
+        Convert a CSV, Excel, JSON or XML test-data file to Parquet.
+        Output names keep the source format, so test_data.csv and test_data.xml don't
+        collide: test_data_csv.parquet. Excel files produce one file per sheet and JSON
+        objects one file per top-level list (test_data_xlsx.Users.parquet,
+        test_data_json.products.parquet). Returns the list of files written.
+        """
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Test data file not found: {source_path}")
+
+        output_dir = output_dir or os.path.dirname(source_path) or '.'
+        stem, extension = os.path.splitext(os.path.basename(source_path))
+        extension = extension.lower()
+
+        if extension == '.csv':
+            datasets = {None: CSVUtils.read_csv_data(source_path)}
+        elif extension in ('.xlsx', '.xlsm'):
+            from openpyxl import load_workbook
+            workbook = load_workbook(source_path, read_only=True)
+            sheet_names = workbook.sheetnames
+            workbook.close()
+            datasets = {sheet: ExcelUtils.read_excel_data(source_path, sheet) for sheet in sheet_names}
+        elif extension == '.json':
+            content = JSONUtils.read_json_data(source_path)
+            if isinstance(content, list):
+                datasets = {None: content}
+            else:
+                datasets = {key: value for key, value in content.items() if isinstance(value, list)}
+        elif extension == '.xml':
+            datasets = {None: XMLUtils.read_xml_data(source_path)}
+        else:
+            raise ValueError(f"Unsupported test data format: {extension}")
+
+        written = []
+        for name, rows in datasets.items():
+            if not rows:
+                continue
+            base_name = f"{stem}_{extension.lstrip('.')}"
+            file_name = f"{base_name}.parquet" if name is None else f"{base_name}.{name}.parquet"
+            output_path = os.path.join(output_dir, file_name)
+            ArrowUtils.write_parquet_data(output_path, rows)
+            written.append(output_path)
+        return written
+
+    @staticmethod
+    def _expression(filters):
+        """Turn {column: value} into a pyarrow expression; other filter forms pass through."""
+        if not filters:
+            return None
+        if isinstance(filters, dict):
+            expression = None
+            for column, value in filters.items():
+                condition = pc.field(column) == value
+                expression = condition if expression is None else expression & condition
+            return expression
+        if isinstance(filters, list):
+            return pq.filters_to_expression(filters)
+        return filters
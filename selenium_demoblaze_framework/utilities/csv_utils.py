@@ -3,24 +3,155 @@
 import csv
 import pandas as pd
 import os
+import itertools
 
 
 class CSVUtils:
+    TRUE_VALUES = ('true', 'yes', 'y', '1')
+    FALSE_VALUES = ('false', 'no', 'n', '0')
+
+    ENGINES = ('csv', 'pandas', 'pyarrow')
+
     @staticmethod
-    def read_csv_data(file_path):
+    def read_csv_data(file_path, schema=None):
         """
         Read data from a CSV file using Python's built-in csv module.
         Returns a list of dictionaries, where each dictionary represents a row.
+        Values are strings unless a schema is given (see iter_csv_rows()).
+        """
+        return list(CSVUtils.iter_csv_rows(file_path, schema=schema))
+
+    @staticmethod
+    def iter_csv_rows(file_path, schema=None, columns=None, engine='csv', chunk_size=10000):
+        """
+        Lazily yield the rows of a CSV file as dictionaries.
+        Parameters:
+            file_path (str): Path to the CSV file.
+            schema (dict, optional): {column: type or callable}. Types are int, float,
+                bool and str (or their names); empty cells in int/float/bool columns
+                become None. A callable gets the raw string. Other columns stay strings.
+            columns (list, optional): Only return these columns, in this order.
+            engine (str): 'csv' (standard library), or 'pandas' / 'pyarrow' to parse
+                with their C readers, chunk_size rows (pandas) or one block (pyarrow) at a time.
+            chunk_size (int): Rows per pandas chunk; bounds memory for the fast paths.
+        All engines return the same values for the same schema.
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"CSV file not found: {file_path}")
+        if engine not in CSVUtils.ENGINES:
+            raise ValueError(f"Unknown CSV engine: {engine}. Supported engines: {list(CSVUtils.ENGINES)}")
+
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            headers = next(csv.reader(file), [])
+        schema = dict(schema or {})
+        selected = list(columns) if columns else headers
+        missing = [column for column in selected + list(schema) if column not in headers]
+        if missing:
+            raise KeyError(f"Column(s) {missing} not found in {file_path}. Available: {headers}")
+
+        # Resolve the schema once: builtin types per column and Python converters per column
+        types = {column: CSVUtils._type_name(kind) for column, kind in schema.items()
+                 if CSVUtils._type_name(kind)}
+        converters = [(column, CSVUtils._converter(kind)) for column, kind in schema.items()
+                      if column in selected and CSVUtils._converter(kind)]
+
+        if engine == 'pandas':
+            rows = CSVUtils._pandas_rows(file_path, headers, selected, types, chunk_size)
+            converters = [(column, convert) for column, convert in converters if column not in types]
+        elif engine == 'pyarrow':
+            rows = CSVUtils._pyarrow_rows(file_path, headers, selected, types)
+            converters = [(column, convert) for column, convert in converters if column not in types]
+        else:
+            rows = CSVUtils._csv_rows(file_path, selected, columns)
+
+        for record, row in enumerate(rows, start=1):
+            for column, convert in converters:
+                try:
+                    row[column] = convert(row[column])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Cannot convert column '{column}' in record {record} "
+                                     f"of {file_path}: {e}") from e
+            yield row
+
+    @staticmethod
+    def iter_csv_chunks(file_path, chunk_size=1000, schema=None, columns=None, engine='csv'):
+        """Yield lists of at most chunk_size row dictionaries (see iter_csv_rows() for the options)."""
+        rows = CSVUtils.iter_csv_rows(file_path, schema=schema, columns=columns, engine=engine,
+                                      chunk_size=chunk_size)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
 
-        data = []
+    @staticmethod
+    def _csv_rows(file_path, selected, columns):
         with open(file_path, 'r', newline='', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
-            for row in csv_reader:
-                data.append(row)
-        return data
+            for row in csv.DictReader(file):
+                yield {column: row[column] for column in selected} if columns else row
+
+    @staticmethod
+    def _pandas_rows(file_path, headers, selected, types, chunk_size):
+        dtypes = {'int': 'Int64', 'float': 'float64', 'bool': 'boolean', 'str': 'string'}
+        dtype = {column: dtypes[types[column]] if column in types else str for column in selected}
+        # Only typed cells treat '' as missing; plain string columns keep '' as the csv module does
+        na_values = {column: [''] for column, kind in types.items() if kind != 'str'}
+        for chunk in pd.read_csv(file_path, usecols=selected, dtype=dtype, chunksize=chunk_size,
+                                 keep_default_na=False, na_values=na_values,
+                                 true_values=list(CSVUtils.TRUE_VALUES),
+                                 false_values=list(CSVUtils.FALSE_VALUES)):
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            for row in chunk[selected].to_dict('records'):
+                yield row
+
+    @staticmethod
+    def _pyarrow_rows(file_path, headers, selected, types):
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        arrow_types = {'int': pa.int64(), 'float': pa.float64(), 'bool': pa.bool_(), 'str': pa.string()}
+        convert_options = pacsv.ConvertOptions(
+            column_types={column: arrow_types[types.get(column, 'str')] for column in selected},
+            include_columns=selected,
+            true_values=[v for value in CSVUtils.TRUE_VALUES for v in (value, value.capitalize(), value.upper())],
+            false_values=[v for value in CSVUtils.FALSE_VALUES for v in (value, value.capitalize(), value.upper())])
+        with pacsv.open_csv(file_path, convert_options=convert_options) as reader:
+            for batch in reader:
+                yield from batch.to_pylist()
+
+    @staticmethod
+    def _type_name(kind):
+        """'int', 'float', 'bool' or 'str' for a builtin type (or its name); None for a custom callable."""
+        name = kind if isinstance(kind, str) else getattr(kind, '__name__', None)
+        if name in ('int', 'float', 'bool', 'str') and (isinstance(kind, str) or kind in (int, float, bool, str)):
+            return name
+        if isinstance(kind, str):
+            raise ValueError(f"Unknown column type: {kind}. Use int, float, bool, str or a callable")
+        return None
+
+    @staticmethod
+    def _converter(kind):
+        """Python converter for a schema entry; None means keep the string as-is."""
+        name = CSVUtils._type_name(kind)
+        if name == 'str':
+            return None
+        if name == 'bool':
+            return CSVUtils._to_bool
+        if name in ('int', 'float'):
+            cast = int if name == 'int' else float
+            return lambda value: cast(value) if value not in ('', None) else None
+        return kind
+
+    @staticmethod
+    def _to_bool(value):
+        if value in ('', None):
+            return None
+        lowered = value.strip().lower()
+        if lowered in CSVUtils.TRUE_VALUES:
+            return True
+        if lowered in CSVUtils.FALSE_VALUES:
+            return False
+        raise ValueError(f"'{value}' is not a boolean")
 
     @staticmethod
     def write_csv_data(file_path, data, headers=None):
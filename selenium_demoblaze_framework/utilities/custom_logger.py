@@ -1,45 +1,194 @@
 # utilities/custom_logger.py
 
+import atexit
+import configparser
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() renders the message in the calling thread; here the
+    record is queued as-is (msg and args untouched), so a test thread only pays
+    for building a LogRecord and a queue put. Once the listener has stopped,
+    records go straight to its handlers instead of into a queue nobody drains.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.fallback = ()
+
+    def prepare(self, record):
+        return record
+
+    def emit(self, record):
+        if self.fallback:
+            for handler in self.fallback:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        super().emit(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers and ad-hoc jq queries."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
+            'level': record.levelname,
+            'logger': record.name,
+            'function': record.funcName,
+            'thread': record.threadName,
+            'worker': os.environ.get('PYTEST_XDIST_WORKER', 'master'),
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
 class CustomLogger:
+    """
+    Framework loggers sharing one non-blocking pipeline per process.
+
+    Every logger gets the same QueueHandler; a single QueueListener thread formats
+    records and writes them to the console and to one file per xdist worker
+    (logs/test_<worker>_<timestamp>.log, or .jsonl with json_format). Levels come
+    from [LOGGING] in config.ini: log_level for every logger, module_levels for
+    per-logger overrides matched by name prefix. propagate defaults to False: a
+    propagating record also passes through pytest's own (synchronous) log_cli and
+    log_file handlers on the calling thread, which undoes the point of the queue.
+    So by default framework records are in logs/ only, not in reports/pytest.log or
+    pytest's captured-log report sections; set propagate = True to get them there.
+    Records logged after shutdown() are written synchronously rather than dropped.
+    """
+
+    _queue = queue.Queue(-1)
+    _queue_handler = _DeferredQueueHandler(_queue)
+    _listener = None
+    _settings = None
+    _loggers = set()
+    _lock = threading.RLock()
+
+    FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s - %(message)s'
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
     @staticmethod
     def get_logger(name):
         """Create custom logger with file and console handlers."""
         logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)
 
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.join(os.getcwd(), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
+        with CustomLogger._lock:
+            if CustomLogger._listener is None:
+                CustomLogger.configure()
 
-        # Define log file path with timestamp
-        log_file = os.path.join(log_dir, f'test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+            # Avoid adding duplicate handlers if logger already has them
+            if CustomLogger._queue_handler not in logger.handlers:
+                logger.addHandler(CustomLogger._queue_handler)
+            logger.setLevel(CustomLogger.level_for(name))
+            logger.propagate = CustomLogger._settings['propagate']
+            CustomLogger._loggers.add(name)
 
-        # Create file handler
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
+        return logger
 
-        # Create console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+    @classmethod
+    def configure(cls, **overrides):
+        """
+        (Re)start the pipeline from [LOGGING], with keyword overrides for any option:
+        log_dir, log_level, console_level, module_levels ({name: level} or
+        'Name:LEVEL, ...'), json_format, propagate. Existing loggers pick up the new levels.
+        """
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
 
-        # Create a common formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        settings = {
+            'log_dir': config.get('LOGGING', 'log_dir', fallback='') or os.path.join(os.getcwd(), 'logs'),
+            'log_level': config.get('LOGGING', 'log_level', fallback='DEBUG'),
+            'console_level': config.get('LOGGING', 'console_level', fallback='INFO'),
+            'module_levels': config.get('LOGGING', 'module_levels', fallback=''),
+            'json_format': config.getboolean('LOGGING', 'json_format', fallback=False),
+            'propagate': config.getboolean('LOGGING', 'propagate', fallback=False)
+        }
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        settings['module_levels'] = cls._parse_levels(settings['module_levels'])
 
-        # Apply formatter to both handlers
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        with cls._lock:
+            cls.shutdown()
+
+            os.makedirs(settings['log_dir'], exist_ok=True)
+            worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+            extension = 'jsonl' if settings['json_format'] else 'log'
+            settings['log_file'] = os.path.join(
+                settings['log_dir'], f'test_{worker_id}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{extension}')
+
+            text_formatter = logging.Formatter(cls.FORMAT, datefmt=cls.DATE_FORMAT)
+
+            # The file is opened on the first record, by the listener thread
+            file_handler = logging.FileHandler(settings['log_file'], encoding='utf-8', delay=True)
+            file_handler.setFormatter(JsonFormatter() if settings['json_format'] else text_formatter)
+
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(settings['console_level'].upper())
+            console_handler.setFormatter(text_formatter)
+
+            cls._settings = settings
+            cls._queue_handler.fallback = ()
+            cls._listener = logging.handlers.QueueListener(cls._queue, file_handler, console_handler,
+                                                           respect_handler_level=True)
+            cls._listener.start()
+
+            for name in cls._loggers:
+                logging.getLogger(name).setLevel(cls.level_for(name))
+                logging.getLogger(name).propagate = settings['propagate']
+
+        return settings['log_file']
+
+    @classmethod
+    def level_for(cls, name):
+        """The configured level for a logger: the longest matching module_levels prefix, else log_level."""
+        settings = cls._settings or {'log_level': 'DEBUG', 'module_levels': {}}
+        matches = [prefix for prefix in settings['module_levels'] if name.startswith(prefix)]
+        if matches:
+            return settings['module_levels'][max(matches, key=len)]
+        return settings['log_level'].upper()
+
+    @classmethod
+    def log_file(cls):
+        """Path of this worker's log file (None before the first logger is created)."""
+        return cls._settings['log_file'] if cls._settings else None
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Write out everything still queued and stop the listener thread. Later
+        records are handled synchronously (the file is reopened on demand).
+        """
+        with cls._lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                for handler in cls._listener.handlers:
+                    handler.close()
+                cls._queue_handler.fallback = cls._listener.handlers
+                cls._listener = None
+
+    @staticmethod
+    def _parse_levels(levels):
+        if isinstance(levels, dict):
+            return {name: str(level).upper() for name, level in levels.items()}
+        parsed = {}
+        for entry in levels.split(','):
+            if ':' in entry:
+                name, level = entry.rsplit(':', 1)
+                parsed[name.strip()] = level.strip().upper()
+        return parsed
 
-        # Avoid adding duplicate handlers if logger already has them
-        if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
 
-        return logger
\ No newline at end of file
+atexit.register(CustomLogger.shutdown)
@@ -0,0 +1,127 @@
+# utilities/data_provider.py
+
+from collections import OrderedDict
+from selenium_demoblaze_framework.utilities.arrow_utils import ArrowUtils
+from selenium_demoblaze_framework.utilities.csv_utils import CSVUtils
+from selenium_demoblaze_framework.utilities.excel_utils import ExcelUtils
+from selenium_demoblaze_framework.utilities.file_lock import FileLock
+from selenium_demoblaze_framework.utilities.json_utils import JSONUtils
+from selenium_demoblaze_framework.utilities.xml_utils import XMLUtils
+import configparser
+import hashlib
+import os
+import pickle
+import threading
+
+
+class DataProvider:
+    """
+    One entry point for test data in any supported format, parsed once.
+
+    The reader is picked from the file extension (.xlsx, .csv, .json, .xml,
+    .parquet, .arrow). Parsed data is pickled and kept in an in-process LRU keyed
+    by path, sheet, mtime and size; the same bytes are written to a shared cache
+    directory, so other xdist workers (and later runs) load the pickle instead of
+    re-parsing. A FileLock makes sure only one worker parses a given file.
+    Every call returns a fresh copy, so tests can't corrupt each other's data.
+    """
+
+    _memory = OrderedDict()
+    _memory_lock = threading.Lock()
+
+    _config = configparser.ConfigParser()
+    _config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+    max_entries = _config.getint('DATA_PROVIDER', 'max_entries', fallback=32)
+    cache_dir = (_config.get('DATA_PROVIDER', 'cache_dir', fallback='')
+                 or os.path.join(os.getcwd(), '.cache', 'test_data'))
+
+    @classmethod
+    def load(cls, file_path, sheet_name=None):
+        """
+        Return the parsed contents of a test data file.
+        sheet_name selects the Excel sheet (ignored for other formats).
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Test data file not found: {file_path}")
+
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        key = (file_path, sheet_name, stat.st_mtime_ns, stat.st_size)
+
+        with cls._memory_lock:
+            payload = cls._memory.get(key)
+            if payload is not None:
+                cls._memory.move_to_end(key)
+        if payload is None:
+            payload = cls._load_shared(file_path, sheet_name, stat)
+            cls._remember(key, payload)
+
+        return pickle.loads(payload)
+
+    @classmethod
+    def clear(cls):
+        """Forget everything cached in this process (the shared cache files are kept)."""
+        with cls._memory_lock:
+            cls._memory.clear()
+
+    @staticmethod
+    def read(file_path, sheet_name=None):
+        """Parse a file with the reader matching its extension, bypassing every cache."""
+        extension = os.path.splitext(file_path)[1].lower()
+
+        if extension in ('.xlsx', '.xlsm'):
+            return ExcelUtils.read_excel_data(file_path, sheet_name)
+        elif extension == '.csv':
+            return CSVUtils.read_csv_data(file_path)
+        elif extension in ('.json', '.jsonl', '.ndjson'):
+            return JSONUtils.read_json_data(file_path)
+        elif extension == '.xml':
+            return XMLUtils.read_xml_data(file_path)
+        elif extension in ('.parquet', '.arrow', '.feather', '.ipc'):
+            return ArrowUtils.read_data(file_path)
+
+        raise ValueError(f"Unsupported test data format: '{extension}'. "
+                         f"Use .xlsx, .csv, .json, .jsonl, .xml, .parquet or .arrow")
+
+    @classmethod
+    def _load_shared(cls, file_path, sheet_name, stat):
+        name = hashlib.sha1(f"{file_path}::{sheet_name}".encode('utf-8')).hexdigest()
+        cache_file = os.path.join(cls.cache_dir, f"{name}.pickle")
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        payload = cls._read_cache_file(cache_file, signature)
+        if payload is not None:
+            return payload
+
+        with FileLock(cache_file + '.lck'):
+            # Another worker may have parsed it while we waited for the lock
+            payload = cls._read_cache_file(cache_file, signature)
+            if payload is not None:
+                return payload
+
+            payload = pickle.dumps(cls.read(file_path, sheet_name), protocol=pickle.HIGHEST_PROTOCOL)
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'wb') as file:
+                pickle.dump((signature, payload), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+            return payload
+
+    @staticmethod
+    def _read_cache_file(cache_file, signature):
+        try:
+            with open(cache_file, 'rb') as file:
+                cached_signature, payload = pickle.load(file)
+        except (FileNotFoundError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+        return payload if cached_signature == signature else None
+
+    @classmethod
+    def _remember(cls, key, payload):
+        with cls._memory_lock:
+            # Drop entries for older versions of the same file straight away
+            for stale in [k for k in cls._memory if k[:2] == key[:2] and k != key]:
+                del cls._memory[stale]
+            cls._memory[key] = payload
+            cls._memory.move_to_end(key)
+            while len(cls._memory) > cls.max_entries:
+                cls._memory.popitem(last=False)
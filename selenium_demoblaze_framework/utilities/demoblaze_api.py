@@ -0,0 +1,125 @@
+# utilities/demoblaze_api.py
+
+from requests.adapters import HTTPAdapter
+import base64
+import configparser
+import os
+import requests
+import uuid
+
+
+class DemoBlazeApiError(Exception):
+    """The backend rejected a call (DemoBlaze answers 200 with an errorMessage body)."""
+
+
+class DemoBlazeApi:
+    """
+    HTTP client for the DemoBlaze backend, for test data setup.
+
+    Talks to the same endpoints the site's own JavaScript uses, over one pooled
+    requests.Session (keep-alive), so users and carts can be prepared in a few
+    milliseconds instead of through the UI. Passwords are sent base64-encoded and
+    the login token is what the site keeps in its `tokenp_` cookie, so a browser
+    given that cookie sees the same user and cart.
+    """
+
+    AUTH_COOKIE = 'tokenp_'
+    TOKEN_PREFIX = 'Auth_token: '
+
+    def __init__(self, base_url=None, timeout=None, pool_size=None, logger=None):
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+        self.base_url = (base_url or config.get('API', 'base_url', fallback='https://api.demoblaze.com')).rstrip('/')
+        self.timeout = timeout or config.getint('API', 'timeout', fallback=10)
+        pool_size = pool_size or config.getint('API', 'pool_size', fallback=4)
+        self.logger = logger
+
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    # ==================== USERS ====================
+
+    def signup(self, username, password):
+        """Create a user. Raises DemoBlazeApiError if the name is taken."""
+        self._post('signup', {'username': username, 'password': self.encode_password(password)})
+        self._log(f"Signed up user {username} via API")
+
+    def login(self, username, password):
+        """Log in and return the auth token (the value of the tokenp_ cookie)."""
+        body = self._post('login', {'username': username, 'password': self.encode_password(password)})
+        if not isinstance(body, str) or not body.startswith(self.TOKEN_PREFIX):
+            raise DemoBlazeApiError(f"Unexpected login response for {username}: {body!r}")
+        self._log(f"Logged in user {username} via API")
+        return body[len(self.TOKEN_PREFIX):]
+
+    def create_user(self, prefix='apiuser', password='Test@1234'):
+        """Sign up a user with a unique name. Returns (username, password)."""
+        username = f"{prefix}_{uuid.uuid4().hex[:12]}"
+        self.signup(username, password)
+        return username, password
+
+    # ==================== CART ====================
+
+    def add_to_cart(self, token, product_id):
+        """Put one product in the cart of the token's user. Returns the cart item id."""
+        item_id = str(uuid.uuid4())
+        self._post('addtocart', {'id': item_id, 'cookie': token, 'prod_id': int(product_id), 'flag': True})
+        self._log(f"Added product {product_id} to cart via API")
+        return item_id
+
+    def view_cart(self, token):
+        """Cart items of the token's user: [{'id': item_id, 'prod_id': ..., 'cookie': ...}, ...]."""
+        body = self._post('viewcart', {'cookie': token, 'flag': True})
+        return body.get('Items', []) if isinstance(body, dict) else []
+
+    def delete_item(self, item_id):
+        """Remove one cart item by its item id."""
+        self._post('deleteitem', {'id': item_id})
+
+    def clear_cart(self, token):
+        """Remove everything from the token's cart. Returns the number of items deleted."""
+        items = self.view_cart(token)
+        for item in items:
+            self.delete_item(item['id'])
+        return len(items)
+
+    def seed_cart(self, token, product_ids, clear=True):
+        """Make the cart hold exactly product_ids (or add to it with clear=False). Returns the item ids."""
+        if clear:
+            self.clear_cart(token)
+        return [self.add_to_cart(token, product_id) for product_id in product_ids]
+
+    # ==================== BROWSER ====================
+
+    def apply_to_driver(self, driver, token, site_url):
+        """Log a browser in with an API token: load the site, set tokenp_ and reload."""
+        driver.get(site_url)
+        driver.add_cookie({'name': self.AUTH_COOKIE, 'value': token, 'path': '/'})
+        driver.refresh()
+
+    @staticmethod
+    def encode_password(password):
+        """The site base64-encodes passwords before sending them."""
+        return base64.b64encode(password.encode('utf-8')).decode('ascii')
+
+    def _post(self, endpoint, payload):
+        response = self.session.post(f"{self.base_url}/{endpoint}", json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            body = response.text
+        if isinstance(body, dict) and 'errorMessage' in body:
+            raise DemoBlazeApiError(f"{endpoint} failed: {body['errorMessage']}")
+        return body
+
+    def _log(self, message):
+        if self.logger:
+            self.logger.info(message)
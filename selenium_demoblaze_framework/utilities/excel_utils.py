@@ -3,6 +3,11 @@
 import openpyxl
 import pandas as pd
 import os
+import itertools
+import re
+import threading
+from collections import namedtuple
+from openpyxl.utils import column_index_from_string
 
 
 class ExcelUtils:
@@ -11,45 +16,96 @@ class ExcelUtils:
         """
         Read data from an Excel file using openpyxl.
         Returns a list of dictionaries, where each dictionary represents a row with headers as keys.
+        For large sheets prefer iter_excel_rows(), which never holds more than one row.
+        """
+        return list(ExcelUtils.iter_excel_rows(file_path, sheet_name))
+
+    @staticmethod
+    def iter_excel_rows(file_path, sheet_name=None, columns=None, where=None, as_namedtuple=False):
+        """
+        Lazily yield the rows of a sheet, streaming it in openpyxl read-only mode.
+        Parameters:
+            file_path (str): Path to the Excel file.
+            sheet_name (str): Name of the sheet (optional; uses active sheet if None).
+            columns (list): Only return these headers, in this order (default: all).
+            where (dict or callable): Row filter - either {header: value or predicate}
+                or a callable taking the row (dict or namedtuple) and returning a bool.
+            as_namedtuple (bool): Yield namedtuples instead of dicts; headers that are not
+                valid identifiers are converted (e.g. 'Product Name' -> Product_Name).
+        Completely empty rows are skipped, as in read_excel_data().
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Excel file not found: {file_path}")
 
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
-        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name] if sheet_name else workbook.active
+            rows = sheet.iter_rows(values_only=True)
+            headers = list(next(rows, ()))  # First row as headers
+
+            # Header -> column index mapping, computed once for the whole sheet
+            selected = list(columns) if columns else headers
+            filtered = list(where) if isinstance(where, dict) else []
+            missing = [column for column in selected + filtered if column not in headers]
+            if missing:
+                raise KeyError(f"Column(s) {missing} not found in {file_path}. Available: {headers}")
+            indexes = [headers.index(column) for column in selected]
+            filter_indexes = {column: headers.index(column) for column in filtered}
+
+            row_type = ExcelUtils._row_type(selected) if as_namedtuple else None
+
+            for row in rows:
+                if not any(cell is not None for cell in row):  # Skip completely empty rows
+                    continue
+                row = row + (None,) * (len(headers) - len(row))
+
+                if not ExcelUtils._matches(row, filter_indexes, where):
+                    continue
+
+                values = [row[index] for index in indexes]
+                record = row_type._make(values) if row_type else dict(zip(selected, values))
+                if callable(where) and not where(record):
+                    continue
+                yield record
+        finally:
+            workbook.close()
 
-        data = []
-        headers = [cell.value for cell in sheet[1]]  # First row as headers
-
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if any(cell is not None for cell in row):  # Skip completely empty rows
-                data.append(dict(zip(headers, row)))
+    @staticmethod
+    def _matches(row, filter_indexes, where):
+        for column, index in filter_indexes.items():
+            expected = where[column]
+            if not (expected(row[index]) if callable(expected) else row[index] == expected):
+                return False
+        return True
 
-        workbook.close()
-        return data
+    @staticmethod
+    def _row_type(headers):
+        fields = [re.sub(r'\W', '_', str(header)).strip('_') or f"column_{i}" for i, header in enumerate(headers)]
+        return namedtuple('ExcelRow', fields, rename=True)
 
     @staticmethod
     def write_excel_data(file_path, data, sheet_name='Sheet1'):
         """
         Write a list of dictionaries to an Excel file using openpyxl.
         Each dictionary represents a row; keys are used as column headers.
+        Rows are streamed through a write-only workbook, so `data` may also be
+        any iterable (e.g. a generator) of dictionaries.
         """
-        if not data:
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
             raise ValueError("No data provided to write to Excel.")
 
-        workbook = openpyxl.Workbook()
-        sheet = workbook.active
-        sheet.title = sheet_name
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_name)
 
         # Write headers
-        headers = list(data[0].keys())
-        for col_num, header in enumerate(headers, start=1):
-            sheet.cell(row=1, column=col_num, value=header)
+        headers = list(first_row.keys())
+        sheet.append(headers)
 
         # Write data rows
-        for row_num, row_data in enumerate(data, start=2):
-            for col_num, header in enumerate(headers, start=1):
-                sheet.cell(row=row_num, column=col_num, value=row_data.get(header, ''))
+        for row_data in itertools.chain([first_row], rows):
+            sheet.append([row_data.get(header, '') for header in headers])
 
         # Ensure directory exists
         os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
@@ -80,12 +136,95 @@ class ExcelUtils:
             row (int): Row number (1-based index).
             column (int or str): Column number (1-based) or letter (e.g., 'A').
             value: The value to write into the cell.
+        For more than one cell use update_cells(), which loads and saves the file once.
+        """
+        ExcelUtils.update_cells(file_path, [(sheet_name, row, column, value)])
+
+    @staticmethod
+    def update_cells(file_path, updates):
+        """
+        Apply many cell edits in a single load/save pass.
+        Parameters:
+            file_path (str): Path to the Excel file.
+            updates (iterable): (sheet_name, row, column, value) tuples; sheet_name None
+                means the active sheet, column is 1-based or a letter (e.g. 'C').
+        Returns the number of cells written.
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Excel file not found: {file_path}")
 
         workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook[sheet_name] if sheet_name else workbook.active
-        sheet.cell(row=row, column=column, value=value)
-        workbook.save(file_path)
-        workbook.close()
\ No newline at end of file
+        try:
+            count = 0
+            for sheet_name, row, column, value in updates:
+                sheet = workbook[sheet_name] if sheet_name else workbook.active
+                if isinstance(column, str):
+                    column = column_index_from_string(column)
+                sheet.cell(row=row, column=column, value=value)
+                count += 1
+            if count:
+                ExcelUtils._save_atomically(workbook, file_path)
+        finally:
+            workbook.close()
+        return count
+
+    @staticmethod
+    def append_rows(file_path, rows, sheet_name=None):
+        """
+        Append rows to a sheet in a single load/save pass, creating the file or sheet if needed.
+        Rows may be dictionaries (matched to the sheet's header row; a new sheet gets
+        the first row's keys as headers) or plain sequences of values.
+        Returns the number of rows appended.
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return 0
+
+        if os.path.exists(file_path):
+            workbook = openpyxl.load_workbook(file_path)
+        else:
+            workbook = openpyxl.Workbook()
+            workbook.remove(workbook.active)
+
+        try:
+            if sheet_name and sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+            elif sheet_name or not workbook.sheetnames:
+                sheet = workbook.create_sheet(title=sheet_name or 'Sheet1')
+            else:
+                sheet = workbook.active
+
+            headers = None
+            count = 0
+            for row in itertools.chain([first_row], rows):
+                if isinstance(row, dict):
+                    if headers is None:
+                        headers = ExcelUtils._header_row(sheet, row)
+                    row = [row.get(header, '') for header in headers]
+                sheet.append(list(row))
+                count += 1
+
+            os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
+            ExcelUtils._save_atomically(workbook, file_path)
+        finally:
+            workbook.close()
+        return count
+
+    @staticmethod
+    def _header_row(sheet, row):
+        """The sheet's headers; an empty sheet gets the row's keys written as its header row."""
+        headers = [cell.value for cell in sheet[1]]
+        if any(header is not None for header in headers):
+            return headers
+        headers = list(row.keys())
+        for column, header in enumerate(headers, start=1):
+            sheet.cell(row=1, column=column, value=header)
+        return headers
+
+    @staticmethod
+    def _save_atomically(workbook, file_path):
+        """Save to a temp file and swap it in, so a crash never leaves a half-written workbook."""
+        temp_file = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp.xlsx"
+        workbook.save(temp_file)
+        os.replace(temp_file, file_path)
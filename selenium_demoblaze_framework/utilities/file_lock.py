@@ -0,0 +1,128 @@
+# utilities/file_lock.py
+
+import os
+import socket
+import time
+import uuid
+
+
+class FileLock:
+    """
+    Cross-process lock backed by an exclusively created lock file.
+    Works the same on Windows and Linux, so xdist workers (and threads) can
+    serialize access to shared cache files without extra dependencies.
+
+    The lock file records its holder (host, pid and a per-acquire token). A lock
+    whose holder process is gone is broken straight away; one held from another
+    host (a shared drive) is broken once older than `stale_after`, which is kept
+    below `timeout` so waiters outlive a crashed holder.
+    """
+
+    BREAKER_STALE_AFTER = 10
+
+    def __init__(self, path, timeout=120, poll_interval=0.1, stale_after=60):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_after = min(stale_after, timeout / 2)
+        self._identity = None
+
+    def acquire(self):
+        """Block until the lock file can be created, breaking locks left by crashed processes."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, identity.encode())
+                os.close(fd)
+                self._identity = identity
+                return
+            except FileExistsError:
+                holder = self._read(self.path)
+                if holder is not None and self._is_stale(holder) and self._break(holder):
+                    continue
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Could not acquire file lock: {self.path}")
+            time.sleep(self.poll_interval)
+
+    def release(self):
+        """Remove the lock file, unless it was broken and someone else holds it now."""
+        identity, self._identity = self._identity, None
+        if identity is None or self._read(self.path) != identity:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _is_stale(self, holder):
+        host, _, rest = holder.partition(':')
+        pid = rest.partition(':')[0]
+        if host == socket.gethostname() and pid.isdigit():
+            alive = self._pid_alive(int(pid))
+            if alive is not None:
+                return not alive
+        try:
+            return time.time() - os.path.getmtime(self.path) > self.stale_after
+        except FileNotFoundError:
+            return False
+
+    def _break(self, holder):
+        """
+        Remove a stale lock, but only if it still belongs to `holder`. Breakers take
+        turns through a second lock file, so two waiters can't both delete, and a
+        lock taken after the stale one was judged is never removed.
+        """
+        breaker = self.path + '.break'
+        try:
+            fd = os.open(breaker, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(breaker) > self.BREAKER_STALE_AFTER:
+                    os.remove(breaker)  # A breaker died mid-break
+            except FileNotFoundError:
+                pass
+            return False
+
+        try:
+            if self._read(self.path) != holder:
+                return False
+            os.remove(self.path)
+            return True
+        except FileNotFoundError:
+            return True
+        finally:
+            os.remove(breaker)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, encoding='utf-8') as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _pid_alive(pid):
+        """True/False on POSIX; None (unknown) on Windows, where signal 0 isn't a probe."""
+        if os.name == 'nt':
+            return None
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,7 +1,9 @@
 # utilities/json_utils.py
 
+from selenium_demoblaze_framework.utilities.file_lock import FileLock
 import json
 import os
+import threading
 
 
 class JSONUtils:
@@ -10,10 +12,14 @@ class JSONUtils:
         """
         Read data from a JSON file.
         Returns the parsed JSON content as a Python object (dict, list, etc.).
+        .jsonl / .ndjson files are read as JSON Lines and returned as a list.
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"JSON file not found: {file_path}")
 
+        if file_path.lower().endswith(('.jsonl', '.ndjson')):
+            return JSONUtils.read_json_lines(file_path)
+
         with open(file_path, 'r', encoding='utf-8') as file:
             data = json.load(file)
         return data
@@ -23,12 +29,15 @@ class JSONUtils:
         """
         Write data to a JSON file with pretty formatting (indent=4).
         Creates parent directories if they don't exist.
+        The file is written to a temp file and renamed into place, so readers never see half a file.
         """
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
 
-        with open(file_path, 'w', encoding='utf-8') as file:
+        temp_file = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as file:
             json.dump(data, file, indent=4, ensure_ascii=False)
+        os.replace(temp_file, file_path)
 
     @staticmethod
     def update_json_value(file_path, key_path, new_value):
@@ -39,26 +48,87 @@ class JSONUtils:
             key_path (str): Dot-separated key path (e.g., 'auth.username').
             new_value: The new value to assign.
         """
+        JSONUtils.update_json_values(file_path, {key_path: new_value})
+
+    @staticmethod
+    def update_json_values(file_path, updates):
+        """
+        Update many nested values in one read and one write.
+        Parameters:
+            file_path (str): Path to the JSON file.
+            updates (dict): {dot-separated key path: new value}.
+        Every key path is checked before anything is written, so a bad path leaves the file untouched.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"JSON file not found: {file_path}")
 
         data = JSONUtils.read_json_data(file_path)
 
-        keys = key_path.split('.')
-        current = data
+        for key_path, new_value in updates.items():
+            keys = key_path.split('.')
+            current = data
 
-        # Traverse to the parent of the target key
-        for key in keys[:-1]:
-            if key not in current:
-                raise KeyError(f"Key path '{key}' not found in JSON structure.")
-            current = current[key]
+            # Traverse to the parent of the target key
+            for key in keys[:-1]:
+                if key not in current:
+                    raise KeyError(f"Key path '{key}' not found in JSON structure.")
+                current = current[key]
 
-        # Update the final key
-        final_key = keys[-1]
-        if final_key not in current:
-            raise KeyError(f"Final key '{final_key}' not found in JSON structure.")
+            # Update the final key
+            final_key = keys[-1]
+            if final_key not in current:
+                raise KeyError(f"Final key '{final_key}' not found in JSON structure.")
 
-        current[final_key] = new_value
+            current[final_key] = new_value
 
         # Write updated data back to file
-        JSONUtils.write_json_data(file_path, data)
\ No newline at end of file
+        JSONUtils.write_json_data(file_path, data)
+
+    # ==================== JSON LINES ====================
+
+    @staticmethod
+    def iter_json_lines(file_path):
+        """
+        Yield the records of a JSON Lines file (one JSON value per line) one at a time.
+        Blank lines are ignored.
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"JSON Lines file not found: {file_path}")
+
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {file_path}: {e}") from e
+
+    @staticmethod
+    def read_json_lines(file_path):
+        """Read a JSON Lines file into a list."""
+        return list(JSONUtils.iter_json_lines(file_path))
+
+    @staticmethod
+    def append_json_lines(file_path, records):
+        """
+        Append records to a JSON Lines file without rewriting it.
+        All records of one call are encoded first and written with a single O_APPEND
+        write under a FileLock, so records from parallel workers never interleave.
+        Returns the number of records appended.
+        """
+        if isinstance(records, dict):
+            records = [records]
+        payload = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+        if not payload:
+            return 0
+
+        os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
+
+        with FileLock(file_path + '.lck'):
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+        return payload.count(b'\n')
@@ -1,27 +1,65 @@
-import pandas as pd
+import configparser
 import os
+from collections import namedtuple
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, \
-    ElementNotInteractableException, NoAlertPresentException
+    ElementNotInteractableException, NoAlertPresentException, UnexpectedAlertPresentException
 from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+from selenium_demoblaze_framework.utilities.keyword_plan import KeywordPlanLoader, LOCATOR_MAP
+from selenium_demoblaze_framework.utilities.keyword_registry import KeywordRegistry, UnknownKeywordError
+from selenium_demoblaze_framework.utilities.screenshot_service import ScreenshotService
+
+# One row of a test sheet with its keyword already resolved to a handler
+CompiledStep = namedtuple('CompiledStep', ['step', 'keyword', 'locator', 'data', 'by', 'handler'])
 
 
 class KeywordEngine:
+    """
+    Run keyword sheets against a driver.
+
+    Alert monitoring ([KEYWORDS] alert_mode in config.ini):
+    - 'learned' (default): one non-blocking switch_to.alert check between steps;
+      the engine only waits (alert_wait seconds) after steps that have produced an
+      alert before in this process
+    - 'always': wait alert_wait seconds for an alert after every step (old behaviour)
+    - 'off': never look for unexpected alerts
+    Steps followed by handle_alert / verify_alert_text never auto-accept the alert,
+    so the sheet's own alert step gets to see it.
+    """
+
+    ALERT_KEYWORDS = ('handle_alert', 'verify_alert_text')
+
+    # (canonical keyword, locator) pairs seen to raise an alert, shared by all engines in the process
+    _alert_triggers = set()
+
     def __init__(self, driver):
         self.driver = driver
         self.logger = CustomLogger.get_logger(self.__class__.__name__)
         self.wait = WebDriverWait(driver, 15)  # Timeout at 15s for stability
-
-    def check_and_handle_unexpected_alert(self):
-        """Check for and handle any unexpected alerts"""
+        self.plan_loader = KeywordPlanLoader.from_config(logger=self.logger)
+        self._locators = {}  # locator string -> (By, value), filled from compiled plans
+        KeywordRegistry.load_plugins()
+
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+        self.alert_mode = config.get('KEYWORDS', 'alert_mode', fallback='learned').strip().lower()
+        self.alert_wait = config.getfloat('KEYWORDS', 'alert_wait', fallback=1.0)
+        self._next_step_handles_alert = False
+        self._alert_checked = False
+
+    def check_and_handle_unexpected_alert(self, timeout=0):
+        """
+        Accept an open alert, if any, and return its text (None when there is none).
+        With timeout=0 this is a single non-blocking check.
+        """
         try:
-            # Use a very short timeout to check for alerts
-            alert_wait = WebDriverWait(self.driver, 0.5)
-            alert = alert_wait.until(EC.alert_is_present())
+            if timeout:
+                alert = WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+            else:
+                alert = self.driver.switch_to.alert
             alert_text = alert.text
 
             # Log the alert
@@ -30,366 +68,377 @@ class KeywordEngine:
             # Always accept the alert to clear it
             alert.accept()
 
-            import time
-            time.sleep(0.5)
-
             # Return the alert text so caller can handle it if needed
             return alert_text
 
-        except TimeoutException:
+        except (TimeoutException, NoAlertPresentException):
             # No alert present - this is normal
             return None
         except Exception as e:
             self.logger.error(f"Error handling unexpected alert: {str(e)}")
             return None
 
-    def execute_test_case(self, excel_file, sheet_name):
-        """Execute test case from Excel file"""
+    def alert_timeout_after(self, keyword, locator):
+        """How long to wait for an alert after a step: only known alert triggers pay a wait."""
+        if self.alert_mode == 'always':
+            return self.alert_wait
+        if (KeywordRegistry.canonical_name(keyword), locator) in self._alert_triggers:
+            return self.alert_wait
+        return 0
+
+    def handle_alert_after(self, keyword, locator):
+        """Look for an alert raised by the given step, learning the step as a trigger if one is found."""
+        if self.alert_mode == 'off':
+            return None
+        timeout = self.alert_timeout_after(keyword, locator)
+        alert_text = self.check_and_handle_unexpected_alert(timeout)
+        if alert_text is not None:
+            self._alert_triggers.add((KeywordRegistry.canonical_name(keyword), locator))
+        # An instant miss proves nothing: DemoBlaze raises its alerts after an AJAX round
+        # trip, so the next step must still probe (and learn) on this step's behalf
+        if timeout or alert_text is not None:
+            self._alert_checked = True
+        return alert_text
+
+    def compile_test_case(self, excel_file, sheet_name):
+        """
+        Load a test sheet as a plan (cached on disk by KeywordPlanLoader) and resolve
+        every keyword to its handler up front.
+        Raises UnknownKeywordError naming every unknown keyword before any step runs.
+        """
+        plan = []
+        unknown = []
+        for step in self.plan_loader.load(excel_file, sheet_name):
+            if not KeywordRegistry.is_registered(step.keyword):
+                unknown.append(f"step {step.step}: '{step.keyword}'")
+                continue
+            if step.by:
+                self._locators[step.locator] = step.by
+            plan.append(CompiledStep(*step, KeywordRegistry.resolve(step.keyword)))
+
+        if unknown:
+            raise UnknownKeywordError(f"Unknown keyword(s) in {os.path.basename(str(excel_file))} "
+                                      f"[{sheet_name}]: {', '.join(unknown)}")
+        return plan
+
+    def execute_test_case(self, excel_file, sheet_name, on_step=None):
+        """
+        Execute test case from Excel file.
+        on_step, if given, is called with each step's result dict as soon as the step finishes.
+        """
         test_results = []
 
         try:
-            # Read Excel file with openpyxl engine
-            df = pd.read_excel(excel_file, sheet_name=sheet_name, engine='openpyxl')
-
-            # Debug: Print column names and first few rows
-            self.logger.info(f"Excel columns: {df.columns.tolist()}")
-            self.logger.info(f"Number of rows: {len(df)}")
-
-            for index, row in df.iterrows():
-                step = row.get('Step', row.get('Test_Step_ID', index + 1))
-                keyword = str(row.get('Keyword', row.get('Action', ''))).strip() if pd.notna(
-                    row.get('Keyword', row.get('Action'))) else ''
-
-                # Handle locator - combine Locator_Type and Locator_Value if they exist separately
-                if 'Locator' in row and pd.notna(row.get('Locator')):
-                    locator = str(row.get('Locator', '')).strip()
-                elif 'Locator_Type' in row and 'Locator_Value' in row:
-                    locator_type = str(row.get('Locator_Type', '')).strip() if pd.notna(row.get('Locator_Type')) else ''
-                    locator_value = str(row.get('Locator_Value', '')).strip() if pd.notna(
-                        row.get('Locator_Value')) else ''
-                    locator = f"{locator_type}={locator_value}" if locator_type and locator_value else ''
-                else:
-                    locator = ''
-
-                # Handle data/value column
-                data = str(row.get('Data', row.get('Value', ''))).strip() if pd.notna(
-                    row.get('Data', row.get('Value'))) else ''
-
-                # Skip empty rows
-                if not keyword:
-                    self.logger.warning(f"Skipping row {index + 1}: No keyword/action found")
-                    continue
-
-                self.logger.info(f"Executing Step {step}: {keyword} | Locator: {locator} | Data: {data}")
-
-                try:
-                    result = self.execute_keyword(keyword, locator, data)
-                    test_results.append({
-                        'step': step,
-                        'keyword': keyword,
-                        'locator': locator,
-                        'data': data,
-                        'result': True,
-                        'message': 'Success'
-                    })
-                    self.logger.info(f"Step {step} passed")
-                except Exception as e:
-                    self.logger.error(f"Step {step} failed: {str(e)}")
-                    test_results.append({
-                        'step': step,
-                        'keyword': keyword,
-                        'locator': locator,
-                        'data': data,
-                        'result': False,
-                        'message': str(e)
-                    })
-
+            plan = self.compile_test_case(excel_file, sheet_name)
+        except UnknownKeywordError:
+            raise
         except Exception as e:
             self.logger.error(f"Error executing test case: {str(e)}")
             import traceback
             self.logger.error(traceback.format_exc())
+            return test_results
+
+        previous_step = last_step = None
+        for index, compiled_step in enumerate(plan):
+            step, keyword, locator, data, by, handler = compiled_step
+            self.logger.info(f"Executing Step {step}: {keyword} | Locator: {locator} | Data: {data}")
+
+            next_keyword = KeywordRegistry.canonical_name(plan[index + 1].keyword) if index + 1 < len(plan) else None
 
+            try:
+                # Handle unexpected alerts left by the previous step (skipped when this step handles them)
+                if previous_step and KeywordRegistry.canonical_name(keyword) not in self.ALERT_KEYWORDS:
+                    self.handle_alert_after(previous_step.keyword, previous_step.locator)
+
+                self._next_step_handles_alert = next_keyword in self.ALERT_KEYWORDS
+                self._alert_checked = False
+                try:
+                    handler(self, locator, data)
+                except UnexpectedAlertPresentException as e:
+                    # A late alert from the previous step interrupted this one: learn the
+                    # previous step as a trigger, clear the alert and run the step again
+                    if last_step is None:
+                        raise
+                    self.logger.warning(f"Alert '{e.alert_text}' raised late by step {last_step.step}, retrying")
+                    self._alert_triggers.add((KeywordRegistry.canonical_name(last_step.keyword),
+                                              last_step.locator))
+                    self.check_and_handle_unexpected_alert()
+                    handler(self, locator, data)
+                test_results.append({
+                    'step': step,
+                    'keyword': keyword,
+                    'locator': locator,
+                    'data': data,
+                    'result': True,
+                    'message': 'Success'
+                })
+                self.logger.info(f"Step {step} passed")
+            except Exception as e:
+                self.logger.error(f"Step {step} failed: {str(e)}")
+                test_results.append({
+                    'step': step,
+                    'keyword': keyword,
+                    'locator': locator,
+                    'data': data,
+                    'result': False,
+                    'message': str(e)
+                })
+            finally:
+                # A step that already looked for its own alert doesn't need a second look
+                previous_step = None if self._alert_checked else compiled_step
+                last_step = compiled_step
+
+            if on_step:
+                on_step(test_results[-1])
+
+        self._next_step_handles_alert = False
         return test_results
 
     def execute_keyword(self, keyword, locator, data):
         """Execute individual keyword"""
-        keyword = keyword.lower().strip() if keyword else ''
+        handler = KeywordRegistry.resolve(keyword)
 
         # Handle unexpected alerts before any action
-        self.check_and_handle_unexpected_alert()
-
-        if keyword in ['open_browser', 'openbrowser']:
-            self.logger.info("Browser already opened in setup")
-            return True
-
-        elif keyword in ['navigate', 'navigateto', 'open', 'openurl', 'navigate_to_url']:
-            if locator:
-                self.logger.warning(f"Locator '{locator}' ignored for navigation keyword")
-            self.logger.info(f"Navigating to: {data}")
-            self.driver.get(data)
-            return True
-
-        elif keyword in ['click', 'clickelement', 'click_element']:
-            self.logger.info(f"Clicking element: {locator}")
-            if not locator:
-                raise Exception("Locator is required for click")
-
-            # Handle unexpected alerts BEFORE clicking
+        if self.alert_mode != 'off' and KeywordRegistry.canonical_name(keyword) not in self.ALERT_KEYWORDS:
             self.check_and_handle_unexpected_alert()
 
-            locator_type, locator_value = self.parse_locator(locator)
-            element = self.wait.until(
-                EC.element_to_be_clickable(self.get_by_locator(locator_type, locator_value))
-            )
-
-            try:
-                element.click()
-            except (ElementClickInterceptedException, ElementNotInteractableException):
-                self.logger.warning(f"Regular click failed for {locator}, attempting JavaScript click")
-                self.driver.execute_script("arguments[0].click();", element)
-
-            # Handle alerts AFTER clicking
-            alert_text = self.check_and_handle_unexpected_alert()
+        return handler(self, locator, data)
 
-            # Check if it was a wrong password alert
-            if alert_text and "Wrong password" in alert_text:
-                self.logger.error(f"Login failed due to wrong password")
-                # Don't raise exception, just log it
+    # ==================== KEYWORDS ====================
 
-            return True
+    @KeywordRegistry.keyword('open_browser', 'openbrowser')
+    def open_browser(self, locator, data):
+        self.logger.info("Browser already opened in setup")
+        return True
 
-        elif keyword in ['input_text', 'inputtext', 'entertext', 'type', 'sendkeys', 'enter_text']:
-            self.logger.info(f"Entering text in: {locator}")
-            if not locator:
-                raise Exception("Locator is required for input text")
-            locator_type, locator_value = self.parse_locator(locator)
-            element = self.wait.until(
-                EC.element_to_be_clickable(self.get_by_locator(locator_type, locator_value))
-            )
-            try:
-                element.clear()
-                element.send_keys(data)
-            except ElementNotInteractableException:
-                self.logger.warning(f"Regular input failed for {locator}, attempting JavaScript input")
-                self.driver.execute_script("arguments[0].value = arguments[1];", element, data)
-            return True
-
-        elif keyword in ['verify_text', 'verifytext', 'assert_text']:
-            self.logger.info(f"Verifying text: {data} in {locator}")
-            if not locator:
-                raise Exception("Locator is required for verify text")
-
-            locator_type, locator_value = self.parse_locator(locator)
-
-            # Additional wait for dynamic content
-            import time
-            time.sleep(2)
-
-            try:
-                element = self.wait.until(
-                    EC.presence_of_element_located(self.get_by_locator(locator_type, locator_value))
-                )
-
-                # Try multiple methods to get text
-                actual_text = element.text.strip()
-
-                if not actual_text:
-                    actual_text = self.driver.execute_script(
-                        "return arguments[0].innerText || arguments[0].textContent || '';",
-                        element
-                    ).strip()
-
-                if not actual_text:
-                    actual_text = element.get_attribute('innerText') or ''
-                    actual_text = actual_text.strip()
-
-                if not actual_text:
-                    actual_text = element.get_attribute('textContent') or ''
-                    actual_text = actual_text.strip()
-
-                self.logger.info(f"Actual text found: '{actual_text}'")
-
-                # Case-insensitive partial match
-                if data.lower() not in actual_text.lower():
-                    # Take a debugging screenshot
-                    os.makedirs("reports/screenshots", exist_ok=True)
-                    screenshot_path = f"reports/screenshots/verify_text_failure_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                    self.driver.save_screenshot(screenshot_path)
-                    self.logger.error(f"Screenshot saved: {screenshot_path}")
-                    raise Exception(f"Expected text '{data}' not found in '{actual_text}'")
-
-                return True
-
-            except TimeoutException:
-                raise Exception(f"Element with locator {locator} not found")
-
-        elif keyword in ['wait', 'sleep']:
-            if locator:
-                self.logger.warning(f"Locator '{locator}' ignored for wait keyword")
-            import time
-            wait_time = float(data) if data else 1
-            self.logger.info(f"Waiting for {wait_time} seconds")
-            time.sleep(wait_time)
-            return True
+    @KeywordRegistry.keyword('navigate', 'navigateto', 'open', 'openurl', 'navigate_to_url')
+    def navigate(self, locator, data):
+        if locator:
+            self.logger.warning(f"Locator '{locator}' ignored for navigation keyword")
+        self.logger.info(f"Navigating to: {data}")
+        self.driver.get(data)
+        return True
 
-        elif keyword in ['wait_for_element']:
-            self.logger.info(f"Waiting for element to be present: {locator}")
-            if not locator:
-                raise Exception("Locator is required for wait_for_element")
-            locator_type, locator_value = self.parse_locator(locator)
-            self.wait.until(
-                EC.presence_of_element_located(self.get_by_locator(locator_type, locator_value))
-            )
-            return True
-
-        elif keyword in ['verify_element_present']:
-            self.logger.info(f"Verifying element is visible: {locator}")
-            if not locator:
-                raise Exception("Locator is required for verify_element_present")
-            locator_type, locator_value = self.parse_locator(locator)
-            self.wait.until(
-                EC.visibility_of_element_located(self.get_by_locator(locator_type, locator_value))
-            )
-            return True
-
-
-        elif keyword == 'handle_alert':
-
-            if locator:
-                self.logger.warning(f"Locator '{locator}' ignored for handle_alert")
-
-            self.logger.info(f"Handling alert with action: {data}")
-
-            max_attempts = 3
-
-            attempt = 0
-
-            while attempt < max_attempts:
-
-                try:
-
-                    # Create a new WebDriverWait with shorter timeout for alert checking
+    @KeywordRegistry.keyword('click', 'clickelement', 'click_element')
+    def click(self, locator, data):
+        self.logger.info(f"Clicking element: {locator}")
+        if not locator:
+            raise Exception("Locator is required for click")
 
-                    alert_wait = WebDriverWait(self.driver, 5)
+        element = self.wait.until(EC.element_to_be_clickable(self.by_locator(locator)))
 
-                    alert = alert_wait.until(EC.alert_is_present())
+        try:
+            element.click()
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            self.logger.warning(f"Regular click failed for {locator}, attempting JavaScript click")
+            self.driver.execute_script("arguments[0].click();", element)
 
-                    alert_text = alert.text
+        # Handle alerts AFTER clicking - waits only if this click is a known alert trigger
+        alert_text = None if self._next_step_handles_alert else self.handle_alert_after('click', locator)
 
-                    self.logger.info(f"Alert text: {alert_text}")
+        # Check if it was a wrong password alert
+        if alert_text and "Wrong password" in alert_text:
+            self.logger.error(f"Login failed due to wrong password")
+            # Don't raise exception, just log it
 
-                    # Check if it's a "user already exists" alert - if so, skip signup and continue
+        return True
 
-                    if "already exist" in alert_text.lower():
-                        self.logger.warning("User already exists - will proceed to login with existing user")
+    @KeywordRegistry.keyword('input_text', 'inputtext', 'entertext', 'type', 'sendkeys', 'enter_text')
+    def input_text(self, locator, data):
+        self.logger.info(f"Entering text in: {locator}")
+        if not locator:
+            raise Exception("Locator is required for input text")
+        element = self.wait.until(EC.element_to_be_clickable(self.by_locator(locator)))
+        try:
+            element.clear()
+            element.send_keys(data)
+        except ElementNotInteractableException:
+            self.logger.warning(f"Regular input failed for {locator}, attempting JavaScript input")
+            self.driver.execute_script("arguments[0].value = arguments[1];", element, data)
+        return True
+
+    @KeywordRegistry.keyword('verify_text', 'verifytext', 'assert_text')
+    def verify_text(self, locator, data):
+        self.logger.info(f"Verifying text: {data} in {locator}")
+        if not locator:
+            raise Exception("Locator is required for verify text")
 
-                        alert.accept()
+        by_locator = self.by_locator(locator)
 
-                        # Don't fail, just continue
+        # Additional wait for dynamic content
+        import time
+        time.sleep(2)
 
-                        import time
+        try:
+            element = self.wait.until(EC.presence_of_element_located(by_locator))
 
-                        time.sleep(1)
+            # Try multiple methods to get text
+            actual_text = element.text.strip()
 
-                        return True
+            if not actual_text:
+                actual_text = self.driver.execute_script(
+                    "return arguments[0].innerText || arguments[0].textContent || '';",
+                    element
+                ).strip()
 
-                    action = data.strip().lower() if data else 'accept'
+            if not actual_text:
+                actual_text = element.get_attribute('innerText') or ''
+                actual_text = actual_text.strip()
 
-                    if action == 'accept':
+            if not actual_text:
+                actual_text = element.get_attribute('textContent') or ''
+                actual_text = actual_text.strip()
 
-                        alert.accept()
+            self.logger.info(f"Actual text found: '{actual_text}'")
 
-                    elif action == 'dismiss':
+            # Case-insensitive partial match
+            if data.lower() not in actual_text.lower():
+                # Take a debugging screenshot
+                screenshot_path = ScreenshotService.default().capture(self.driver, "verify_text_failure")
+                self.logger.error(f"Screenshot queued: {screenshot_path}")
+                raise Exception(f"Expected text '{data}' not found in '{actual_text}'")
 
-                        alert.dismiss()
+            return True
 
-                    else:
+        except TimeoutException:
+            raise Exception(f"Element with locator {locator} not found")
+
+    @KeywordRegistry.keyword('wait', 'sleep')
+    def wait_seconds(self, locator, data):
+        if locator:
+            self.logger.warning(f"Locator '{locator}' ignored for wait keyword")
+        import time
+        wait_time = float(data) if data else 1
+        self.logger.info(f"Waiting for {wait_time} seconds")
+        time.sleep(wait_time)
+        return True
+
+    @KeywordRegistry.keyword('wait_for_element')
+    def wait_for_element(self, locator, data):
+        self.logger.info(f"Waiting for element to be present: {locator}")
+        if not locator:
+            raise Exception("Locator is required for wait_for_element")
+        self.wait.until(EC.presence_of_element_located(self.by_locator(locator)))
+        return True
 
-                        # Default to accept for any other value
+    @KeywordRegistry.keyword('verify_element_present')
+    def verify_element_present(self, locator, data):
+        self.logger.info(f"Verifying element is visible: {locator}")
+        if not locator:
+            raise Exception("Locator is required for verify_element_present")
+        self.wait.until(EC.visibility_of_element_located(self.by_locator(locator)))
+        return True
 
-                        alert.accept()
+    @KeywordRegistry.keyword('handle_alert')
+    def handle_alert(self, locator, data):
+        if locator:
+            self.logger.warning(f"Locator '{locator}' ignored for handle_alert")
 
-                    # Wait a bit after handling alert
+        self.logger.info(f"Handling alert with action: {data}")
 
-                    import time
+        import time
+        max_attempts = 3
+        attempt = 0
 
+        while attempt < max_attempts:
+            try:
+                # Create a new WebDriverWait with shorter timeout for alert checking
+                alert_wait = WebDriverWait(self.driver, 5)
+                alert = alert_wait.until(EC.alert_is_present())
+                alert_text = alert.text
+                self.logger.info(f"Alert text: {alert_text}")
+
+                # Check if it's a "user already exists" alert - if so, skip signup and continue
+                if "already exist" in alert_text.lower():
+                    self.logger.warning("User already exists - will proceed to login with existing user")
+                    alert.accept()
+                    # Don't fail, just continue
                     time.sleep(1)
-
                     return True
 
+                action = data.strip().lower() if data else 'accept'
+                if action == 'accept':
+                    alert.accept()
+                elif action == 'dismiss':
+                    alert.dismiss()
+                else:
+                    # Default to accept for any other value
+                    alert.accept()
 
-                except TimeoutException:
-
-                    attempt += 1
-
-                    if attempt >= max_attempts:
-                        self.logger.warning("No alert present to handle after multiple attempts")
-
-                        return True  # Don't fail if no alert
-
-                    import time
-
-                    time.sleep(1)
-
-        elif keyword == 'verify_alert_text':
-            if locator:
-                self.logger.warning(f"Locator '{locator}' ignored for verify_alert_text")
-            self.logger.info(f"Verifying alert text: {data}")
-            try:
-                alert = self.wait.until(EC.alert_is_present())
-                alert_text = alert.text.strip()
-                self.logger.info(f"Alert text found: {alert_text}")
-                if data not in alert_text:
-                    raise Exception(f"Expected alert text '{data}' not found in '{alert_text}'")
-                alert.accept()  # Always accept after verifying to clear the alert
+                # Wait a bit after handling alert
+                time.sleep(1)
                 return True
-            except TimeoutException:
-                raise Exception("No alert present to verify")
 
-        elif keyword == 'close_modal':
-            self.logger.info(f"Closing modal with locator: {locator}")
-            if not locator:
-                raise Exception("Locator is required for close_modal")
-            locator_type, locator_value = self.parse_locator(locator)
-            try:
-                close_button = self.wait.until(
-                    EC.element_to_be_clickable(self.get_by_locator(locator_type, locator_value))
-                )
-                close_button.click()
             except TimeoutException:
-                self.logger.warning(f"Close button {locator} not found, attempting JavaScript modal close")
-                self.driver.execute_script("arguments[0].style.display='none';",
-                                           self.driver.find_element(By.ID, locator_value.split('=')[-1]))
+                attempt += 1
+                if attempt >= max_attempts:
+                    self.logger.warning("No alert present to handle after multiple attempts")
+                    return True  # Don't fail if no alert
+                time.sleep(1)
+
+    @KeywordRegistry.keyword('verify_alert_text')
+    def verify_alert_text(self, locator, data):
+        if locator:
+            self.logger.warning(f"Locator '{locator}' ignored for verify_alert_text")
+        self.logger.info(f"Verifying alert text: {data}")
+        try:
+            alert = self.wait.until(EC.alert_is_present())
+            alert_text = alert.text.strip()
+            self.logger.info(f"Alert text found: {alert_text}")
+            if data not in alert_text:
+                raise Exception(f"Expected alert text '{data}' not found in '{alert_text}'")
+            alert.accept()  # Always accept after verifying to clear the alert
             return True
+        except TimeoutException:
+            raise Exception("No alert present to verify")
 
-        elif keyword == 'take_screenshot':
-            if locator:
-                self.logger.warning(f"Locator '{locator}' ignored for take_screenshot")
-            self.logger.info(f"Taking screenshot with name: {data}")
-            # Handle any open alerts before taking screenshot
-            try:
-                alert = self.driver.switch_to.alert
-                alert.accept()
-                self.logger.info("Alert dismissed before screenshot")
-            except:
-                pass  # No alert to dismiss
-
-            screenshot_dir = "reports/screenshots"
-            os.makedirs(screenshot_dir, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename_base = data.strip() if data else "screenshot"
-            filename = f"{filename_base}_{timestamp}.png"
-            file_path = os.path.join(screenshot_dir, filename)
-            self.driver.save_screenshot(file_path)
-            self.logger.info(f"Screenshot saved to: {file_path}")
-            return True
+    @KeywordRegistry.keyword('close_modal')
+    def close_modal(self, locator, data):
+        self.logger.info(f"Closing modal with locator: {locator}")
+        if not locator:
+            raise Exception("Locator is required for close_modal")
+        by_locator = self.by_locator(locator)
+        locator_value = by_locator[1]
+        try:
+            close_button = self.wait.until(EC.element_to_be_clickable(by_locator))
+            close_button.click()
+        except TimeoutException:
+            self.logger.warning(f"Close button {locator} not found, attempting JavaScript modal close")
+            self.driver.execute_script("arguments[0].style.display='none';",
+                                       self.driver.find_element(By.ID, locator_value.split('=')[-1]))
+        return True
+
+    @KeywordRegistry.keyword('take_screenshot')
+    def take_screenshot(self, locator, data):
+        if locator:
+            self.logger.warning(f"Locator '{locator}' ignored for take_screenshot")
+        self.logger.info(f"Taking screenshot with name: {data}")
+        # Handle any open alerts before taking screenshot
+        try:
+            alert = self.driver.switch_to.alert
+            alert.accept()
+            self.logger.info("Alert dismissed before screenshot")
+        except:
+            pass  # No alert to dismiss
 
-        elif keyword in ['close_browser', 'closebrowser', 'quit']:
-            self.logger.info("Browser will be closed in teardown")
-            return True
+        filename_base = data.strip() if data else "screenshot"
+        file_path = ScreenshotService.default().capture(self.driver, filename_base)
+        self.logger.info(f"Screenshot queued: {file_path}")
+        return True
+
+    @KeywordRegistry.keyword('close_browser', 'closebrowser', 'quit')
+    def close_browser(self, locator, data):
+        self.logger.info("Browser will be closed in teardown")
+        return True
+
+    # ==================== LOCATORS ====================
 
-        else:
-            raise Exception(f"Unknown keyword: {keyword}")
+    def by_locator(self, locator):
+        """(By, value) for a 'type=value' locator, pre-parsed when it came from a compiled plan."""
+        by = self._locators.get(locator)
+        if by is None:
+            by = self._locators[locator] = self.get_by_locator(*self.parse_locator(locator))
+        return by
 
     def parse_locator(self, locator):
         """Parse locator string like 'id=login' into type and value"""
@@ -404,24 +453,9 @@ class KeywordEngine:
 
     def get_by_locator(self, locator_type, locator_value):
         """Get By locator tuple"""
-        locator_map = {
-            'id': By.ID,
-            'name': By.NAME,
-            'xpath': By.XPATH,
-            'css': By.CSS_SELECTOR,
-            'class': By.CLASS_NAME,
-            'classname': By.CLASS_NAME,
-            'tag': By.TAG_NAME,
-            'tagname': By.TAG_NAME,
-            'link': By.LINK_TEXT,
-            'linktext': By.LINK_TEXT,
-            'partial_link': By.PARTIAL_LINK_TEXT,
-            'partiallink': By.PARTIAL_LINK_TEXT
-        }
-
-        by_type = locator_map.get(locator_type.lower())
+        by_type = LOCATOR_MAP.get(locator_type.lower())
         if not by_type:
-            raise Exception(f"Unknown locator type: {locator_type}. Supported types: {list(locator_map.keys())}")
+            raise Exception(f"Unknown locator type: {locator_type}. Supported types: {list(LOCATOR_MAP.keys())}")
 
         return (by_type, locator_value)
 
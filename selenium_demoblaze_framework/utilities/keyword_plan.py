@@ -0,0 +1,188 @@
+# utilities/keyword_plan.py
+
+from collections import namedtuple
+from openpyxl import load_workbook
+from selenium.webdriver.common.by import By
+import configparser
+import hashlib
+import os
+import pickle
+import threading
+
+# One immutable row of a keyword sheet. `by` is the pre-parsed (By, value) locator,
+# or None when the step has no locator or its locator is malformed (the step then
+# fails when it runs, exactly as before).
+PlanStep = namedtuple('PlanStep', ['step', 'keyword', 'locator', 'data', 'by'])
+
+LOCATOR_MAP = {
+    'id': By.ID,
+    'name': By.NAME,
+    'xpath': By.XPATH,
+    'css': By.CSS_SELECTOR,
+    'class': By.CLASS_NAME,
+    'classname': By.CLASS_NAME,
+    'tag': By.TAG_NAME,
+    'tagname': By.TAG_NAME,
+    'link': By.LINK_TEXT,
+    'linktext': By.LINK_TEXT,
+    'partial_link': By.PARTIAL_LINK_TEXT,
+    'partiallink': By.PARTIAL_LINK_TEXT
+}
+
+
+class KeywordPlanLoader:
+    """
+    Turn keyword sheets into tuples of PlanStep records, once.
+
+    Sheets are read with openpyxl in read-only mode (no pandas), the header row
+    is mapped to column indexes once, and locators are parsed into By tuples at
+    load time. Each plan is pickled under `cache_dir` together with the file's
+    mtime, size and SHA-1: an unchanged mtime/size is trusted outright, and a
+    touched file whose content hash still matches keeps its cached plan.
+    """
+
+    CACHE_VERSION = 1
+
+    STEP_COLUMNS = ('Step', 'Test_Step_ID')
+    KEYWORD_COLUMNS = ('Keyword', 'Action')
+    DATA_COLUMNS = ('Data', 'Value')
+
+    def __init__(self, cache_dir=None, logger=None):
+        self.cache_dir = cache_dir
+        self.logger = logger
+
+    @classmethod
+    def from_config(cls, logger=None):
+        """Read plan_cache_dir from [KEYWORDS] in config.ini (empty = ./.cache/keyword_plans)."""
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+        if not config.getboolean('KEYWORDS', 'plan_cache_enabled', fallback=True):
+            return cls(cache_dir=None, logger=logger)
+        cache_dir = (config.get('KEYWORDS', 'plan_cache_dir', fallback='')
+                     or os.path.join(os.getcwd(), '.cache', 'keyword_plans'))
+        return cls(cache_dir=cache_dir, logger=logger)
+
+    @staticmethod
+    def parse_locator(locator):
+        """Parse a 'type=value' locator into a (By, value) tuple."""
+        if not locator:
+            raise Exception("Locator is empty")
+
+        if '=' not in locator:
+            raise Exception(f"Invalid locator format: {locator}. Expected format: 'type=value'")
+
+        locator_type, locator_value = (part.strip() for part in locator.split('=', 1))
+        by_type = LOCATOR_MAP.get(locator_type.lower())
+        if not by_type:
+            raise Exception(f"Unknown locator type: {locator_type}. Supported types: {list(LOCATOR_MAP.keys())}")
+        return by_type, locator_value
+
+    def load(self, excel_file, sheet_name):
+        """Return the sheet's steps as a tuple of PlanStep, from the disk cache when possible."""
+        excel_file = os.path.abspath(excel_file)
+        stat = os.stat(excel_file)
+        cache_file = self._cache_file(excel_file, sheet_name)
+
+        cached = self._read_cache(cache_file)
+        digest = None
+        if cached:
+            if (cached['mtime_ns'], cached['size']) == (stat.st_mtime_ns, stat.st_size):
+                return cached['steps']
+            digest = self._digest(excel_file)
+            if cached['sha1'] == digest:
+                self._write_cache(cache_file, stat, digest, cached['steps'])
+                return cached['steps']
+
+        steps = self.read_sheet(excel_file, sheet_name)
+        if cache_file:
+            self._write_cache(cache_file, stat, digest or self._digest(excel_file), steps)
+        return steps
+
+    def read_sheet(self, excel_file, sheet_name):
+        """Parse a sheet into PlanStep records without touching the cache."""
+        workbook = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            header = [str(name).strip() if name is not None else '' for name in next(rows, ())]
+            if self.logger:
+                self.logger.info(f"Excel columns: {header}")
+
+            def column(*names):
+                return next((header.index(name) for name in names if name in header), None)
+
+            step_col = column(*self.STEP_COLUMNS)
+            keyword_col = column(*self.KEYWORD_COLUMNS)
+            locator_col = column('Locator')
+            type_col, value_col = column('Locator_Type'), column('Locator_Value')
+            data_col = column(*self.DATA_COLUMNS)
+
+            steps = []
+            for index, row in enumerate(rows):
+                def cell(col):
+                    value = row[col] if col is not None and col < len(row) else None
+                    return str(value).strip() if value is not None else ''
+
+                keyword = cell(keyword_col)
+                if not keyword:
+                    if any(value is not None for value in row) and self.logger:
+                        self.logger.warning(f"Skipping row {index + 1}: No keyword/action found")
+                    continue
+
+                locator = cell(locator_col)
+                if not locator and type_col is not None and value_col is not None:
+                    locator_type, locator_value = cell(type_col), cell(value_col)
+                    locator = f"{locator_type}={locator_value}" if locator_type and locator_value else ''
+
+                step = row[step_col] if step_col is not None and row[step_col] is not None else index + 1
+                steps.append(PlanStep(step, keyword, locator, cell(data_col), self._try_parse(locator)))
+        finally:
+            workbook.close()
+
+        if self.logger:
+            self.logger.info(f"Number of steps: {len(steps)}")
+        return tuple(steps)
+
+    def _try_parse(self, locator):
+        if not locator:
+            return None
+        try:
+            return self.parse_locator(locator)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _digest(path):
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
+    def _cache_file(self, excel_file, sheet_name):
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha1(f"{excel_file}::{sheet_name}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.plan")
+
+    def _read_cache(self, cache_file):
+        if not cache_file:
+            return None
+        try:
+            with open(cache_file, 'rb') as file:
+                cached = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError):
+            return None
+        return cached if cached.get('version') == self.CACHE_VERSION else None
+
+    def _write_cache(self, cache_file, stat, digest, steps):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'wb') as file:
+            pickle.dump({
+                'version': self.CACHE_VERSION,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha1': digest,
+                'steps': steps
+            }, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
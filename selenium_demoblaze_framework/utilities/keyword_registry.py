@@ -0,0 +1,96 @@
+# utilities/keyword_registry.py
+
+import configparser
+import importlib
+import os
+import threading
+
+
+class UnknownKeywordError(Exception):
+    """Raised when a test sheet uses keywords that nothing has registered."""
+
+
+class KeywordRegistry:
+    """
+    Name -> handler table shared by every KeywordEngine.
+
+    Handlers are registered once, at import time, with the @KeywordRegistry.keyword
+    decorator (or register() for plain functions), under a canonical name and any
+    number of aliases. Lookup is a single dict access on the normalized name.
+    Every handler is called as handler(engine, locator, data).
+
+    Extra keyword modules ("plugins") are imported from the comma-separated
+    `plugins` option of the [KEYWORDS] section in config.ini; importing a module
+    is all it takes for its decorators to register its keywords.
+    """
+
+    _handlers = {}
+    _canonical_names = {}
+    _loaded_plugins = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name):
+        return str(name).strip().lower() if name else ''
+
+    @classmethod
+    def keyword(cls, name, *aliases, replace=False):
+        """Decorator registering a handler under a name and its aliases."""
+        def decorator(handler):
+            cls.register(name, handler, *aliases, replace=replace)
+            return handler
+        return decorator
+
+    @classmethod
+    def register(cls, name, handler, *aliases, replace=False):
+        """Register a handler; re-registering a name requires replace=True."""
+        canonical = cls.normalize(name)
+        names = [canonical] + [cls.normalize(alias) for alias in aliases]
+
+        with cls._lock:
+            if not replace:
+                taken = [n for n in names if n in cls._handlers and cls._handlers[n] is not handler]
+                if taken:
+                    raise ValueError(f"Keyword(s) already registered: {taken}. Pass replace=True to override.")
+            for n in names:
+                cls._handlers[n] = handler
+                cls._canonical_names[n] = canonical
+
+    @classmethod
+    def resolve(cls, name):
+        """Return the handler for a keyword, raising UnknownKeywordError if none is registered."""
+        handler = cls._handlers.get(cls.normalize(name))
+        if handler is None:
+            raise UnknownKeywordError(f"Unknown keyword: {name}")
+        return handler
+
+    @classmethod
+    def canonical_name(cls, name):
+        return cls._canonical_names.get(cls.normalize(name))
+
+    @classmethod
+    def is_registered(cls, name):
+        return cls.normalize(name) in cls._handlers
+
+    @classmethod
+    def names(cls):
+        """All registered names, aliases included."""
+        return sorted(cls._handlers)
+
+    @classmethod
+    def load_plugins(cls, modules=None):
+        """
+        Import keyword plugin modules so their decorators run.
+        Defaults to the `plugins` option of [KEYWORDS] in config.ini.
+        """
+        if modules is None:
+            config = configparser.ConfigParser()
+            config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+            modules = config.get('KEYWORDS', 'plugins', fallback='')
+        if isinstance(modules, str):
+            modules = [module.strip() for module in modules.split(',')]
+
+        for module in modules:
+            if module and module not in cls._loaded_plugins:
+                importlib.import_module(module)
+                cls._loaded_plugins.add(module)
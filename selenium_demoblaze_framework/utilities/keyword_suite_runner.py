@@ -0,0 +1,208 @@
+# utilities/keyword_suite_runner.py
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from openpyxl import load_workbook
+from selenium_demoblaze_framework.config.browser_config import BrowserConfig
+from selenium_demoblaze_framework.config.driver_pool import DriverPool
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+from selenium_demoblaze_framework.utilities.keyword_engine import KeywordEngine
+from selenium_demoblaze_framework.utilities.keyword_plan import KeywordPlanLoader
+import configparser
+import html
+import json
+import os
+import threading
+import time
+
+# One unit of scheduling: a single sheet of a workbook on a single browser
+SheetJob = namedtuple('SheetJob', ['workbook', 'sheet', 'browser'])
+
+
+class KeywordSuiteRunner:
+    """
+    Run every sheet of every workbook in a directory, in parallel.
+
+    Each browser gets a DriverPool of `sessions` local or Grid sessions; sheets
+    are scheduled onto whichever session is free. A sheet leases one session,
+    runs in a fresh KeywordEngine and returns the session reset (cookies,
+    storage, windows), so sheets never see each other's state. Step results
+    are streamed to `on_step(job, result)` as they finish and every sheet is
+    merged into one report.
+    """
+
+    def __init__(self, workbook_dir, browsers=None, sessions=None, grid_url=None, on_step=None,
+                 driver_factory=None):
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+        self.workbook_dir = workbook_dir
+        self.browsers = browsers or [b.strip() for b in
+                                     config.get('KEYWORD_SUITE', 'browsers', fallback='chrome').split(',')
+                                     if b.strip()]
+        self.sessions = sessions or config.getint('KEYWORD_SUITE', 'sessions', fallback=4)
+        self.grid_url = grid_url or config.get('KEYWORD_SUITE', 'grid_url', fallback='') or None
+        self.on_step = on_step
+        self.driver_factory = driver_factory or self._default_driver_factory
+        self.logger = CustomLogger.get_logger(self.__class__.__name__)
+        self._emit_lock = threading.Lock()
+
+    def discover(self):
+        """
+        Every (workbook, sheet, browser) combination under workbook_dir, in a stable order.
+        Sheets without an Action/Keyword header column are data, not tests, and are skipped.
+        """
+        jobs = []
+        for root, dirs, files in os.walk(self.workbook_dir):
+            dirs.sort()
+            for name in sorted(files):
+                # Skip Excel's "~$" lock files
+                if not name.lower().endswith('.xlsx') or name.startswith('~$'):
+                    continue
+                path = os.path.join(root, name)
+                workbook = load_workbook(path, read_only=True)
+                try:
+                    sheet_names = [sheet for sheet in workbook.sheetnames if self._is_keyword_sheet(workbook[sheet])]
+                finally:
+                    workbook.close()
+                for sheet in sheet_names:
+                    for browser in self.browsers:
+                        jobs.append(SheetJob(path, sheet, browser))
+        return jobs
+
+    @staticmethod
+    def _is_keyword_sheet(sheet):
+        """Data sheets (Users, Products, ...) share the directory; only sheets with a keyword column are tests."""
+        header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+        return any(str(name).strip() in KeywordPlanLoader.KEYWORD_COLUMNS for name in header if name is not None)
+
+    def run(self, jobs=None):
+        """Run all jobs and return one result dict per sheet, in discovery order."""
+        jobs = self.discover() if jobs is None else jobs
+        if not jobs:
+            self.logger.warning(f"No keyword sheets found in {self.workbook_dir}")
+            return []
+
+        pools = {
+            browser: DriverPool(browser, size=self.sessions,
+                                factory=lambda browser=browser: self.driver_factory(browser))
+            for browser in {job.browser for job in jobs}
+        }
+        self.logger.info(f"Running {len(jobs)} sheet(s) on {len(pools)} browser(s) x {self.sessions} session(s)")
+
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.sessions * len(pools),
+                                    thread_name_prefix='keyword-sheet') as executor:
+                futures = {executor.submit(self._run_sheet, pools[job.browser], job): job for job in jobs}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        finally:
+            for pool in pools.values():
+                pool.shutdown()
+
+        return [results[job] for job in jobs]
+
+    def _run_sheet(self, pool, job):
+        start = time.monotonic()
+        steps, error, driver = [], None, None
+        try:
+            driver = pool.lease()
+            engine = KeywordEngine(driver)
+            steps = engine.execute_test_case(job.workbook, job.sheet,
+                                             on_step=lambda result: self._emit(job, result))
+            if not steps:
+                error = "No steps executed (sheet empty or unreadable)"
+        except Exception as e:
+            self.logger.error(f"{os.path.basename(job.workbook)}[{job.sheet}] on {job.browser} failed: {e}")
+            error = str(e)
+        finally:
+            if driver is not None:
+                pool.release(driver)
+
+        return {
+            'workbook': job.workbook,
+            'sheet': job.sheet,
+            'browser': job.browser,
+            'steps': steps,
+            'passed': error is None and all(step['result'] for step in steps),
+            'error': error,
+            'duration': round(time.monotonic() - start, 2)
+        }
+
+    def _emit(self, job, result):
+        if self.on_step:
+            with self._emit_lock:
+                self.on_step(job, result)
+
+    def _default_driver_factory(self, browser):
+        browser_config = BrowserConfig(browser)
+        if self.grid_url:
+            return browser_config.get_remote_driver(self.grid_url)
+        return browser_config.get_driver()
+
+    @staticmethod
+    def generate_report(sheet_results, report_dir="reports"):
+        """Write the merged HTML report (plus the raw results as JSON) and return the HTML path."""
+        os.makedirs(report_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = os.path.join(report_dir, f"keyword_suite_report_{timestamp}.html")
+
+        with open(os.path.join(report_dir, f"keyword_suite_results_{timestamp}.json"), 'w', encoding='utf-8') as f:
+            json.dump(sheet_results, f, indent=2, default=str)
+
+        total_sheets = len(sheet_results)
+        passed_sheets = len([r for r in sheet_results if r['passed']])
+        total_steps = sum(len(r['steps']) for r in sheet_results)
+        failed_steps = sum(1 for r in sheet_results for step in r['steps'] if not step['result'])
+
+        rows = []
+        for result in sheet_results:
+            failures = [f"Step {step['step']} ({html.escape(str(step['keyword']))}): {html.escape(str(step['message']))}"
+                        for step in result['steps'] if not step['result']]
+            if result['error']:
+                failures.insert(0, html.escape(result['error']))
+            rows.append(f"""
+                    <tr class="{'pass' if result['passed'] else 'fail'}">
+                        <td>{html.escape(os.path.basename(result['workbook']))}</td>
+                        <td>{html.escape(result['sheet'])}</td>
+                        <td>{html.escape(result['browser'])}</td>
+                        <td>{len(result['steps'])}</td>
+                        <td>{result['duration']}s</td>
+                        <td>{'<br>'.join(failures) or 'Success'}</td>
+                    </tr>""")
+
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Keyword Suite Report</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
+                .container {{ max-width: 1200px; margin: 0 auto; background-color: white; padding: 20px; }}
+                table {{ border-collapse: collapse; width: 100%; margin-top: 20px; }}
+                th, td {{ border: 1px solid #ddd; padding: 10px; text-align: left; vertical-align: top; }}
+                th {{ background-color: #4CAF50; color: white; }}
+                .pass {{ background-color: #d4edda; }}
+                .fail {{ background-color: #f8d7da; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>Keyword Suite Report</h1>
+                <p><strong>Sheets:</strong> {passed_sheets}/{total_sheets} passed &nbsp;
+                   <strong>Steps:</strong> {total_steps - failed_steps}/{total_steps} passed &nbsp;
+                   <strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+                <table>
+                    <tr><th>Workbook</th><th>Sheet</th><th>Browser</th><th>Steps</th><th>Duration</th><th>Failures</th></tr>
+                    {''.join(rows)}
+                </table>
+            </div>
+        </body>
+        </html>
+        """
+
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        return report_file
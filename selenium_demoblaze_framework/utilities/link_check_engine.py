@@ -0,0 +1,220 @@
+# utilities/link_check_engine.py
+
+import configparser
+import requests
+from requests.adapters import HTTPAdapter
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+from selenium_demoblaze_framework.utilities.link_status_cache import LinkStatusCache
+import os
+import threading
+
+
+class LinkCheckEngine:
+    """
+    Check many URLs concurrently.
+
+    - a bounded thread pool fed from per-host queues: a URL is only submitted
+      while its host is under the per-host limit, so no worker sits waiting on a
+      busy host and a page with hundreds of links finishes in roughly the time
+      of its slowest host
+    - one pooled requests.Session shared by all workers (keep-alive per host)
+    - HEAD first, GET fallback for servers that reject or mishandle HEAD
+    - each distinct URL is requested once, however many elements point to it
+    - with a LinkStatusCache, fresh results skip the network entirely and
+      stale ones are revalidated with If-None-Match / If-Modified-Since
+    """
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    SKIPPED_PREFIXES = ('javascript:', 'mailto:', 'tel:', '#', 'data:')
+
+    def __init__(self, max_workers=16, per_host_limit=4, timeout=10, verify=True, logger=None, cache=None):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.verify = verify
+        self.logger = logger
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': self.USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, logger=None, **overrides):
+        """Build an engine (and its persistent cache) from the [LINK_CHECKER] section of config.ini."""
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+        cache = None
+        if config.getboolean('LINK_CHECKER', 'cache_enabled', fallback=False):
+            cache_path = (config.get('LINK_CHECKER', 'cache_path', fallback='')
+                          or os.path.join(os.getcwd(), '.cache', 'link_status.sqlite'))
+            cache = LinkStatusCache(cache_path, ttl=config.getint('LINK_CHECKER', 'cache_ttl', fallback=86400))
+
+        settings = {
+            'max_workers': config.getint('LINK_CHECKER', 'max_workers', fallback=16),
+            'per_host_limit': config.getint('LINK_CHECKER', 'per_host_limit', fallback=4),
+            'timeout': config.getint('LINK_CHECKER', 'timeout', fallback=10),
+            'cache': cache
+        }
+        settings.update(overrides)
+        return cls(logger=logger, **settings)
+
+    @staticmethod
+    def normalize_url(url):
+        """Turn protocol-relative and bare 'www.' URLs into absolute https URLs."""
+        url = url.strip()
+        if url.startswith("//"):
+            return "https:" + url
+        if url.startswith("www."):
+            return "https://" + url
+        return url
+
+    def check_urls(self, urls):
+        """
+        Check every distinct URL in parallel.
+        Returns {url: (is_broken, status_code, status_text)} keyed by the URLs as given.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+
+        if self.logger:
+            self.logger.info(f"Checking {len(unique_urls)} unique URLs with {self.max_workers} workers")
+
+        # One queue per host; a URL is only handed to a worker once its host has a free
+        # slot, so a page that mostly links to one host never parks every worker on it
+        queues = {}
+        for url in unique_urls:
+            queues.setdefault(self._host(url), deque()).append(url)
+        busy = dict.fromkeys(queues, 0)
+        in_flight = {}
+        results = {}
+
+        workers = min(self.max_workers, len(unique_urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='link-check') as executor:
+            while queues or in_flight:
+                submitted = True
+                while submitted and len(in_flight) < workers:
+                    submitted = False
+                    for host in list(queues):  # Round-robin across hosts
+                        if len(in_flight) >= workers:
+                            break
+                        if busy[host] >= self.per_host_limit:
+                            continue
+                        url = queues[host].popleft()
+                        if not queues[host]:
+                            del queues[host]
+                        in_flight[executor.submit(self.check_url, url)] = (url, host)
+                        busy[host] += 1
+                        submitted = True
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, host = in_flight.pop(future)
+                    busy[host] -= 1
+                    results[url] = future.result()
+
+        return {url: results[url] for url in unique_urls}
+
+    def check_url(self, url):
+        """
+        Check if a URL is accessible.
+        Returns (is_broken, status_code, status_text)
+        """
+        try:
+            if url.strip().startswith(self.SKIPPED_PREFIXES):
+                return False, None, "Skipped (non-HTTP)"
+
+            url = self.normalize_url(url)
+            if not url.startswith(("http://", "https://")):
+                return True, None, "Invalid URL scheme"
+
+            entry = self.cache.get(url) if self.cache else None
+            if entry and self.cache.is_fresh(entry):
+                return entry['is_broken'], entry['status_code'], entry['reason']
+
+            with self._host_slot(url):
+                response = self._request(url, self._conditional_headers(entry))
+
+            if response.status_code == 304 and entry:
+                self.cache.touch(url, etag=response.headers.get('ETag'),
+                                 last_modified=response.headers.get('Last-Modified'))
+                return entry['is_broken'], entry['status_code'], entry['reason']
+
+            if response.status_code >= 400:
+                result = (True, response.status_code, response.reason)
+            else:
+                result = (False, response.status_code, "OK")
+
+            # Only definitive HTTP answers are cached; rate limiting (429), server errors (5xx),
+            # timeouts and connection errors are transient and retried next run
+            if self.cache and not self.is_transient(response.status_code):
+                self.cache.put(url, *result, etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
+            return result
+
+        except requests.exceptions.Timeout:
+            return True, None, "Timeout"
+        except requests.exceptions.ConnectionError:
+            return True, None, "Connection Error"
+        except requests.exceptions.RequestException as e:
+            return True, None, f"Request Error: {str(e)}"
+        except Exception as e:
+            return True, None, f"Unexpected Error: {str(e)}"
+
+    @staticmethod
+    def is_transient(status_code):
+        """429 Too Many Requests and 5xx answers may be gone in a minute; don't remember them."""
+        return status_code == 429 or status_code >= 500
+
+    @staticmethod
+    def _conditional_headers(entry):
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _request(self, url, headers=None):
+        """HEAD first (no body); fall back to a streamed GET when HEAD is rejected."""
+        response = self.session.head(url, timeout=self.timeout, allow_redirects=True,
+                                     verify=self.verify, headers=headers)
+        if response.status_code >= 400:
+            response.close()
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True,
+                                        verify=self.verify, headers=headers, stream=True)
+            response.close()  # Status is all we need - don't download the body
+        return response
+
+    def _host(self, url):
+        return urlparse(self.normalize_url(url)).netloc.lower()
+
+    def _host_slot(self, url):
+        # check_urls() already keeps each host under its limit; this guards direct check_url() callers
+        host = self._host(url)
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+        return slot
+
+    def close(self):
+        """Close pooled connections and the cache's database connections."""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,20 +1,63 @@
-import requests
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException
-from urllib.parse import urljoin, urlparse
+from selenium_demoblaze_framework.utilities.link_check_engine import LinkCheckEngine
+from urllib.parse import urlparse
 from datetime import datetime
 import os
-import time
 
 
 class LinkCheckerUtils:
+    # One script call collects every link/image (tagged so broken ones can be highlighted later)
+    HARVEST_JS = """
+    var includeImages = arguments[0];
+    var results = [];
+    document.querySelectorAll('a').forEach(function(el, i) {
+        var id = 'a' + i;
+        var href = el.getAttribute('href');
+        el.setAttribute('data-link-check-id', id);
+        results.push({
+            id: id,
+            type: 'link',
+            url: href === null ? '' : (typeof el.href === 'string' ? el.href : href),
+            text: (el.innerText || '').trim()
+        });
+    });
+    if (includeImages) {
+        document.querySelectorAll('img').forEach(function(el, i) {
+            var id = 'img' + i;
+            el.setAttribute('data-link-check-id', id);
+            results.push({id: id, type: 'image', url: el.getAttribute('src') === null ? '' : el.src, text: el.alt});
+        });
+    }
+    return results;
+    """
+
+    HIGHLIGHT_JS = """
+    var title = arguments[1];
+    arguments[0].forEach(function(id) {
+        var el = document.querySelector('[data-link-check-id="' + id + '"]');
+        if (el) {
+            el.style.border = '3px solid red';
+            el.title = title;
+        }
+    });
+    """
+
+    NON_HTTP_PREFIXES = ('javascript:', 'mailto:', 'tel:', '#')
+
     def __init__(self, driver, logger):
         self.driver = driver
         self.logger = logger
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        self.engine = LinkCheckEngine.from_config(logger=logger)
+        self.session = self.engine.session
+
+    def close(self):
+        """Release the engine's HTTP connections and cache handles."""
+        self.engine.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def check_all_links(self, check_images=False):
         """
@@ -22,222 +65,74 @@ class LinkCheckerUtils:
         Highlights broken links with red border.
         Returns list of results.
         """
-        results = []
-        elements_to_check = []
-
-        # Get all <a> tags
-        try:
-            links = self.driver.find_elements(By.TAG_NAME, "a")
-            for el in links:
-                elements_to_check.append(('link', el))
-        except Exception as e:
-            self.logger.error(f"Error fetching links: {e}")
-
-        # Optionally get all <img> tags
-        if check_images:
-            try:
-                images = self.driver.find_elements(By.TAG_NAME, "img")
-                for el in images:
-                    elements_to_check.append(('image', el))
-            except Exception as e:
-                self.logger.error(f"Error fetching images: {e}")
-
-        self.logger.info(f"Found {len(elements_to_check)} elements to check")
-
-        for index, (el_type, element) in enumerate(elements_to_check, 1):
-            try:
-                if el_type == 'link':
-                    url = element.get_attribute("href")
-                    text = element.text or "No text"
-                else:  # image
-                    url = element.get_attribute("src")
-                    text = element.get_attribute("alt") or "Image"
-
-                if not url:
-                    continue
-
-                self.logger.info(f"Checking {el_type} {index}/{len(elements_to_check)}: {url}")
-
-                is_broken, status_code, status_text = self.check_link_status(url)
-
-                results.append({
-                    'url': url,
-                    'text': text,
-                    'type': el_type,
-                    'is_broken': is_broken,
-                    'status_code': status_code,
-                    'status_text': status_text
-                })
-
-                # 🔴 Highlight broken links/images on the page
-                if is_broken:
-                    try:
-                        self.driver.execute_script(
-                            "arguments[0].style.border = '3px solid red'; "
-                            "arguments[0].title = 'BROKEN LINK';",
-                            element
-                        )
-                        self.logger.warning(f"Highlighted broken {el_type}: {url}")
-                    except StaleElementReferenceException:
-                        self.logger.warning(f"Could not highlight broken {el_type} (element stale): {url}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to highlight element: {e}")
-
-                # Optional: small delay to avoid overwhelming server
-                time.sleep(0.1)
-
-            except StaleElementReferenceException:
-                self.logger.warning(f"Skipping stale element during link check")
-                continue
-            except Exception as e:
-                self.logger.error(f"Error checking element: {str(e)}")
-
-        return results
+        elements = self._harvest(check_images)
+        self.logger.info(f"Found {len(elements)} elements to check")
+        return self._check_elements([el for el in elements if el['url']], "BROKEN LINK")
 
     def check_internal_links_only(self, base_url):
         """
         Check only internal links (same domain as base_url)
         """
-        results = []
-        elements = self.driver.find_elements(By.TAG_NAME, "a")
-
-        parsed_base = urlparse(base_url)
-        base_domain = parsed_base.netloc
-
-        for el in elements:
-            try:
-                url = el.get_attribute("href")
-                if not url:
-                    continue
-
-                # Skip non-HTTP links
-                if url.startswith(('javascript:', 'mailto:', 'tel:', '#')):
-                    continue
-
-                parsed_url = urlparse(url)
-                link_domain = parsed_url.netloc
-
-                # Check if internal: same domain or relative URL
-                if not link_domain or link_domain == base_domain:
-                    is_broken, status_code, status_text = self.check_link_status(url)
-                    text = el.text or "No text"
-                    results.append({
-                        'url': url,
-                        'text': text,
-                        'type': 'link',
-                        'is_broken': is_broken,
-                        'status_code': status_code,
-                        'status_text': status_text
-                    })
-
-                    # 🔴 Highlight broken internal links
-                    if is_broken:
-                        try:
-                            self.driver.execute_script(
-                                "arguments[0].style.border = '3px solid red'; "
-                                "arguments[0].title = 'BROKEN INTERNAL LINK';",
-                                el
-                            )
-                        except:
-                            pass
-
-            except Exception as e:
-                self.logger.warning(f"Error checking internal link: {e}")
-                continue
-
-        return results
+        base_domain = urlparse(base_url).netloc
+        elements = [el for el in self._harvest() if self._is_http_link(el['url'])
+                    and urlparse(el['url']).netloc in ('', base_domain)]
+        return self._check_elements(elements, "BROKEN INTERNAL LINK")
 
     def check_external_links_only(self, base_url):
         """
         Check only external links (different domain than base_url)
         """
-        results = []
-        elements = self.driver.find_elements(By.TAG_NAME, "a")
-
-        parsed_base = urlparse(base_url)
-        base_domain = parsed_base.netloc
-
-        for el in elements:
-            try:
-                url = el.get_attribute("href")
-                if not url:
-                    continue
-
-                if url.startswith(('javascript:', 'mailto:', 'tel:', '#')):
-                    continue
-
-                parsed_url = urlparse(url)
-                link_domain = parsed_url.netloc
-
-                # Check if external: different domain and not empty
-                if link_domain and link_domain != base_domain:
-                    is_broken, status_code, status_text = self.check_link_status(url)
-                    text = el.text or "No text"
-                    results.append({
-                        'url': url,
-                        'text': text,
-                        'type': 'link',
-                        'is_broken': is_broken,
-                        'status_code': status_code,
-                        'status_text': status_text
-                    })
-
-                    # 🔴 Highlight broken external links
-                    if is_broken:
-                        try:
-                            self.driver.execute_script(
-                                "arguments[0].style.border = '3px solid red'; "
-                                "arguments[0].title = 'BROKEN EXTERNAL LINK';",
-                                el
-                            )
-                        except:
-                            pass
-
-            except Exception as e:
-                self.logger.warning(f"Error checking external link: {e}")
-                continue
-
-        return results
+        base_domain = urlparse(base_url).netloc
+        elements = [el for el in self._harvest() if self._is_http_link(el['url'])
+                    and urlparse(el['url']).netloc not in ('', base_domain)]
+        return self._check_elements(elements, "BROKEN EXTERNAL LINK")
 
     def check_link_status(self, url):
         """
         Check if a URL is accessible.
         Returns (is_broken, status_code, status_text)
         """
-        try:
-            # Skip non-HTTP(S) links
-            if url.strip().startswith(('javascript:', 'mailto:', 'tel:', '#', 'data:')):
-                return False, None, "Skipped (non-HTTP)"
-
-            # Normalize URL
-            if url.startswith("//"):
-                url = "https:" + url
-            elif url.startswith("www."):
-                url = "https://" + url
+        return self.engine.check_url(url)
 
-            if not url.startswith(("http://", "https://")):
-                return True, None, "Invalid URL scheme"
+    def _harvest(self, check_images=False):
+        """Collect url/text/type of every link (and image) in a single driver round trip."""
+        try:
+            return self.driver.execute_script(self.HARVEST_JS, check_images)
+        except Exception as e:
+            self.logger.error(f"Error fetching links: {e}")
+            return []
 
-            # Try HEAD first (faster)
-            response = self.session.head(url, timeout=10, allow_redirects=True)
+    def _is_http_link(self, url):
+        return bool(url) and not url.startswith(self.NON_HTTP_PREFIXES)
 
-            # If HEAD returns error, try GET (some servers block HEAD)
-            if response.status_code >= 400:
-                response = self.session.get(url, timeout=10, allow_redirects=True)
+    def _check_elements(self, elements, highlight_title):
+        """Check the harvested elements' URLs in parallel and highlight broken ones in one call."""
+        statuses = self.engine.check_urls(el['url'] for el in elements)
 
-            if response.status_code >= 400:
-                return True, response.status_code, response.reason
-            else:
-                return False, response.status_code, "OK"
+        results = []
+        broken_ids = []
+        for el in elements:
+            is_broken, status_code, status_text = statuses[el['url']]
+            results.append({
+                'url': el['url'],
+                'text': el['text'] or ("Image" if el['type'] == 'image' else "No text"),
+                'type': el['type'],
+                'is_broken': is_broken,
+                'status_code': status_code,
+                'status_text': status_text
+            })
+            if is_broken:
+                broken_ids.append(el['id'])
+                self.logger.warning(f"Broken {el['type']}: {el['url']} ({status_code or status_text})")
+
+        # 🔴 Highlight broken links/images on the page
+        if broken_ids:
+            try:
+                self.driver.execute_script(self.HIGHLIGHT_JS, broken_ids, highlight_title)
+            except Exception as e:
+                self.logger.error(f"Failed to highlight broken elements: {e}")
 
-        except requests.exceptions.Timeout:
-            return True, None, "Timeout"
-        except requests.exceptions.ConnectionError:
-            return True, None, "Connection Error"
-        except requests.exceptions.RequestException as e:
-            return True, None, f"Request Error: {str(e)}"
-        except Exception as e:
-            return True, None, f"Unexpected Error: {str(e)}"
+        return results
 
     def generate_link_report(self, results, output_file=None):
         """
@@ -0,0 +1,116 @@
+# utilities/link_status_cache.py
+
+from urllib.parse import urlsplit, urlunsplit
+import os
+import sqlite3
+import threading
+import time
+
+
+class LinkStatusCache:
+    """
+    On-disk cache of link check results, keyed by normalized URL.
+
+    Backed by SQLite in WAL mode with a busy timeout, so every xdist worker
+    (and every checker thread, each with its own connection) can share one
+    file. Entries younger than `ttl` seconds are served without network I/O;
+    older ones keep their ETag/Last-Modified for conditional revalidation.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS link_status (
+        url TEXT PRIMARY KEY,
+        is_broken INTEGER NOT NULL,
+        status_code INTEGER,
+        reason TEXT,
+        etag TEXT,
+        last_modified TEXT,
+        checked_at REAL NOT NULL
+    )
+    """
+
+    DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+    def __init__(self, db_path, ttl=86400):
+        self.db_path = os.path.abspath(db_path)
+        self.ttl = ttl
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._connection().execute(self.SCHEMA)
+
+    @classmethod
+    def normalize_url(cls, url):
+        """Lower-case scheme and host, drop default ports and fragments, use '/' for an empty path."""
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or '').lower()
+        if parts.port and parts.port != cls.DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+    def get(self, url):
+        """Return the cached entry for a URL as a dict, or None."""
+        row = self._connection().execute(
+            "SELECT is_broken, status_code, reason, etag, last_modified, checked_at "
+            "FROM link_status WHERE url = ?", (self.normalize_url(url),)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'is_broken': bool(row[0]),
+            'status_code': row[1],
+            'reason': row[2],
+            'etag': row[3],
+            'last_modified': row[4],
+            'checked_at': row[5]
+        }
+
+    def is_fresh(self, entry):
+        """True if the entry can be served without touching the network."""
+        return time.time() - entry['checked_at'] < self.ttl
+
+    def put(self, url, is_broken, status_code, reason, etag=None, last_modified=None):
+        """Store (or replace) a check result."""
+        self._connection().execute(
+            "INSERT OR REPLACE INTO link_status "
+            "(url, is_broken, status_code, reason, etag, last_modified, checked_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.normalize_url(url), int(is_broken), status_code, reason, etag, last_modified, time.time())
+        )
+
+    def touch(self, url, etag=None, last_modified=None):
+        """
+        Mark an entry as just revalidated (e.g. after a 304 Not Modified), taking
+        any new ETag / Last-Modified the response carried.
+        """
+        self._connection().execute(
+            "UPDATE link_status SET checked_at = ?, etag = COALESCE(?, etag), "
+            "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+            (time.time(), etag, last_modified, self.normalize_url(url))
+        )
+
+    def clear(self):
+        """Remove every cached entry."""
+        self._connection().execute("DELETE FROM link_status")
+
+    def close(self):
+        """Close the connection of every thread that used the cache."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Autocommit: each statement is its own short transaction, so workers never block for long.
+            # Each thread keeps to its own connection; check_same_thread is off only so close() can reach them all
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA busy_timeout=30000")
+            with self._connections_lock:
+                self._connections.append(connection)
+                self._local.connection = connection
+        return connection
@@ -0,0 +1,257 @@
+# utilities/screenshot_service.py
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from PIL import Image, features
+from selenium.common.exceptions import WebDriverException
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+import atexit
+import base64
+import configparser
+import hashlib
+import io
+import os
+import threading
+import time
+
+
+class ScreenshotService:
+    """
+    Capture screenshots on the test thread, encode and write them in the background.
+
+    The test thread only grabs the PNG bytes from the driver (once) and hashes
+    them; down-scaling, JPEG/WebP conversion and the disk write run on a small
+    thread pool. The file path is decided up front, so callers get it back
+    immediately. Frames identical to one already saved are not written again -
+    the existing path is returned instead. Call flush() before reading the files.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    EXTENSIONS = {'png': 'png', 'jpeg': 'jpg', 'webp': 'webp'}
+
+    def __init__(self, directory=None, image_format=None, quality=None, max_width=None, workers=None,
+                 dedupe=None):
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+        self.directory = (directory or config.get('SCREENSHOTS', 'directory', fallback='')
+                          or os.path.join(os.getcwd(), 'reports', 'screenshots'))
+        self.image_format = self._resolve_format(image_format or config.get('SCREENSHOTS', 'format',
+                                                                            fallback='png'))
+        self.quality = quality or config.getint('SCREENSHOTS', 'quality', fallback=85)
+        self.max_width = max_width if max_width is not None else config.getint('SCREENSHOTS', 'max_width',
+                                                                                fallback=0)
+        self.dedupe = dedupe if dedupe is not None else config.getboolean('SCREENSHOTS', 'dedupe',
+                                                                           fallback=True)
+        workers = workers or config.getint('SCREENSHOTS', 'workers', fallback=2)
+
+        self.logger = CustomLogger.get_logger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='screenshot')
+        self._pending = set()
+        self._written = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        """The process-wide service configured from [SCREENSHOTS]."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def shutdown_all(cls):
+        """Finish pending writes of the process-wide service and stop its threads."""
+        with cls._default_lock:
+            service, cls._default = cls._default, None
+        if service is not None:
+            service.shutdown()
+
+    # ==================== CAPTURE ====================
+
+    def capture(self, driver, name='screenshot'):
+        """Grab the viewport once and queue it for saving. Returns the file path."""
+        return self.submit(driver.get_screenshot_as_png(), name)
+
+    def capture_element(self, element, name='element'):
+        """Grab a single element once and queue it for saving. Returns the file path."""
+        return self.submit(element.screenshot_as_png, name)
+
+    def capture_full_page(self, driver, name='fullpage'):
+        """Grab the whole page (see full_page_png()) and queue it for saving. Returns the file path."""
+        return self.submit(self.full_page_png(driver), name)
+
+    def submit(self, png, name='screenshot'):
+        """
+        Queue already captured PNG bytes for encoding and writing.
+        Returns the path the image is (or will be) written to; for a duplicate
+        frame that is the path of the first copy.
+        """
+        digest = hashlib.sha1(png).hexdigest() if self.dedupe else None
+        file_path = os.path.join(self.directory,
+                                 f"{self.unique_name(self.strip_extension(name))}.{self.EXTENSIONS[self.image_format]}")
+
+        with self._lock:
+            if digest and digest in self._written:
+                self.logger.debug("Duplicate screenshot '%s' skipped, same as %s", name, self._written[digest])
+                return self._written[digest]
+            if digest:
+                self._written[digest] = file_path
+            future = self._executor.submit(self._write, png, file_path)
+            self._pending.add(future)
+
+        future.add_done_callback(lambda done: self._finished(done, digest, file_path))
+        return file_path
+
+    def unique_name(self, base_name):
+        """base_name plus worker id, timestamp and a per-process counter."""
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
+        return f"{base_name}_{worker_id}_{timestamp}_{counter}"
+
+    @staticmethod
+    def strip_extension(name):
+        """'login.png' -> 'login': callers often pass file names, the service picks the extension."""
+        base, extension = os.path.splitext(name)
+        return base if extension.lower() in ('.png', '.jpg', '.jpeg', '.webp') else name
+
+    def flush(self, timeout=None):
+        """Block until every queued screenshot is on disk. Returns False on timeout."""
+        with self._lock:
+            pending = list(self._pending)
+        not_done = wait(pending, timeout=timeout).not_done
+        return not not_done
+
+    def shutdown(self):
+        """Flush and stop the worker threads."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    # ==================== FULL PAGE ====================
+
+    @staticmethod
+    def full_page_png(driver):
+        """
+        PNG bytes of the whole page, in a single round trip where possible:
+        Chromium uses CDP Page.captureScreenshot with captureBeyondViewport, Firefox
+        its native full-page screenshot; other drivers fall back to stitch_full_page().
+        """
+        try:
+            metrics = driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
+            size = metrics.get('cssContentSize') or metrics['contentSize']
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                'format': 'png',
+                'captureBeyondViewport': True,
+                'clip': {'x': 0, 'y': 0, 'width': size['width'], 'height': size['height'], 'scale': 1}
+            })
+            return base64.b64decode(result['data'])
+        except (AttributeError, KeyError, WebDriverException):
+            pass
+
+        if hasattr(driver, 'get_full_page_screenshot_as_png'):
+            try:
+                return driver.get_full_page_screenshot_as_png()
+            except WebDriverException:
+                pass
+
+        return ScreenshotService.stitch_full_page(driver)
+
+    @staticmethod
+    def stitch_full_page(driver, settle=0.1):
+        """
+        Scroll-and-stitch fallback for drivers without a full-page API.
+        Tiles are placed at the scroll offset the browser actually reached, so the
+        last (partial) viewport lines up, and scaled by the device pixel ratio so
+        HiDPI screens stitch correctly. The original scroll position is restored.
+        """
+        page_height, viewport_width, viewport_height, start_x, start_y = driver.execute_script(
+            "var d = document.documentElement, b = document.body;"
+            "return [Math.max(d.scrollHeight, b ? b.scrollHeight : 0), window.innerWidth,"
+            " window.innerHeight, window.scrollX, window.scrollY];")
+
+        canvas, ratio, offset, previous = None, 1, 0, None
+        try:
+            while True:
+                driver.execute_script("window.scrollTo(0, arguments[0]);", offset)
+                if settle:
+                    time.sleep(settle)  # Let lazy content and sticky headers settle
+                actual = driver.execute_script("return window.scrollY;")
+                if previous is not None and actual <= previous:
+                    break  # The page can't scroll any further
+
+                tile = Image.open(io.BytesIO(driver.get_screenshot_as_png()))
+                if canvas is None:
+                    ratio = tile.width / viewport_width if viewport_width else 1
+                    canvas = Image.new('RGB', (tile.width, round(page_height * ratio)))
+                canvas.paste(tile, (0, round(actual * ratio)))
+
+                if actual + viewport_height >= page_height:
+                    break
+                previous, offset = actual, actual + viewport_height
+        finally:
+            driver.execute_script("window.scrollTo(arguments[0], arguments[1]);", start_x, start_y)
+
+        output = io.BytesIO()
+        canvas.save(output, 'PNG')
+        return output.getvalue()
+
+    # ==================== ENCODING ====================
+
+    def encode(self, png):
+        """Down-scale and convert PNG bytes to the configured format."""
+        if self.image_format == 'png' and not self.max_width:
+            return png
+
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+
+        output = io.BytesIO()
+        if self.image_format == 'jpeg':
+            image.convert('RGB').save(output, 'JPEG', quality=self.quality, optimize=True)
+        elif self.image_format == 'webp':
+            image.save(output, 'WEBP', quality=self.quality, method=4)
+        else:
+            image.save(output, 'PNG', optimize=True)
+        return output.getvalue()
+
+    def _write(self, png, file_path):
+        data = self.encode(png)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_file = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'wb') as file:
+            file.write(data)
+        os.replace(temp_file, file_path)
+        return file_path
+
+    def _finished(self, future, digest, file_path):
+        with self._lock:
+            self._pending.discard(future)
+            error = future.exception()
+            # Let a later identical frame try again
+            if error and digest and self._written.get(digest) == file_path:
+                del self._written[digest]
+        if error:
+            self.logger.error(f"Failed to save screenshot {file_path}: {error}")
+        else:
+            self.logger.info(f"Screenshot saved: {file_path}")
+
+    def _resolve_format(self, image_format):
+        image_format = image_format.strip().lower()
+        image_format = 'jpeg' if image_format == 'jpg' else image_format
+        if image_format not in self.EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}. Use png, jpeg or webp")
+        if image_format == 'webp' and not features.check('webp'):
+            print("[ScreenshotService] Pillow has no WebP support, saving screenshots as JPEG")
+            return 'jpeg'
+        return image_format
+
+
+atexit.register(ScreenshotService.shutdown_all)
@@ -0,0 +1,159 @@
+# utilities/session_cache.py
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium_demoblaze_framework.pages.home_page import HomePage
+from selenium_demoblaze_framework.utilities.custom_logger import CustomLogger
+from urllib.parse import urlparse
+import configparser
+import copy
+import os
+import threading
+import time
+
+
+class SessionExpiredError(Exception):
+    """A restored session was not accepted by the site (token expired or revoked)."""
+
+
+class SessionCache:
+    """
+    Log each user in through the UI once per worker, then restore the session.
+
+    After the first login the cookies (DemoBlaze keeps its auth token in the
+    `tokenp_` cookie) and localStorage of the site are snapshotted in memory.
+    Later calls load the site once, add the cookies, write localStorage and
+    reload - no modal, no typing. A snapshot is treated as expired when it is
+    older than `ttl`, when the auth cookie is missing or past its expiry, or
+    when the restored page does not come up logged in; the user is then logged
+    in through the UI again and the snapshot replaced.
+    """
+
+    _sessions = {}
+    _sessions_lock = threading.Lock()
+    _user_locks = {}
+
+    def __init__(self, base_url=None, ttl=None, auth_cookie=None, login=None, logger=None):
+        config = configparser.ConfigParser()
+        config.read(os.path.join(os.path.dirname(__file__), '..', 'config', 'config.ini'))
+
+        self.base_url = base_url or config.get('DEFAULT', 'base_url', fallback='https://www.demoblaze.com')
+        self.ttl = ttl if ttl is not None else config.getint('SESSION_CACHE', 'ttl', fallback=1800)
+        self.auth_cookie = auth_cookie or config.get('SESSION_CACHE', 'auth_cookie', fallback='tokenp_')
+        self.enabled = config.getboolean('SESSION_CACHE', 'enabled', fallback=True)
+        self.logger = logger or CustomLogger.get_logger(self.__class__.__name__)
+        self._login = login or self.ui_login
+
+    def login(self, driver, username, password):
+        """
+        Make `driver` logged in as username, restoring a cached session when possible.
+        Returns 'restored' or 'logged_in'.
+        """
+        key = (urlparse(self.base_url).netloc, username)
+        with self._sessions_lock:
+            user_lock = self._user_locks.setdefault(key, threading.Lock())
+
+        # One UI login per user at a time; other threads wait and then restore
+        with user_lock:
+            snapshot = self._sessions.get(key) if self.enabled else None
+            if snapshot and not self.is_expired(snapshot):
+                try:
+                    self.restore(driver, snapshot)
+                    self.logger.info(f"Restored cached session for {username}")
+                    return 'restored'
+                except SessionExpiredError as e:
+                    self.logger.info(f"Cached session for {username} rejected, logging in again: {e}")
+
+            self._login(driver, username, password)
+            snapshot = self.snapshot(driver)
+            if self.auth_cookie and not self._auth_cookie(snapshot):
+                raise SessionExpiredError(f"Login as {username} did not set the '{self.auth_cookie}' cookie")
+            with self._sessions_lock:
+                self._sessions[key] = snapshot
+            self.logger.info(f"Logged in as {username} and cached the session")
+            return 'logged_in'
+
+    @classmethod
+    def invalidate(cls, username=None):
+        """Forget the cached session of one user (or of everyone)."""
+        with cls._sessions_lock:
+            for key in [k for k in cls._sessions if username is None or k[1] == username]:
+                del cls._sessions[key]
+
+    # ==================== SNAPSHOT / RESTORE ====================
+
+    def snapshot(self, driver):
+        """Cookies and localStorage of the page the driver is on."""
+        return {
+            'origin': self._origin(driver.current_url),
+            'cookies': driver.get_cookies(),
+            'local_storage': driver.execute_script(
+                "var items = {};"
+                "for (var i = 0; i < window.localStorage.length; i++) {"
+                "  var key = window.localStorage.key(i); items[key] = window.localStorage.getItem(key);"
+                "}"
+                "return items;") or {},
+            'captured_at': time.time()
+        }
+
+    def restore(self, driver, snapshot):
+        """Load the snapshot into driver and reload so the page renders logged in."""
+        # Cookies and storage can only be written for the origin currently loaded
+        if self._origin(driver.current_url) != snapshot['origin']:
+            driver.get(snapshot['origin'])
+
+        driver.delete_all_cookies()
+        for cookie in copy.deepcopy(snapshot['cookies']):
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            driver.add_cookie(cookie)
+
+        driver.execute_script(
+            "window.localStorage.clear();"
+            "var items = arguments[0];"
+            "for (var key in items) { window.localStorage.setItem(key, items[key]); }",
+            snapshot['local_storage'])
+
+        driver.refresh()
+        if not self.is_logged_in(driver):
+            raise SessionExpiredError("Site did not accept the restored session")
+
+    def is_expired(self, snapshot, now=None):
+        """True if the snapshot is too old or its auth cookie is missing or expired."""
+        now = now or time.time()
+        if self.ttl and now - snapshot['captured_at'] > self.ttl:
+            return True
+        if not self.auth_cookie:
+            return False
+        cookie = self._auth_cookie(snapshot)
+        return cookie is None or ('expiry' in cookie and cookie['expiry'] <= now)
+
+    def is_logged_in(self, driver, timeout=5):
+        """The auth cookie is present and the navbar greets the user."""
+        if self.auth_cookie and driver.get_cookie(self.auth_cookie) is None:
+            return False
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.text_to_be_present_in_element(HomePage.WELCOME_USER, "Welcome"))
+            return True
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def ui_login(self, driver, username, password):
+        """The regular login through the modal; used the first time for each user."""
+        if self._origin(driver.current_url) != self._origin(self.base_url):
+            driver.get(self.base_url)
+        home_page = HomePage(driver, self.logger)
+        home_page.open_login_modal()
+        home_page.login(username, password)
+        if not self.is_logged_in(driver, timeout=home_page.timeout):
+            raise SessionExpiredError(f"UI login as {username} failed")
+
+    def _auth_cookie(self, snapshot):
+        return next((c for c in snapshot['cookies'] if c.get('name') == self.auth_cookie), None)
+
+    @staticmethod
+    def _origin(url):
+        parts = urlparse(url or '')
+        return f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else ''
@@ -1,24 +1,15 @@
 # utilities/utility_methods.py
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import *
-from PIL import Image
 import time
-import os
 import random
 import string
-import threading
-from datetime import datetime
 from faker import Faker
-import io  # Required for BytesIO in full-page screenshot
-
-# Thread-safe screenshot counter
-screenshot_lock = threading.Lock()
-screenshot_counter = {}
+from selenium_demoblaze_framework.utilities.screenshot_service import ScreenshotService
 
 
 class UtilityMethods:
@@ -28,98 +19,46 @@ class UtilityMethods:
         self.logger = logger
         self.faker = Faker()
 
-    def _get_thread_safe_filename(self, base_name):
-        """Generate a thread-safe unique filename."""
-        with screenshot_lock:
-            thread_id = threading.current_thread().ident
-            if thread_id not in screenshot_counter:
-                screenshot_counter[thread_id] = 0
-            screenshot_counter[thread_id] += 1
-            counter = screenshot_counter[thread_id]
-
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-        worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'master')
-
-        return f"{base_name}_{worker_id}_{timestamp}_{counter}"
-
     def take_screenshot(self, name=None):
-        """Take screenshot with thread-safe timestamp."""
+        """
+        Take screenshot with thread-safe timestamp.
+        Only the capture happens here; encoding and the file write are done by ScreenshotService.
+        """
         try:
             if not name:
                 name = "screenshot"
 
-            # Create screenshots directory in reports folder
-            screenshot_dir = os.path.join(os.getcwd(), 'reports', 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            # Generate thread-safe filename
-            filename = self._get_thread_safe_filename(name)
-            filepath = os.path.join(screenshot_dir, f"{filename}.png")
-
-            self.driver.save_screenshot(filepath)
-            self.logger.info(f"Screenshot saved: {filepath}")
+            filepath = ScreenshotService.default().capture(self.driver, name)
+            self.logger.info(f"Screenshot queued: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to take screenshot: {str(e)}")
             return None
 
     def take_element_screenshot(self, element, name=None):
-        """Take screenshot of specific element with thread-safe naming."""
+        """Take screenshot of specific element with thread-safe naming (written in the background)."""
         try:
             if not name:
                 name = "element"
 
-            screenshot_dir = os.path.join(os.getcwd(), 'reports', 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            # Generate thread-safe filename
-            filename = self._get_thread_safe_filename(name)
-            filepath = os.path.join(screenshot_dir, f"{filename}.png")
-
-            element.screenshot(filepath)
-            self.logger.info(f"Element screenshot saved: {filepath}")
+            filepath = ScreenshotService.default().capture_element(element, name)
+            self.logger.info(f"Element screenshot queued: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to take element screenshot: {str(e)}")
             return None
 
     def take_full_page_screenshot(self, name=None):
-        """Take full page screenshot by scrolling and stitching."""
+        """
+        Take full page screenshot: one CDP capture on Chromium, the native API on Firefox,
+        scrolling and stitching only as a fallback (see ScreenshotService.full_page_png).
+        """
         try:
             if not name:
                 name = "fullpage"
 
-            # Get full page dimensions
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
-            total_width = self.driver.execute_script("return document.body.scrollWidth")
-
-            # Create a blank image to stitch screenshots
-            stitched_image = Image.new('RGB', (total_width, total_height))
-
-            scroll_position = 0
-            while scroll_position < total_height:
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_position})")
-                time.sleep(0.5)  # Allow time for lazy content to load
-
-                # Capture screenshot of current viewport
-                screenshot_png = self.driver.get_screenshot_as_png()
-                screenshot_image = Image.open(io.BytesIO(screenshot_png))
-
-                # Paste into the full image at correct vertical offset
-                stitched_image.paste(screenshot_image, (0, scroll_position))
-
-                scroll_position += viewport_height
-
-            # Save stitched image with thread-safe naming
-            screenshot_dir = os.path.join(os.getcwd(), 'reports', 'screenshots')
-            os.makedirs(screenshot_dir, exist_ok=True)
-
-            filename = self._get_thread_safe_filename(name)
-            filepath = os.path.join(screenshot_dir, f"{filename}.png")
-
-            stitched_image.save(filepath)
-            self.logger.info(f"Full page screenshot saved: {filepath}")
+            filepath = ScreenshotService.default().capture_full_page(self.driver, name)
+            self.logger.info(f"Full page screenshot queued: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to take full page screenshot: {str(e)}")
@@ -339,21 +278,24 @@ class UtilityMethods:
         Returns a dict with counts and list of broken links.
         Thread-safe implementation for parallel execution.
         """
-        from urllib.parse import urljoin, urlparse
+        from urllib.parse import urlparse
         import requests
         from urllib3.exceptions import InsecureRequestWarning
+        from selenium_demoblaze_framework.utilities.link_check_engine import LinkCheckEngine
         requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
         self.logger.info("Checking for broken links...")
-        links = self.driver.find_elements(By.TAG_NAME, "a")
-        self.logger.info(f"Found {len(links)} links")
+        # One round trip for every href instead of a get_attribute call per link
+        hrefs = self.driver.execute_script(
+            "return Array.from(document.getElementsByTagName('a'), a => a.href || '');")
+        self.logger.info(f"Found {len(hrefs)} links")
 
         broken_links = []
         valid_links = []
         base_url = self.driver.current_url
 
-        for link in links:
-            href = link.get_attribute("href")
+        to_check = []
+        for href in hrefs:
             if not href or href.startswith(("javascript:", "#", "mailto:", "tel:")):
                 continue
             # Skip relative URLs (they cause SSL errors when treated as absolute)
@@ -365,21 +307,24 @@ class UtilityMethods:
             if check_external_only:
                 if urlparse(href).netloc == urlparse(base_url).netloc:
                     continue
+            to_check.append(href)
 
-            try:
-                # Use HEAD request for efficiency
-                response = requests.head(href, timeout=5, allow_redirects=True, verify=False)
-                # Fallback to GET if HEAD not allowed
-                if response.status_code >= 400 or response.status_code == 405:
-                    response = requests.get(href, timeout=5, verify=False)
-                if response.status_code >= 400:
-                    broken_links.append((href, response.status_code))
-                    self.logger.warning(f"BROKEN LINK: {href} | Status: {response.status_code}")
-                else:
-                    valid_links.append(href)
-            except Exception as e:
-                broken_links.append((href, f"Error: {str(e)}"))
-                self.logger.error(f"LINK ERROR: {href} | Exception: {e}")
+        engine = LinkCheckEngine.from_config(logger=self.logger, timeout=5, verify=False)
+        try:
+            statuses = engine.check_urls(to_check)
+        finally:
+            engine.close()
+
+        for href in to_check:
+            is_broken, status_code, status_text = statuses[href]
+            if not is_broken:
+                valid_links.append(href)
+            elif status_code is not None:
+                broken_links.append((href, status_code))
+                self.logger.warning(f"BROKEN LINK: {href} | Status: {status_code}")
+            else:
+                broken_links.append((href, f"Error: {status_text}"))
+                self.logger.error(f"LINK ERROR: {href} | Exception: {status_text}")
 
         summary = {
             "total_links_checked": len(valid_links) + len(broken_links),
@@ -3,9 +3,17 @@
 import xml.etree.ElementTree as ET
 from lxml import etree
 import os
+import threading
 
 
 class XMLUtils:
+    # Compiled XPath expressions (per thread - lxml evaluators are not shared across threads)
+    _xpath_local = threading.local()
+
+    # Compiled XSD schemas keyed by (path, mtime); validation itself is serialized per schema
+    _schema_cache = {}
+    _schema_lock = threading.Lock()
+
     @staticmethod
     def read_xml_data(file_path):
         """
@@ -13,20 +21,24 @@ class XMLUtils:
         Assumes each <testcase> element contains child elements representing key-value pairs.
         Returns a list of dictionaries.
         """
+        return list(XMLUtils.iter_xml_data(file_path))
+
+    @staticmethod
+    def iter_xml_data(file_path, tag='testcase'):
+        """
+        Stream <testcase> elements (at any depth) as dictionaries without building the whole tree.
+        Each element is cleared, and detached from its parent, as soon as it has been yielded.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"XML file not found: {file_path}")
 
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        data = []
-        for item in root.findall('.//testcase'):
-            test_data = {}
-            for child in item:
-                test_data[child.tag] = child.text
-            data.append(test_data)
+        for _, element in etree.iterparse(file_path, events=('end',), tag=tag):
+            # Skip comments and processing instructions (their tag is not a string)
+            yield {child.tag: child.text for child in element if isinstance(child.tag, str)}
 
-        return data
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
 
     @staticmethod
     def write_xml_data(file_path, data, root_name='testdata'):
@@ -57,35 +69,60 @@ class XMLUtils:
         Validate an XML file against an XSD schema using lxml.
         Returns True if valid, False otherwise.
         Raises FileNotFoundError if either file is missing.
+        The compiled schema is cached per XSD file until the file changes.
         """
         if not os.path.exists(xml_file):
             raise FileNotFoundError(f"XML file not found: {xml_file}")
         if not os.path.exists(xsd_file):
             raise FileNotFoundError(f"XSD schema file not found: {xsd_file}")
 
+        schema, lock = XMLUtils._compiled_schema(xsd_file)
         xml_doc = etree.parse(xml_file)
-        xsd_doc = etree.parse(xsd_file)
-        schema = etree.XMLSchema(xsd_doc)
-
-        return schema.validate(xml_doc)
+        with lock:
+            return schema.validate(xml_doc)
 
     @staticmethod
     def xpath_query(file_path, xpath_expression):
         """
-        Execute an XPath query on an XML file using xml.etree.ElementTree.
-        Returns a list of text content from matching elements.
-        Note: ElementTree supports only a subset of XPath (e.g., no full XPath 1.0).
-        For advanced XPath, consider using lxml.
+        Execute an XPath query on an XML file using lxml (full XPath 1.0), relative to the root element.
+        Returns a list of text content from matching elements (string results are returned as-is).
+        Compiled expressions are cached, so repeating a query only pays for parsing the file.
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"XML file not found: {file_path}")
 
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        root = etree.parse(file_path).getroot()
+
+        matches = XMLUtils._compiled_xpath(xpath_expression)(root)
+        if not isinstance(matches, list):
+            matches = [matches]  # count(), string(), boolean() ... return a single value
 
         results = []
-        # ElementTree's findall supports limited XPath
-        for elem in root.findall(xpath_expression):
-            results.append(elem.text if elem.text is not None else '')
+        for match in matches:
+            if isinstance(match, etree._Element):
+                results.append(match.text if match.text is not None else '')
+            else:
+                results.append(str(match))
+
+        return results
 
-        return results
\ No newline at end of file
+    @staticmethod
+    def _compiled_xpath(xpath_expression):
+        cache = getattr(XMLUtils._xpath_local, 'cache', None)
+        if cache is None:
+            cache = XMLUtils._xpath_local.cache = {}
+        compiled = cache.get(xpath_expression)
+        if compiled is None:
+            compiled = cache[xpath_expression] = etree.XPath(xpath_expression)
+        return compiled
+
+    @staticmethod
+    def _compiled_schema(xsd_file):
+        key = os.path.abspath(xsd_file)
+        mtime = os.path.getmtime(xsd_file)
+        with XMLUtils._schema_lock:
+            cached = XMLUtils._schema_cache.get(key)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, etree.XMLSchema(etree.parse(xsd_file)), threading.Lock())
+                XMLUtils._schema_cache[key] = cached
+        return cached[1], cached[2]